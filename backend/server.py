@@ -1,12 +1,104 @@
 # backend/server.py
-from fastapi import FastAPI, HTTPException
+import asyncio
+import json
+import logging
+import os
+import time
+from contextlib import asynccontextmanager
+from functools import partial
+from typing import Any
+
+from fastapi import FastAPI, HTTPException, WebSocket, WebSocketDisconnect
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse, Response
 import uvicorn
 
 from tic_tac_toe.game.game_service import GameService
+from tic_tac_toe.game.move_pool import DEFAULT_MAX_QUEUE, DEFAULT_WORKERS, ComputerMovePool, MovePoolBusy
+from tic_tac_toe.game.session_store import MAX_SESSIONS, SESSION_TTL_SECONDS, SessionConflict, create_session_store
+from tic_tac_toe.logic.models import GameState
+
+logger = logging.getLogger("uvicorn.error")
+
+# Deployment name reported by /health
+ENVIRONMENT = os.environ.get("ENVIRONMENT", "development")
+# Comma-separated player types to load at startup; all available types when unset
+WARMUP_PLAYER_TYPES = (
+    [name.strip() for name in os.environ["WARMUP_PLAYER_TYPES"].split(",") if name.strip()]
+    if "WARMUP_PLAYER_TYPES" in os.environ else None
+)
+
+# Computer moves run in a "thread" or "process" pool of MOVE_POOL_WORKERS workers
+MOVE_POOL_KIND = os.environ.get("MOVE_POOL_KIND", "thread")
+MOVE_POOL_WORKERS = int(os.environ.get("MOVE_POOL_WORKERS", DEFAULT_WORKERS))
+# Moves that may wait per player type before new ones are rejected with 503
+MOVE_POOL_MAX_QUEUE = int(os.environ.get("MOVE_POOL_MAX_QUEUE", DEFAULT_MAX_QUEUE))
+# Concurrent moves per player type, e.g. "alphazero=2,minimax=4"; unlisted types may use every worker
+MOVE_POOL_LIMITS = {
+    player_type.strip(): int(limit)
+    for player_type, _, limit in (
+        entry.partition("=") for entry in os.environ.get("MOVE_POOL_LIMITS", "").split(",") if entry.strip()
+    )
+}
+
+# Longest pause (seconds) a WebSocket game may ask for between computer moves
+MAX_MOVE_DELAY = 5.0
+# Most items accepted by one /game_moves request
+MAX_BATCH_MOVES = int(os.environ.get("MAX_BATCH_MOVES", 1000))
+
+# SQLite file that keeps games stored by game_id across restarts; kept in memory only when unset
+SESSION_DB = os.environ.get("SESSION_DB")
+# Most games kept in memory, and how long an unused game is kept
+MAX_SESSIONS = int(os.environ.get("MAX_SESSIONS", MAX_SESSIONS))
+SESSION_TTL_SECONDS = float(os.environ.get("SESSION_TTL_SECONDS", SESSION_TTL_SECONDS))
+
+# Initialize game service
+game_service = GameService(create_session_store(SESSION_DB, MAX_SESSIONS, SESSION_TTL_SECONDS))
+
+# Process workers have their own engines, so each one warms up the configured types itself
+move_pool = ComputerMovePool(
+    MOVE_POOL_WORKERS,
+    MOVE_POOL_KIND,
+    MOVE_POOL_LIMITS,
+    MOVE_POOL_MAX_QUEUE,
+    initializer=partial(game_service.warm_up, WARMUP_PLAYER_TYPES) if MOVE_POOL_KIND == "process" else None,
+)
+
+# Progress of the startup warm-up, reported by /health
+warmup = {"status": "starting", "started_at": time.time(), "seconds": None, "engines": {}, "error": None}
+
+
+async def warm_up_engines() -> None:
+    """Load the configured engines in a worker thread, so /health keeps answering meanwhile."""
+    started = time.perf_counter()
+    try:
+        engines = await asyncio.to_thread(game_service.warm_up, WARMUP_PLAYER_TYPES)
+    except Exception as e:
+        # keep serving (engines then load on first use) instead of reporting "starting" forever
+        warmup["error"] = str(e)
+        warmup["status"] = "degraded"
+        return
+    finally:
+        warmup["seconds"] = round(time.perf_counter() - started, 4)
+    warmup["engines"] = engines
+    failed = any(engine["status"] != "ready" for engine in engines.values())
+    warmup["status"] = "degraded" if failed else "ready"
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Start warming up the engines when the server starts."""
+    # /health reports this startup's warm-up, not one of an earlier run of the app in this process
+    warmup.update(status="starting", started_at=time.time(), seconds=None, engines={}, error=None)
+    task = asyncio.create_task(warm_up_engines())
+    yield
+    task.cancel()
+    move_pool.shutdown()
+    game_service.session_store.close()
+
 
 # Initialize FastAPI app
-app = FastAPI()
+app = FastAPI(lifespan=lifespan)
 
 # Configure CORS
 origins = [
@@ -23,95 +115,430 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-# Initialize game service
-game_service = GameService()
-
 # All conversion and game logic functions have been moved to GameService
 
+def with_game_id(body: bytes, game_id: str | None) -> bytes:
+    """Add "game_id" to a JSON object body, if there is one."""
+    if game_id is None:
+        return body
+    return b'{"game_id":' + json.dumps(game_id).encode() + b"," + body[1:]
+
+
+def json_response(body: bytes, game_id: str | None = None) -> Response:
+    """Send a JSON body serialized (and cached per position) by the game service as is."""
+    return Response(content=with_game_id(body, game_id), media_type="application/json")
+
+
 @app.post("/game_state", tags=["game"])
 async def get_game_state(request: dict | None = None):
-    """Returns the current game state. If no encoded_state provided, returns initial state."""
+    """
+    Returns the current game state. If no encoded_state or game_id provided, returns initial state.
+    An initial state can be requested on a larger board with "size" (3 to 15) and "win_length".
+    With "session": true the game is stored server-side and the response has its "game_id",
+    which later requests can send instead of the encoded_state.
+    """
     try:
-        if request and "encoded_state" in request:
+        request = request or {}
+        game_id = request.get("game_id")
+        if game_id:
+            # Look up the stored game
+            game_state = game_service.load_game(game_id)
+        elif "encoded_state" in request:
             # Decode the provided game state
             game_state = game_service.decode_game_state(request["encoded_state"])
         else:
             # Return initial game state
-            game_state = game_service.create_initial_game_state()
+            game_state = game_service.create_initial_game_state(
+                request.get("size", 3), request.get("win_length"))
         
-        return {
-            "game_state": game_service.get_game_state_dict(game_state),
-            "encoded_state": game_service.encode_game_state(game_state)
-        }
+        if not game_id and request.get("session"):
+            game_id = game_service.create_game(game_state)
+        return json_response(game_service.get_response_json(game_state), game_id)
     except Exception as e:
         raise HTTPException(status_code=400, detail=str(e))
 
+def is_optional_string(value: Any) -> bool:
+    return value is None or isinstance(value, str)
+
+
+def parse_move_request(request: dict) -> tuple[GameState, int | None, str | None, str | None]:
+    """
+    Decode a /game_move request into the current state and either the index of a human move,
+    or the computer player type and difficulty to move with (the index is then None).
+    """
+    if not isinstance(request, dict):
+        raise ValueError("A move request must be a JSON object")
+    
+    # Extract move, game state, and player types from request
+    move = request.get("move", {})
+    encoded_state = request.get("encoded_state")
+    game_id = request.get("game_id")
+    player_types = request.get("player_types", {})
+    if not isinstance(move, dict) or not isinstance(player_types, dict):
+        raise ValueError("move and player_types must be JSON objects")
+    if not is_optional_string(encoded_state) or not is_optional_string(game_id):
+        raise ValueError("encoded_state and game_id must be strings")
+    
+    if not encoded_state and not game_id:
+        raise ValueError("No game state provided")
+    
+    # Look up the stored game, or decode the current game state
+    current_state = game_service.load_game(game_id) if game_id else game_service.decode_game_state(encoded_state)
+    if move and "index" in move:
+        # rejected here, so a bad index is not taken for a computer move
+        move_index = move["index"]
+        if not isinstance(move_index, int) or isinstance(move_index, bool):
+            raise ValueError("Move index must be an integer")
+        return current_state, move_index, None, None
+    
+    # Computer move - determine which player should move
+    current_player = current_state.current_mark.value
+    if current_player == "X":
+        player_type = player_types.get("x_player_type", "human")
+        difficulty = player_types.get("x_difficulty")
+    else:
+        player_type = player_types.get("o_player_type", "human")
+        difficulty = player_types.get("o_difficulty")
+    if not isinstance(player_type, str) or not is_optional_string(difficulty):
+        raise ValueError("Player types and difficulties must be strings")
+    
+    if player_type == "human":
+        raise ValueError("It's a human player's turn, but no move provided")
+    
+    # Checked here too, so unknown types do not get a queue in the pool
+    if not game_service.player_factory.is_computer_player(player_type):
+        raise ValueError(f"Player type '{player_type}' is not a computer player")
+    
+    return current_state, None, player_type, difficulty
+
 @app.post("/game_move", tags=["game"])
 async def handle_game_move(request: dict):
-    """Processes a move and returns the updated game state."""
+    """
+    Processes a move and returns the updated game state.
+    A computer player's strength can be set with "x_difficulty"/"o_difficulty" in player_types
+    (see /player_types for the available difficulties).
+    A stored game is moved in by sending its "game_id" instead of the encoded_state; a move
+    made in a turn that another request has already played is rejected with 409.
+    """
     try:
-        # Extract move, game state, and player types from request
-        move = request.get("move", {})
-        encoded_state = request.get("encoded_state")
-        player_types = request.get("player_types", {})
-        
-        if not encoded_state:
-            raise ValueError("No game state provided")
-        
-        # Decode the current game state
-        current_state = game_service.decode_game_state(encoded_state)
+        current_state, move_index, player_type, difficulty = parse_move_request(request)
         
         # Process the move
-        if move and "index" in move:
+        if move_index is not None:
             # Human move
-            updated_state = game_service.make_move(current_state, move["index"])
+            updated_state = game_service.make_move(current_state, move_index)
         else:
-            # Computer move - determine which player should move
-            current_player = current_state.current_mark.value
-            if current_player == "X":
-                player_type = player_types.get("x_player_type", "human")
-            else:
-                player_type = player_types.get("o_player_type", "human")
-            
-            if player_type == "human":
-                raise ValueError("It's a human player's turn, but no move provided")
-            
-            # Make computer move
-            updated_state = game_service.make_computer_move(current_state, player_type)
+            # Make computer move in the worker pool, so the event loop keeps serving other requests
+            updated_state, simulations = await move_pool.run(
+                player_type, game_service.search_computer_move, current_state, player_type, difficulty)
+            game_service.record_search(player_type, simulations)
         
-        return {
-            "game_state": game_service.get_game_state_dict(updated_state),
-            "encoded_state": game_service.encode_game_state(updated_state)
-        }
+        game_id = request.get("game_id")
+        if game_id:
+            game_service.save_game(game_id, updated_state, expected=current_state)
+        return json_response(game_service.get_response_json(updated_state), game_id)
+    except SessionConflict as e:
+        raise HTTPException(status_code=409, detail=str(e))
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
+    except MovePoolBusy as e:
+        raise HTTPException(status_code=503, detail=str(e), headers={"Retry-After": "1"})
+
+
+@app.post("/game_moves", tags=["game"])
+async def handle_game_moves(request: list[Any]):
+    """
+    Processes a batch of /game_move requests (by encoded_state or game_id) and returns
+    {"results": [...]} in request order, each the /game_move response of its item or {"error": message}.
+    Computer moves are grouped by player type and difficulty, and each group is moved in one
+    go, so the players share their searches (transposition table, batched AlphaZero inference).
+    """
+    if len(request) > MAX_BATCH_MOVES:
+        raise HTTPException(status_code=400, detail=f"At most {MAX_BATCH_MOVES} moves per batch")
+    
+    results: list[GameState | Exception | None] = [None] * len(request)
+    groups: dict[tuple[str, str | None], list[tuple[int, GameState]]] = {}
+    current_states: dict[int, GameState] = {}
+    for index, item in enumerate(request):
+        try:
+            current_state, move_index, player_type, difficulty = parse_move_request(item)
+            current_states[index] = current_state
+            if move_index is not None:
+                results[index] = game_service.make_move(current_state, move_index)
+            else:
+                groups.setdefault((player_type, difficulty), []).append((index, current_state))
+        except ValueError as e:
+            results[index] = e
+    
+    async def move_group(player_type: str, difficulty: str | None, items: list[tuple[int, GameState]]):
+        indices, states = zip(*items)
+        try:
+            updated_states = await move_pool.run(
+                player_type, game_service.make_computer_moves, list(states), player_type, difficulty)
+        except (ValueError, MovePoolBusy) as e:
+            updated_states = [e] * len(indices)
+        except Exception as e:
+            # a broken player fails its own items only, the rest of the batch is still answered
+            logger.exception(f"Batch of {len(indices)} '{player_type}' moves failed")
+            updated_states = [RuntimeError(f"Computer player '{player_type}' failed: {e}")] * len(indices)
+        for index, updated_state in zip(indices, updated_states):
+            results[index] = updated_state
+    
+    await asyncio.gather(*(
+        move_group(player_type, difficulty, items) for (player_type, difficulty), items in groups.items()
+    ))
+    
+    # store the games moved by game_id; two items moving the same game conflict like two requests
+    game_ids = [item.get("game_id") if isinstance(item, dict) else None for item in request]
+    for index, game_id in enumerate(game_ids):
+        if game_id and isinstance(results[index], GameState):
+            try:
+                game_service.save_game(game_id, results[index], expected=current_states[index])
+            except ValueError as e:
+                results[index] = e
+    bodies = [
+        json.dumps({"error": str(result)}, separators=(",", ":")).encode() if isinstance(result, Exception)
+        else with_game_id(game_service.get_response_json(result), game_id)
+        for result, game_id in zip(results, game_ids)
+    ]
+    return json_response(b'{"results":[' + b",".join(bodies) + b"]}")
+
+
+def is_number(value: Any) -> bool:
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+def log_task_failure(task: asyncio.Task) -> None:
+    """Log the exception a background task ended with, which would otherwise go unnoticed."""
+    if not task.cancelled() and task.exception() is not None:
+        logger.error("Background task failed", exc_info=task.exception())
+
+
+class GameSession:
+    """
+    A game played over a WebSocket: the state is kept here instead of being sent back and
+    forth, and computer moves are pushed as soon as they are made, one after the other in
+    AI-vs-AI games. A new game cancels the computer moves still pending for the last one.
+    """
+
+    def __init__(self, websocket: WebSocket):
+        self.websocket = websocket
+        self.game_state: GameState | None = None
+        self.game_id: str | None = None
+        self.player_types: dict = {}
+        self.move_delay = 0.0
+        self._computer_moves: asyncio.Task | None = None
+
+    async def handle(self, message: dict) -> None:
+        try:
+            message_type = message.get("type")
+            if message_type == "new_game":
+                await self.new_game(message)
+            elif message_type == "move":
+                await self.human_move(message.get("index"))
+            else:
+                raise ValueError(f"Unknown message type: {message_type}")
+        except ValueError as e:
+            await self.send_error(e)
+
+    async def new_game(self, message: dict) -> None:
+        player_types = message.get("player_types", {})
+        if not isinstance(player_types, dict):
+            raise ValueError("player_types must be a JSON object")
+        for mark in ("x", "o"):
+            player_type = player_types.get(f"{mark}_player_type", "human")
+            if not isinstance(player_type, str) or not is_optional_string(player_types.get(f"{mark}_difficulty")):
+                raise ValueError("Player types and difficulties must be strings")
+            if player_type != "human" and not game_service.player_factory.is_computer_player(player_type):
+                raise ValueError(f"Player type '{player_type}' is not a computer player")
+        move_delay = message.get("move_delay")
+        if move_delay is None:
+            move_delay = 0
+        if not is_number(move_delay) or not 0 <= move_delay <= MAX_MOVE_DELAY:
+            raise ValueError(f"move_delay must be a number from 0 to {MAX_MOVE_DELAY} seconds")
+        game_id = message.get("game_id")
+        if not is_optional_string(message.get("encoded_state")) or not is_optional_string(game_id):
+            raise ValueError("encoded_state and game_id must be strings")
+        if game_id:
+            game_state = game_service.load_game(game_id)
+        elif message.get("encoded_state"):
+            game_state = game_service.decode_game_state(message["encoded_state"])
+        else:
+            game_state = game_service.create_initial_game_state(message.get("size", 3), message.get("win_length"))
+        if not game_id and message.get("session"):
+            game_id = game_service.create_game(game_state)
+
+        self.stop()
+        self.game_state, self.game_id = game_state, game_id
+        self.player_types, self.move_delay = player_types, move_delay
+        await self.send_state()
+        self._start_computer_moves()
+
+    async def human_move(self, index: int | None) -> None:
+        if self.game_state is None:
+            raise ValueError("No game in progress, send new_game first")
+        if index is None:
+            raise ValueError("No move index provided")
+        if not isinstance(index, int) or isinstance(index, bool):
+            raise ValueError("Move index must be an integer")
+        if self._current_player()[0] != "human":
+            raise ValueError("It's the computer's turn")
+        self.set_state(game_service.make_move(self.game_state, index))
+        await self.send_state()
+        self._start_computer_moves()
+
+    def _current_player(self) -> tuple[str, str | None]:
+        mark = self.game_state.current_mark.value.lower()
+        return (
+            self.player_types.get(f"{mark}_player_type", "human"),
+            self.player_types.get(f"{mark}_difficulty"),
+        )
+
+    def _start_computer_moves(self) -> None:
+        if not self.game_state.game_over and self._current_player()[0] != "human":
+            self._computer_moves = asyncio.create_task(self._play_computer_moves())
+            self._computer_moves.add_done_callback(log_task_failure)
+
+    async def _play_computer_moves(self) -> None:
+        """Make and send the computer moves, until a human's turn or the end of the game."""
+        try:
+            while not self.game_state.game_over:
+                player_type, difficulty = self._current_player()
+                if player_type == "human":
+                    break
+                if self.move_delay:
+                    await asyncio.sleep(self.move_delay)
+                try:
+                    updated_state, simulations = await move_pool.run(
+                        player_type, game_service.search_computer_move, self.game_state, player_type, difficulty)
+                except (ValueError, MovePoolBusy) as e:
+                    await self.send_error(e)
+                    return
+                except Exception as e:
+                    # nobody awaits this task, so the client is told instead of waiting for a move forever
+                    logger.exception(f"'{player_type}' move of a WebSocket game failed")
+                    await self.send_error(RuntimeError(f"Computer player '{player_type}' failed: {e}"))
+                    return
+                game_service.record_search(player_type, simulations)
+                self.set_state(updated_state)
+                await self.send_state()
+        except (WebSocketDisconnect, RuntimeError):
+            # the client left while the move was made: there is no one to send it to
+            pass
+
+    def set_state(self, game_state: GameState) -> None:
+        if self.game_id is not None:
+            game_service.save_game(self.game_id, game_state)
+        self.game_state = game_state
+
+    def stop(self) -> None:
+        if self._computer_moves is not None:
+            self._computer_moves.cancel()
+            self._computer_moves = None
+
+    async def send_state(self) -> None:
+        # the cached /game_move response body, with the message type prepended
+        body = with_game_id(game_service.get_response_json(self.game_state), self.game_id)
+        await self.websocket.send_text('{"type":"state",' + body[1:].decode())
+
+    async def send_error(self, error: Exception) -> None:
+        await self.websocket.send_json({"type": "error", "detail": str(error)})
+
+
+@app.websocket("/ws/game")
+async def game_websocket(websocket: WebSocket):
+    """
+    Plays games over one connection. Send {"type": "new_game"} with the /game_move
+    "player_types" and optionally "size"/"win_length", an "encoded_state" or a "game_id" to
+    resume ("session": true stores a new game under a game_id), and a "move_delay" in
+    seconds to pace computer moves; then {"type": "move", "index": n} for
+    human moves. Every new state is sent as {"type": "state", "game_state": ...,
+    "encoded_state": ...}, and failures as {"type": "error", "detail": ...}.
+    """
+    await websocket.accept()
+    session = GameSession(websocket)
+    try:
+        while True:
+            try:
+                message = json.loads(await websocket.receive_text())
+            except json.JSONDecodeError:
+                message = None
+            if not isinstance(message, dict):
+                await session.send_error(ValueError("Messages must be JSON objects"))
+                continue
+            await session.handle(message)
+    except WebSocketDisconnect:
+        pass
+    finally:
+        session.stop()
 
 
 @app.post("/reset_game", tags=["game"])
-async def reset_game():
-    """Returns a fresh initial game state."""
-    initial_state = game_service.create_initial_game_state()
-    return {
-        "game_state": game_service.get_game_state_dict(initial_state),
-        "encoded_state": game_service.encode_game_state(initial_state)
-    }
+async def reset_game(request: dict | None = None):
+    """
+    Returns a fresh initial game state, optionally with a board "size" and "win_length".
+    A stored game is restarted by sending its "game_id"; "session": true stores a new one.
+    """
+    request = request or {}
+    game_id = request.get("game_id")
+    try:
+        if not is_optional_string(game_id):
+            raise ValueError("game_id must be a string")
+        initial_state = game_service.create_initial_game_state(
+            request.get("size", 3), request.get("win_length"))
+        if game_id:
+            game_service.load_game(game_id)
+            game_service.save_game(game_id, initial_state)
+        elif request.get("session"):
+            game_id = game_service.create_game(initial_state)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return json_response(game_service.get_response_json(initial_state), game_id)
 
 @app.get("/player_types", tags=["game"])
 async def get_player_types():
-    """Returns available player types."""
+    """Returns available player types and difficulties."""
     return {
-        "player_types": game_service.get_available_player_types()
+        "player_types": game_service.get_available_player_types(),
+        "difficulties": game_service.get_difficulties()
     }
 
 # Health check endpoint
 @app.get("/health")
 async def health_check():
-    """Health check endpoint for load balancers."""
+    """
+    Health check endpoint for load balancers.
+
+    Answers 503 with status "starting" until the startup warm-up has loaded the engines,
+    then 200 with status "ready", or "degraded" if some engine failed to load (those player
+    types fail on use, the others are served). Each engine reports its load time in seconds.
+    If the warm-up itself failed, the status is "degraded" with its "error".
+    """
+    return JSONResponse(
+        status_code=503 if warmup["status"] == "starting" else 200,
+        content={
+            "status": warmup["status"],
+            "environment": ENVIRONMENT,
+            "uptime_seconds": round(time.time() - warmup["started_at"], 1),
+            "warmup_seconds": warmup["seconds"],
+            "engines": warmup["engines"],
+            "error": warmup["error"],
+            "message": "Tic-Tac-Toe API is running!"
+        },
+    )
+
+@app.get("/metrics")
+async def metrics():
+    """
+    Queue depth, running moves and move timings of the computer move pool per player type,
+    the simulations run by the AlphaZero players' searches, the size and hit rate of the cached
+    game state responses, and the session store's size, hit rate and (with SQLite) write latency.
+    """
     return {
-        "status": "healthy",
-        "environment": "TODO",
-        "security_enabled": "TODO",
-        "message": "Tic-Tac-Toe API is running!"
+        "move_pool": move_pool.stats(),
+        "searches": game_service.get_search_stats(),
+        "response_cache": game_service.get_response_cache_stats(),
+        "sessions": game_service.get_session_stats(),
     }
 
 # Entry point for running with uvicorn
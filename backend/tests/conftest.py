@@ -0,0 +1,22 @@
+import os
+import sys
+
+import pytest
+from fastapi.testclient import TestClient
+
+# server.py is run as a script from backend/, not installed
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import server  # noqa: E402
+from tic_tac_toe.api.serializers import GameStateSerializer  # noqa: E402
+from tic_tac_toe.logic.models import GameState, Grid  # noqa: E402
+
+
+@pytest.fixture(scope="module")
+def client():
+    with TestClient(server.app, raise_server_exceptions=False) as client:
+        yield client
+
+
+def encoded(cells: str) -> str:
+    return GameStateSerializer.encode(GameState(Grid(cells)))
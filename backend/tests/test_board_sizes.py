@@ -0,0 +1,13 @@
+import pytest
+
+
+@pytest.mark.parametrize("size, win_length", [(2, None), (16, None), ("4", None), (4, 5)])
+def test_bad_board_sizes_are_rejected(client, size, win_length):
+    response = client.post("/reset_game", json={"size": size, "win_length": win_length})
+    assert response.status_code == 400
+    assert "must be an integer" in response.json()["detail"]
+
+
+def test_larger_boards(client):
+    body = client.post("/reset_game", json={"size": 5, "win_length": 4}).json()
+    assert (body["game_state"]["size"], body["game_state"]["win_length"]) == (5, 4)
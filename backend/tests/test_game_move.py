@@ -0,0 +1,56 @@
+import pytest
+
+import server
+from conftest import encoded
+from tic_tac_toe.game.players import RandomComputerPlayer
+
+
+def test_human_and_computer_moves(client):
+    state = client.post("/game_state").json()
+    assert state["game_state"]["board"] == [""] * 9
+    response = client.post("/game_move", json={"encoded_state": state["encoded_state"], "move": {"index": 4}})
+    assert response.status_code == 200
+    moved = response.json()
+    assert moved["game_state"]["board"][4] == "X"
+    response = client.post(
+        "/game_move",
+        json={"encoded_state": moved["encoded_state"], "player_types": {"o_player_type": "solved"}},
+    )
+    assert response.status_code == 200
+    assert response.json()["game_state"]["board"].count("O") == 1
+    assert client.get("/metrics").json()["move_pool"]["player_types"]["solved"]["completed"] >= 1
+
+
+@pytest.mark.parametrize("move", [{"index": None}, {"index": "4"}, {"index": True}, {"index": 9}])
+def test_bad_move_indices_are_rejected(client, move):
+    response = client.post("/game_move", json={"encoded_state": encoded(" " * 9), "move": move})
+    assert response.status_code == 400
+
+
+@pytest.mark.parametrize("request_body", [
+    {},
+    {"encoded_state": {}},
+    {"encoded_state": encoded(" " * 9), "player_types": []},
+    {"encoded_state": encoded(" " * 9), "player_types": {"x_player_type": "nope"}},
+    {"encoded_state": encoded(" " * 9), "player_types": {"x_player_type": "random", "x_difficulty": 1}},
+])
+def test_malformed_move_requests_are_rejected(client, request_body):
+    assert client.post("/game_move", json=request_body).status_code == 400
+
+
+class CountingPlayer(RandomComputerPlayer):
+    """Reports a search of 7 simulations for every move, like the AlphaZero players."""
+
+    def get_computer_move(self, game_state):
+        self.last_simulations = 7
+        return super().get_computer_move(game_state)
+
+
+def test_search_simulations_are_reported_in_the_metrics(client, monkeypatch):
+    monkeypatch.setitem(server.game_service.player_factory._player_types, "counting", CountingPlayer)
+    monkeypatch.setattr(server.game_service, "search_stats", {})
+    response = client.post(
+        "/game_move", json={"encoded_state": encoded(" " * 9), "player_types": {"x_player_type": "counting"}})
+    assert response.status_code == 200
+    searches = client.get("/metrics").json()["searches"]
+    assert searches == {"counting": {"moves": 1, "simulations": 7, "last_simulations": 7, "mean_simulations": 7.0}}
@@ -0,0 +1,47 @@
+import server
+from conftest import encoded
+from tic_tac_toe.game.players import RandomComputerPlayer
+
+
+def test_batch_moves_return_per_item_results(client):
+    response = client.post("/game_moves", json=[
+        {"encoded_state": encoded(" " * 9), "move": {"index": 0}},
+        "not an object",
+        {"encoded_state": encoded("XX OO    "), "player_types": {"x_player_type": "solved"}},
+        {"encoded_state": encoded(" " * 9), "move": {"index": None}},
+        {"encoded_state": encoded("XXXOO    "), "player_types": {"o_player_type": "random"}},
+        {"encoded_state": encoded(" " * 9), "player_types": {"x_player_type": "minimax"}},
+    ])
+    assert response.status_code == 200
+    results = response.json()["results"]
+    assert len(results) == 6
+    assert results[0]["game_state"]["board"][0] == "X"
+    assert "error" in results[1]
+    assert results[2]["game_state"]["status"] == "finished"
+    assert "error" in results[3]
+    assert "error" in results[4]
+    assert results[5]["game_state"]["board"].count("X") == 1
+
+
+def test_batch_size_is_limited(client, monkeypatch):
+    monkeypatch.setattr(server, "MAX_BATCH_MOVES", 2)
+    response = client.post("/game_moves", json=[{"encoded_state": encoded(" " * 9), "move": {"index": 0}}] * 3)
+    assert response.status_code == 400
+
+
+class BrokenPlayer(RandomComputerPlayer):
+    def get_computer_move(self, game_state):
+        raise RuntimeError("engine crashed")
+
+
+def test_a_failing_player_only_fails_its_own_items(client, monkeypatch):
+    monkeypatch.setitem(server.game_service.player_factory._player_types, "broken", BrokenPlayer)
+    response = client.post("/game_moves", json=[
+        {"encoded_state": encoded(" " * 9), "player_types": {"x_player_type": "broken"}},
+        {"encoded_state": encoded(" " * 9), "player_types": {"x_player_type": "solved"}},
+        {"encoded_state": encoded("X        "), "player_types": {"o_player_type": "broken"}},
+    ])
+    assert response.status_code == 200
+    broken, solved, broken_again = response.json()["results"]
+    assert "engine crashed" in broken["error"] and "engine crashed" in broken_again["error"]
+    assert solved["game_state"]["board"].count("X") == 1
@@ -0,0 +1,32 @@
+import asyncio
+import time
+
+import server
+
+TIMEOUT_SECONDS = 30
+
+
+def test_health_reports_ready_after_warm_up(client):
+    deadline = time.monotonic() + TIMEOUT_SECONDS
+    while (response := client.get("/health")).json()["status"] == "starting":
+        assert response.status_code == 503
+        assert time.monotonic() < deadline
+        time.sleep(0.05)
+    body = response.json()
+    assert response.status_code == 200
+    assert body["status"] in ("ready", "degraded")
+    assert body["error"] is None
+    for player_type in ("api_responses", "random", "minimax", "solved"):
+        assert body["engines"][player_type]["status"] == "ready"
+
+
+def test_a_failed_warm_up_is_reported_as_degraded(monkeypatch):
+    def fail(player_types):
+        raise RuntimeError("out of memory")
+
+    monkeypatch.setattr(server, "warmup", {"status": "starting", "seconds": None, "engines": {}, "error": None})
+    monkeypatch.setattr(server.game_service, "warm_up", fail)
+    asyncio.run(server.warm_up_engines())
+    assert server.warmup["status"] == "degraded"
+    assert server.warmup["error"] == "out of memory"
+    assert server.warmup["seconds"] is not None
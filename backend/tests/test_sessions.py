@@ -0,0 +1,27 @@
+import pytest
+
+
+def test_stored_games(client):
+    game_id = client.post("/game_state", json={"session": True}).json()["game_id"]
+    response = client.post("/game_move", json={"game_id": game_id, "move": {"index": 4}})
+    assert response.status_code == 200
+    assert response.json()["game_id"] == game_id
+    assert client.post("/game_state", json={"game_id": game_id}).json()["game_state"]["board"][4] == "X"
+    # two moves for the same turn: the second conflicts
+    response = client.post("/game_moves", json=[
+        {"game_id": game_id, "move": {"index": 0}},
+        {"game_id": game_id, "move": {"index": 8}},
+    ])
+    first, second = response.json()["results"]
+    assert first["game_state"]["board"][0] == "O"
+    assert "changed by another request" in second["error"]
+    assert client.post("/game_move", json={"game_id": "nope", "move": {"index": 0}}).status_code == 400
+    reset = client.post("/reset_game", json={"game_id": game_id}).json()
+    assert reset["game_id"] == game_id and reset["game_state"]["board"] == [""] * 9
+
+
+@pytest.mark.parametrize("game_id", [["x"], {}, 1])
+def test_reset_game_rejects_a_game_id_that_is_not_a_string(client, game_id):
+    response = client.post("/reset_game", json={"game_id": game_id})
+    assert response.status_code == 400
+    assert response.json()["detail"] == "game_id must be a string"
@@ -0,0 +1,99 @@
+import asyncio
+
+import pytest
+from fastapi import WebSocketDisconnect
+
+import server
+from tic_tac_toe.game.players import RandomComputerPlayer
+
+
+def receive_state(websocket) -> dict:
+    message = websocket.receive_json()
+    assert message["type"] == "state", message
+    return message
+
+
+def test_websocket_game_against_the_computer(client):
+    with client.websocket_connect("/ws/game") as websocket:
+        websocket.send_json({"type": "new_game", "player_types": {"o_player_type": "solved"}, "session": True})
+        state = receive_state(websocket)
+        game_id = state["game_id"]
+        websocket.send_json({"type": "move", "index": 4})
+        assert receive_state(websocket)["game_state"]["board"][4] == "X"
+        reply = receive_state(websocket)
+        assert reply["game_state"]["board"].count("O") == 1
+        assert reply["game_id"] == game_id
+    assert client.post("/game_state", json={"game_id": game_id}).json()["encoded_state"] == reply["encoded_state"]
+
+
+def test_websocket_computer_games_play_to_the_end(client):
+    with client.websocket_connect("/ws/game") as websocket:
+        websocket.send_json({
+            "type": "new_game",
+            "player_types": {"x_player_type": "solved", "o_player_type": "solved"},
+        })
+        states = [receive_state(websocket) for _ in range(10)]
+    assert states[-1]["game_state"]["status"] == "finished"
+    assert states[-1]["game_state"]["message"] == "It's a draw!"
+
+
+@pytest.mark.parametrize("message", [
+    "not json",
+    "[]",
+    '{"type": "dance"}',
+    '{"type": "move", "index": 4}',
+    '{"type": "new_game", "player_types": []}',
+    '{"type": "new_game", "move_delay": "1"}',
+    '{"type": "new_game", "move_delay": 60}',
+    '{"type": "new_game", "game_id": {}}',
+    '{"type": "new_game", "size": 2}',
+])
+def test_bad_websocket_messages_are_answered_with_errors(client, message):
+    with client.websocket_connect("/ws/game") as websocket:
+        websocket.send_text(message)
+        assert websocket.receive_json()["type"] == "error"
+        # the connection stays usable
+        websocket.send_json({"type": "new_game"})
+        state = receive_state(websocket)
+        for index in (None, "4", 9):
+            websocket.send_json({"type": "move", "index": index})
+            assert websocket.receive_json()["type"] == "error"
+        websocket.send_json({"type": "move", "index": 4})
+        assert receive_state(websocket)["encoded_state"] != state["encoded_state"]
+
+
+class BrokenPlayer(RandomComputerPlayer):
+    def get_computer_move(self, game_state):
+        raise RuntimeError("engine crashed")
+
+
+def test_a_failing_computer_player_is_reported_to_the_client(client, monkeypatch):
+    monkeypatch.setitem(server.game_service.player_factory._player_types, "broken", BrokenPlayer)
+    with client.websocket_connect("/ws/game") as websocket:
+        websocket.send_json({"type": "new_game", "player_types": {"x_player_type": "broken"}})
+        receive_state(websocket)
+        message = websocket.receive_json()
+        assert message["type"] == "error" and "engine crashed" in message["detail"]
+
+
+class DisconnectedWebSocket:
+    async def send_text(self, text):
+        raise WebSocketDisconnect(code=1006)
+
+    async def send_json(self, data):
+        raise WebSocketDisconnect(code=1006)
+
+
+def test_computer_moves_stop_quietly_when_the_client_has_left():
+    session = server.GameSession(DisconnectedWebSocket())
+    session.game_state = server.game_service.create_initial_game_state()
+    session.player_types = {"x_player_type": "solved", "o_player_type": "solved"}
+
+    async def play():
+        session._start_computer_moves()
+        await session._computer_moves
+        return session._computer_moves
+
+    task = asyncio.run(play())
+    assert task.exception() is None
+    assert session.game_state.grid.x_count == 1
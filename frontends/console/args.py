@@ -1,28 +1,28 @@
 import argparse
 from typing import NamedTuple
 
-from tic_tac_toe.game.players import (
-    Player,
-    RandomComputerPlayer,
-    MinimaxComputerPlayer,
-)
-from tic_tac_toe.logic.models import Mark
+from tic_tac_toe.game.player_factory import PlayerFactory
+from tic_tac_toe.game.players import Player
+from tic_tac_toe.logic.models import Grid, Mark
 
 from .players import ConsolePlayer
-from tic_tac_toe_ai.models.players import AlphaZeroStatelessComputerPlayer
 
-PLAYER_CLASSES = {
-    "human": ConsolePlayer,
-    "random": RandomComputerPlayer,
-    "minimax": MinimaxComputerPlayer,
-    "alphazero": AlphaZeroStatelessComputerPlayer,
-}
+# computer players come from the factory, which imports them (and e.g. AlphaZero's
+# dependencies) only when they are chosen
+PLAYER_TYPES = ["human", *PlayerFactory.get_available_types()]
+
+
+def create_player(player_type: str, mark: Mark) -> Player:
+    if player_type == "human":
+        return ConsolePlayer(mark)
+    return PlayerFactory.create_player(player_type, mark)
 
 
 class Args(NamedTuple):
     player1: Player
     player2: Player
     starting_mark: Mark
+    grid: Grid
 
 
 def parse_args() -> Args:
@@ -30,13 +30,13 @@ def parse_args() -> Args:
     parser.add_argument(
         "-X",
         dest="player_x",
-        choices=PLAYER_CLASSES.keys(),
+        choices=PLAYER_TYPES,
         default="human",
     )
     parser.add_argument(
         "-O",
         dest="player_o",
-        choices=PLAYER_CLASSES.keys(),
+        choices=PLAYER_TYPES,
         default="minimax",
     )
     parser.add_argument(
@@ -46,12 +46,33 @@ def parse_args() -> Args:
         type=Mark,
         default="X",
     )
+    parser.add_argument(
+        "--size",
+        dest="size",
+        type=int,
+        default=3,
+        help="board size, from 3 (3x3) to 15 (15x15)",
+    )
+    parser.add_argument(
+        "--win-length",
+        dest="win_length",
+        type=int,
+        default=None,
+        help="marks in a row needed to win (default: board size, at most 5)",
+    )
     args = parser.parse_args()
+    try:
+        grid = Grid.empty(args.size, args.win_length)
+    except ValueError as ex:
+        parser.error(str(ex))
 
-    player1 = PLAYER_CLASSES[args.player_x](Mark("X"))
-    player2 = PLAYER_CLASSES[args.player_o](Mark("O"))
+    try:
+        player1 = create_player(args.player_x, Mark("X"))
+        player2 = create_player(args.player_o, Mark("O"))
+    except ValueError as ex:
+        parser.error(str(ex))
 
     if args.starting_mark == "O":
         player1, player2 = player2, player1
 
-    return Args(player1, player2, args.starting_mark)
+    return Args(player1, player2, args.starting_mark, grid)
@@ -5,5 +5,5 @@ from .renderers import ConsoleRenderer
 
 
 def main() -> None:
-    player1, player2, starting_mark = parse_args()
-    TicTacToe(player1, player2, ConsoleRenderer()).play(starting_mark)
+    player1, player2, starting_mark, grid = parse_args()
+    TicTacToe(player1, player2, ConsoleRenderer()).play(starting_mark, grid)
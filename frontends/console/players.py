@@ -9,7 +9,9 @@ class ConsolePlayer(Player):
     def get_move(self, game_state: GameState) -> Move | None:
         while not game_state.game_over:
             try:
-                index = grid_to_index(input(f"{self.mark.value}'s move: ").strip())
+                index = grid_to_index(
+                    input(f"{self.mark.value}'s move: ").strip(), game_state.grid.size
+                )
             except ValueError:
                 print("Please provide coordinates in the form of A1 or 1A")
             else:
@@ -20,11 +22,14 @@ class ConsolePlayer(Player):
         return None
 
 
-def grid_to_index(grid: str) -> int:
-    if re.match(r"[abcABC][123]", grid):
-        col, row = grid
-    elif re.match(r"[123][abcABC]", grid):
-        row, col = grid
+def grid_to_index(grid: str, size: int = 3) -> int:
+    if match := re.fullmatch(r"([a-zA-Z])(\d{1,2})", grid):
+        col, row = match.groups()
+    elif match := re.fullmatch(r"(\d{1,2})([a-zA-Z])", grid):
+        row, col = match.groups()
     else:
         raise ValueError("Invalid grid coordinates")
-    return 3 * (int(row) - 1) + (ord(col.upper()) - ord("A"))
+    row_index, col_index = int(row) - 1, ord(col.upper()) - ord("A")
+    if not (0 <= row_index < size and 0 <= col_index < size):
+        raise ValueError("Invalid grid coordinates")
+    return size * row_index + col_index
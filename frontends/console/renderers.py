@@ -1,4 +1,4 @@
-import textwrap
+import math
 from typing import Iterable
 
 from tic_tac_toe.game.renderers import Renderer
@@ -33,16 +33,16 @@ def print_blinking(cells: Iterable[str], positions: Iterable[int]) -> None:
 
 
 def print_solid(cells: Iterable[str]) -> None:
-    print(
-        textwrap.dedent(
-            """\
-             A   B   C
-           ------------
-        1 ┆  {0} │ {1} │ {2}
-          ┆ ───┼───┼───
-        2 ┆  {3} │ {4} │ {5}
-          ┆ ───┼───┼───
-        3 ┆  {6} │ {7} │ {8}
-    """
-        ).format(*cells)
-    )
+    cells = list(cells)
+    size = math.isqrt(len(cells))
+    margin = " " * len(str(size))
+    lines = [
+        margin + "    " + "   ".join(chr(ord("A") + col) for col in range(size)),
+        margin + "  " + "-" * (4 * size),
+    ]
+    for row in range(size):
+        row_cells = cells[row * size:(row + 1) * size]
+        lines.append(f"{row + 1:>{len(margin)}} ┆  " + " │ ".join(row_cells))
+        if row < size - 1:
+            lines.append(margin + " ┆ " + "┼".join(["───"] * size))
+    print("\n".join(lines) + "\n")
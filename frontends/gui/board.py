@@ -72,7 +72,7 @@ class TicTacToeBoard(tk.Tk):
 
     def _sync_game_state(self, game_state: GameState, gui_move_next: bool):
         # disable inputs while syncing unless it's the GUI's move
-        self._configure_inputs(force_disabled=not gui_move_next)
+        self._configure_inputs(game_state, force_disabled=not gui_move_next)
         if gui_move_next: return  # nothing to sync if we are waiting for a GUI move
 
         # TODO: make this more efficient (unfortunately game_state doesn't tell me the last move)
@@ -97,11 +97,12 @@ class TicTacToeBoard(tk.Tk):
     def _ui_delay(self, func):
         self.after(65, func)
 
-    def _configure_inputs(self, force_disabled: bool):
+    def _configure_inputs(self, game_state: GameState, force_disabled: bool):
         """Update buttons to enable or disable themselves based on state"""
+        playable = game_state.possible_move_indices
         for button, position in self._cells.items():
             row, col = position
-            is_disabled = force_disabled or button["text"] != " "  # TODO or game_state.game_over
+            is_disabled = force_disabled or TicTacToeBoard._position_to_index(position) not in playable
             button.configure(state=tk.DISABLED if is_disabled else tk.NORMAL)
             button.configure(command=None if is_disabled else partial(self._play_gui_move, (row, col)))
             button.update_idletasks()
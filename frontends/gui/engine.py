@@ -25,6 +25,7 @@ class TicTacToeUIEngine:
         "Human": GUIPlayer,
         "Random": "random",
         "Minimax": "minimax", 
+        "Solved": "solved",
         "AlphaZero": "alphazero"
     }
 
@@ -62,7 +63,7 @@ class TicTacToeUIEngine:
             self.player1 = self._new_player(player_x_type, Mark("X"))
             self.player2 = self._new_player(player_o_type, Mark("O"))
             validate_players(self.player1, self.player2)
-            self.game_state = GameState(Grid(), self.player1.mark)
+            self.game_state = GameState.intern(Grid(), self.player1.mark)
             self._state_updated()
         except ValueError as e:
             # Re-raise with context about which player failed
@@ -75,6 +76,8 @@ class TicTacToeUIEngine:
             self._ui_delay(self._next_player_move)
 
     def gui_move_to(self, position):
+        if position not in self.game_state.possible_move_indices:
+            return  # cell taken or game over; ignore the click
         move = self.game_state.make_move_to(position)
         self._play_move(move)
 
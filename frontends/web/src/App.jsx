@@ -2,11 +2,10 @@
 import { useState, useEffect, useCallback, memo } from 'react';
 import './App.css';
 import { useGameLogic } from './hooks/useGameLogic.js';
-import { useComputerMoves } from './hooks/useComputerMoves.js';
 import PlayerSelection from './components/PlayerSelection.jsx';
 import GameBoard from './components/GameBoard.jsx';
 import StatusMessage from './components/StatusMessage.jsx';
-import { PLAYER_TYPES, GAME_STATUS, TIMING } from './constants.js';
+import { PLAYER_TYPES, GAME_STATUS } from './constants.js';
 
 const App = memo(() => {
   const [xPlayerType, setXPlayerType] = useState(PLAYER_TYPES.HUMAN);
@@ -22,7 +21,6 @@ const App = memo(() => {
     setError,
     fetchGameState,
     makeMove,
-    makeComputerMove,
     resetGame,
     isCurrentPlayerHuman
   } = useGameLogic();
@@ -36,7 +34,7 @@ const App = memo(() => {
     }
   }, []);
 
-  const handleMove = useCallback(async (index, shouldStartGame = false, errorMessage = null, playerTypes = null) => {
+  const handleMove = useCallback(async (index, shouldStartGame = false, errorMessage = null) => {
     setShowClickError(false);
     
     if (errorMessage) {
@@ -45,29 +43,23 @@ const App = memo(() => {
     }
 
     if (shouldStartGame) {
-      await resetGame();
-      setTimeout(async () => {
-        await makeMove(index, playerTypes);
-      }, TIMING.GAME_START_DELAY);
-      return;
+      // the server handles messages in order, so the move is made in the new game
+      await resetGame({ x_player_type: xPlayerType, o_player_type: oPlayerType });
     }
 
-    await makeMove(index, playerTypes);
-  }, [makeMove, resetGame]);
+    await makeMove(index);
+  }, [makeMove, resetGame, xPlayerType, oPlayerType]);
 
   const handleResetGame = useCallback(async () => {
-    await resetGame();
+    await resetGame({ x_player_type: xPlayerType, o_player_type: oPlayerType });
     setShowClickError(false);
-  }, [resetGame]);
+  }, [resetGame, xPlayerType, oPlayerType]);
 
   // Initialize game state
   useEffect(() => {
     fetchGameState();
   }, [fetchGameState]);
 
-  // Handle computer moves using custom hook
-  useComputerMoves(gameStarted, gameState, xPlayerType, oPlayerType, makeComputerMove);
-
   if (!gameState) {
     return <div>Loading game...</div>;
   }
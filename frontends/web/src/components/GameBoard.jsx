@@ -12,11 +12,6 @@ const GameBoard = memo(({
   const { status, current_player, winning_cells } = gameState;
 
   const handleMove = useCallback(async (index) => {
-    const playerTypes = {
-      x_player_type: xPlayerType,
-      o_player_type: oPlayerType
-    };
-
     // If game hasn't started yet and the first player is human, start the game first
     if (!gameStarted && xPlayerType === PLAYER_TYPES.HUMAN) {
       await onMove(index, true); // true indicates we need to start the game first
@@ -38,7 +33,7 @@ const GameBoard = memo(({
                                 (current_player === PLAYERS.O && oPlayerType === PLAYER_TYPES.HUMAN);
     
     if (isCurrentPlayerHuman) {
-      await onMove(index, false, null, playerTypes);
+      await onMove(index);
     } else {
       await onMove(index, false, "Click Play to Start!");
     }
@@ -17,6 +17,7 @@ const PlayerSelection = memo(({ xPlayerType, oPlayerType, onPlayerTypeChange, ga
           <option value={PLAYER_TYPES.HUMAN}>Human</option>
           <option value={PLAYER_TYPES.RANDOM}>Random</option>
           <option value={PLAYER_TYPES.MINIMAX}>Minimax</option>
+          <option value={PLAYER_TYPES.SOLVED}>Solved</option>
           <option value={PLAYER_TYPES.ALPHAZERO}>AlphaZero</option>
         </select>
       </div>
@@ -32,6 +33,7 @@ const PlayerSelection = memo(({ xPlayerType, oPlayerType, onPlayerTypeChange, ga
           <option value={PLAYER_TYPES.HUMAN}>Human</option>
           <option value={PLAYER_TYPES.RANDOM}>Random</option>
           <option value={PLAYER_TYPES.MINIMAX}>Minimax</option>
+          <option value={PLAYER_TYPES.SOLVED}>Solved</option>
           <option value={PLAYER_TYPES.ALPHAZERO}>AlphaZero</option>
         </select>
       </div>
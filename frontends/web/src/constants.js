@@ -3,6 +3,7 @@ export const PLAYER_TYPES = {
   HUMAN: 'human',
   RANDOM: 'random',
   MINIMAX: 'minimax',
+  SOLVED: 'solved',
   ALPHAZERO: 'alphazero'
 };
 
@@ -16,17 +17,16 @@ export const PLAYERS = {
   O: 'O'
 };
 
-export const COMPUTER_PLAYER_TYPES = [PLAYER_TYPES.RANDOM, PLAYER_TYPES.MINIMAX, PLAYER_TYPES.ALPHAZERO];
+export const COMPUTER_PLAYER_TYPES = [PLAYER_TYPES.RANDOM, PLAYER_TYPES.MINIMAX, PLAYER_TYPES.SOLVED, PLAYER_TYPES.ALPHAZERO];
 
 export const API_ENDPOINTS = {
   GAME_STATE: '/game_state',
-  GAME_MOVE: '/game_move',
-  RESET_GAME: '/reset_game'
+  GAME_SOCKET: '/ws/game'
 };
 
 export const TIMING = {
   COMPUTER_MOVE_DELAY: 200, // ms
-  GAME_START_DELAY: 100 // ms
+  RECONNECT_DELAY: 1000 // ms
 };
 
 export const BOARD_SIZE = 9; // 3x3 grid
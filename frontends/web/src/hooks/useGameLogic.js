@@ -1,4 +1,4 @@
-import { useState, useCallback } from 'react';
+import { useState, useCallback, useEffect, useRef } from 'react';
 import { apiService } from '../services/api.js';
 import { PLAYER_TYPES, PLAYERS, TIMING } from '../constants.js';
 
@@ -7,6 +7,10 @@ export const useGameLogic = () => {
   const [encodedState, setEncodedState] = useState(null);
   const [error, setError] = useState(null);
   const [gameStarted, setGameStarted] = useState(false);
+  // The game is played over a WebSocket; session holds its game_id and player types,
+  // so a game can be resumed on a new connection if the old one drops
+  const socketRef = useRef(null);
+  const sessionRef = useRef(null);
 
   const updateGameState = useCallback((data) => {
     setGameState(data.game_state);
@@ -23,35 +27,45 @@ export const useGameLogic = () => {
     }
   }, [updateGameState]);
 
-  const makeMove = useCallback(async (index, playerTypes) => {
-    try {
-      const data = await apiService.makeMove(index, encodedState, playerTypes);
-      updateGameState(data);
-      return data.game_state;
-    } catch (e) {
-      setError(e.message);
-      return null;
+  const handleSocketMessage = useCallback((message) => {
+    if (message.type === 'error') {
+      setError(message.detail);
+      return;
     }
-  }, [encodedState, updateGameState, setError]);
-
-  const makeComputerMove = useCallback(async (playerTypes) => {
-    try {
-      const data = await apiService.makeComputerMove(encodedState, playerTypes);
-      updateGameState(data);
-    } catch (e) {
-      setError(e.message);
+    if (message.game_id && sessionRef.current) {
+      sessionRef.current.gameId = message.game_id;
     }
-  }, [encodedState, updateGameState, setError]);
+    updateGameState(message);
+  }, [updateGameState, setError]);
 
-  const resetGame = useCallback(async () => {
-    try {
-      const data = await apiService.resetGame();
-      updateGameState(data);
-      setGameStarted(true);
-    } catch (e) {
-      setError("Failed to start/reset game.");
+  const getSocket = useCallback(() => {
+    if (!socketRef.current || socketRef.current.closed) {
+      socketRef.current = apiService.openGameSocket(handleSocketMessage, () => {
+        setError("Connection lost, reconnecting...");
+        if (sessionRef.current) {
+          setTimeout(getSocket, TIMING.RECONNECT_DELAY);
+        }
+      });
+      const session = sessionRef.current;
+      if (session && session.gameId) {
+        socketRef.current.newGame(session.playerTypes, TIMING.COMPUTER_MOVE_DELAY / 1000, session.gameId);
+      }
     }
-  }, [updateGameState, setGameStarted, setError]);
+    return socketRef.current;
+  }, [handleSocketMessage, setError]);
+
+  useEffect(() => () => socketRef.current && socketRef.current.close(), []);
+
+  // Computer moves are made and pushed by the server, so only human moves are sent
+  const makeMove = useCallback(async (index) => {
+    getSocket().move(index);
+  }, [getSocket]);
+
+  const resetGame = useCallback(async (playerTypes) => {
+    sessionRef.current = { gameId: null, playerTypes };
+    getSocket().newGame(playerTypes, TIMING.COMPUTER_MOVE_DELAY / 1000);
+    setGameStarted(true);
+  }, [getSocket, setGameStarted]);
 
   const isPlayerType = useCallback((player, playerType) => {
     return player === playerType;
@@ -76,7 +90,6 @@ export const useGameLogic = () => {
     setError,
     fetchGameState,
     makeMove,
-    makeComputerMove,
     resetGame,
     isCurrentPlayerHuman,
     isCurrentPlayerComputer
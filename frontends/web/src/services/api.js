@@ -34,32 +34,59 @@ class ApiService {
     });
   }
 
-  async makeMove(move, encodedState, playerTypes) {
-    return this.makeRequest(API_ENDPOINTS.GAME_MOVE, {
-      method: 'POST',
-      body: JSON.stringify({
-        move: { index: move },
-        encoded_state: encodedState,
-        player_types: playerTypes
-      })
-    });
+  // Opens a game connection to /ws/game; onMessage gets every message the server pushes
+  // ({type: "state", ...} or {type: "error", detail}), onClose is called if the connection drops.
+  openGameSocket(onMessage, onClose) {
+    const url = `${this.baseURL.replace(/^http/, 'ws')}${API_ENDPOINTS.GAME_SOCKET}`;
+    return new GameSocket(url, onMessage, onClose);
   }
+}
 
-  async makeComputerMove(encodedState, playerTypes) {
-    return this.makeRequest(API_ENDPOINTS.GAME_MOVE, {
-      method: 'POST',
-      body: JSON.stringify({
-        encoded_state: encodedState,
-        player_types: playerTypes
-      })
-    });
+class GameSocket {
+  constructor(url, onMessage, onClose) {
+    this.socket = new WebSocket(url);
+    this.pending = [];
+
+    this.socket.onopen = () => {
+      this.pending.forEach((data) => this.socket.send(data));
+      this.pending = [];
+    };
+    this.socket.onmessage = (event) => onMessage(JSON.parse(event.data));
+    this.socket.onclose = () => onClose();
+  }
+
+  get closed() {
+    return this.socket.readyState === WebSocket.CLOSING || this.socket.readyState === WebSocket.CLOSED;
+  }
+
+  send(message) {
+    const data = JSON.stringify(message);
+    if (this.socket.readyState === WebSocket.CONNECTING) {
+      this.pending.push(data);
+    } else {
+      this.socket.send(data);
+    }
   }
 
-  async resetGame() {
-    return this.makeRequest(API_ENDPOINTS.RESET_GAME, {
-      method: 'POST'
+  // Starts a game stored on the server, or resumes the one with gameId;
+  // the server then pushes each state, computer moves included, every moveDelay seconds
+  newGame(playerTypes, moveDelay, gameId = null) {
+    this.send({
+      type: 'new_game',
+      player_types: playerTypes,
+      move_delay: moveDelay,
+      ...(gameId ? { game_id: gameId } : { session: true })
     });
   }
+
+  move(index) {
+    this.send({ type: 'move', index });
+  }
+
+  close() {
+    this.socket.onclose = null;
+    this.socket.close();
+  }
 }
 
 export const apiService = new ApiService();
@@ -1,7 +1,14 @@
 """
 Neural network module for tic-tac-toe game.
-"""
 
-from .models.players import AlphaZeroStatelessComputerPlayer
+AlphaZeroStatelessComputerPlayer is imported on first access, since it pulls in pyspiel and open_spiel.
+"""
 
 __all__ = ['AlphaZeroStatelessComputerPlayer']
+
+
+def __getattr__(name):
+    if name == 'AlphaZeroStatelessComputerPlayer':
+        from .models.players import AlphaZeroStatelessComputerPlayer
+        return AlphaZeroStatelessComputerPlayer
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,7 +1,22 @@
 """
 Neural network models for tic-tac-toe game.
+
+Exports are imported on first access, so that e.g. the table player does not pay for
+loading pyspiel, open_spiel and the model.
 """
+import importlib
+
+_EXPORTS = {
+    'AlphaZeroContext': '.context',
+    'AlphaZeroNativeComputerPlayer': '.players',
+    'AlphaZeroStatelessComputerPlayer': '.players',
+    'AlphaZeroTablePlayer': '.policy_table',
+}
+
+__all__ = list(_EXPORTS)
 
-from .players import AlphaZeroStatelessComputerPlayer
 
-__all__ = ['AlphaZeroStatelessComputerPlayer']
+def __getattr__(name):
+    if name not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(importlib.import_module(_EXPORTS[name], __name__), name)
@@ -1,18 +1,27 @@
 import os
 
 from codetiming import Timer
-from open_spiel.python.algorithms.alpha_zero import model as az_model
+
+from .numpy_model import CHECKPOINT_PATH, WEIGHTS_PATH, NumpyAlphaZeroModel
 
 MODELS_DIR = os.path.dirname(os.path.abspath(__file__))
 
 
 class AlphaZeroModel:
-    """ Singleton to load an AlphaZero model from disk on first use and retain it in memory. """
+    """
+    Singleton to load an AlphaZero model from disk on first use and retain it in memory.
+
+    Loads the NumPy export of the model (see numpy_model.py) when it exists, so TensorFlow is
+    never imported; otherwise falls back to the TensorFlow checkpoint.
+    """
     _instance = None
 
     def __new__(cls, *args, **kwargs):
         if not cls._instance:
             with Timer(text="AZ.model_load took {:0.4f} seconds"):
-                cls._instance = az_model.Model.from_checkpoint(
-                    str(os.path.join(MODELS_DIR, "az_model/checkpoint--1")))
+                if os.path.exists(WEIGHTS_PATH):
+                    cls._instance = NumpyAlphaZeroModel.load(WEIGHTS_PATH)
+                else:
+                    from open_spiel.python.algorithms.alpha_zero import model as az_model
+                    cls._instance = az_model.Model.from_checkpoint(CHECKPOINT_PATH)
         return cls._instance
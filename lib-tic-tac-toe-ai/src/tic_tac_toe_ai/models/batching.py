@@ -0,0 +1,142 @@
+"""
+In-process micro-batching of AlphaZero model inferences.
+
+Every MCTS leaf needs one forward pass of the network. When several searches run at once
+(one per in-flight web request), the InferenceBatcher collects their leaf evaluations and
+runs a single model call per batch, which amortizes the TensorFlow call overhead.
+
+A batch is dispatched when it holds max_batch_size positions, when max_wait seconds have
+passed since its first position arrived, or as soon as every running search is waiting on
+it, so a lone search is never delayed.
+"""
+import bisect
+import queue
+import threading
+import time
+from concurrent.futures import Future
+
+import numpy as np
+
+MAX_BATCH_SIZE = 16
+MAX_WAIT_SECONDS = 0.002
+
+BATCH_SIZE_BUCKETS = (1, 2, 4, 8, 16, 32, 64)
+LATENCY_BUCKETS_MS = (0.1, 0.25, 0.5, 1, 2.5, 5, 10, 25, 50, 100)
+
+
+class Histogram:
+    """Thread-safe counts of observations per bucket (upper bounds, inclusive) plus an overflow bucket."""
+
+    def __init__(self, bounds: tuple[float, ...]):
+        self.bounds = bounds
+        self._counts = [0] * (len(bounds) + 1)
+        self._total = 0.0
+        self._lock = threading.Lock()
+
+    def observe(self, value: float) -> None:
+        with self._lock:
+            self._counts[bisect.bisect_left(self.bounds, value)] += 1
+            self._total += value
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            count = sum(self._counts)
+            labels = [f"<={bound:g}" for bound in self.bounds] + [f">{self.bounds[-1]:g}"]
+            return {
+                "count": count,
+                "mean": self._total / count if count else 0.0,
+                "buckets": dict(zip(labels, self._counts)),
+            }
+
+
+class _Request:
+    __slots__ = ("observation", "legals_mask", "future", "enqueued")
+
+    def __init__(self, observation, legals_mask):
+        self.observation = observation
+        self.legals_mask = legals_mask
+        self.future = Future()
+        self.enqueued = time.perf_counter()
+
+
+class InferenceBatcher:
+    """Runs the model on batches of positions submitted from any number of threads."""
+
+    def __init__(self, model, max_batch_size: int = MAX_BATCH_SIZE, max_wait: float = MAX_WAIT_SECONDS):
+        if max_batch_size < 1:
+            raise ValueError("max_batch_size must be at least 1")
+        self._model = model
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait
+        self._requests: queue.SimpleQueue[_Request] = queue.SimpleQueue()
+        self._active_searches = 0
+        self._active_lock = threading.Lock()
+        self.batch_sizes = Histogram(BATCH_SIZE_BUCKETS)
+        self.queue_latency_ms = Histogram(LATENCY_BUCKETS_MS)
+        self._thread = threading.Thread(target=self._run, name="az-inference-batcher", daemon=True)
+        self._thread.start()
+
+    def search_started(self) -> None:
+        with self._active_lock:
+            self._active_searches += 1
+
+    def search_finished(self) -> None:
+        with self._active_lock:
+            self._active_searches -= 1
+
+    def infer(self, observation, legals_mask):
+        """Value and policy of one position, computed as part of the next batch."""
+        request = _Request(observation, legals_mask)
+        self._requests.put(request)
+        return request.future.result()
+
+    def _collect(self) -> list[_Request]:
+        batch = [self._requests.get()]
+        deadline = batch[0].enqueued + self.max_wait
+        while len(batch) < self.max_batch_size:
+            try:
+                batch.append(self._requests.get_nowait())
+                continue
+            except queue.Empty:
+                pass
+            # every search blocks on its single pending leaf, so once each running search
+            # has a position in the batch nothing else can arrive
+            if len(batch) >= self._active_searches:
+                break
+            timeout = deadline - time.perf_counter()
+            if timeout <= 0:
+                break
+            try:
+                batch.append(self._requests.get(timeout=timeout))
+            except queue.Empty:
+                break
+        return batch
+
+    def _run(self) -> None:
+        while True:
+            batch = self._collect()
+            started = time.perf_counter()
+            for request in batch:
+                self.queue_latency_ms.observe((started - request.enqueued) * 1e3)
+            self.batch_sizes.observe(len(batch))
+            try:
+                values, policies = self._model.inference(
+                    np.array([request.observation for request in batch]),
+                    np.array([request.legals_mask for request in batch]),
+                )
+            except Exception as error:
+                for request in batch:
+                    request.future.set_exception(error)
+                continue
+            for request, value, policy in zip(batch, values, policies):
+                request.future.set_result((value[0], policy))
+
+    def stats(self) -> dict:
+        return {
+            "max_batch_size": self.max_batch_size,
+            "max_wait_ms": self.max_wait * 1e3,
+            "active_searches": self._active_searches,
+            "batch_size": self.batch_sizes.snapshot(),
+            "queue_latency_ms": self.queue_latency_ms.snapshot(),
+        }
+
@@ -0,0 +1,197 @@
+"""
+Process-wide AlphaZero inference context.
+
+Loading the pyspiel game, building the evaluator and creating MCTS bots used to happen on
+every move. The context does it once per process: the game and the evaluator (and with it
+the evaluator's inference cache) are shared by every player, MCTS bots are checked out of
+a pool for the duration of a single search, and the pyspiel state of a position is built
+by cloning the cached state of its parent position instead of replaying the whole game.
+
+Both the open_spiel search and the native bitboard search (see native_mcts.py) evaluate
+positions through one cached NetworkEvaluator. By default it sends its inferences through
+an InferenceBatcher, so the leaf evaluations of searches running concurrently share model
+calls (see batching.py). Search trees are kept between moves in a SearchTreeStore (see
+tree_reuse.py).
+"""
+import queue
+import threading
+from contextlib import contextmanager
+from functools import lru_cache
+from itertools import zip_longest
+from typing import Iterator
+
+import numpy as np
+import pyspiel
+from codetiming import Timer
+from open_spiel.python.algorithms import mcts
+
+from .alphazeromodel import AlphaZeroModel
+from .batching import MAX_BATCH_SIZE, MAX_WAIT_SECONDS, InferenceBatcher
+from .native_mcts import NativeMCTS, NetworkEvaluator, single_inference
+from .tree_reuse import MAX_TREES, TREE_TTL_SECONDS, ReusableMCTSBot, SearchTreeStore
+from tic_tac_toe.logic.bitboard import CELL_COUNT
+from tic_tac_toe.logic.models import GameState
+
+UCT_C = 2
+MAX_SIMULATIONS = 50  # without a time budget; they had 10000 but it takes much longer to play
+# upper bound on the simulations of a time-budgeted search
+MAX_BUDGETED_SIMULATIONS = 10000
+EVALUATOR_CACHE_SIZE = 2**16
+BOT_POOL_SIZE = 8
+
+
+def combine_moves(game_state: GameState) -> list[tuple[str, int]]:
+    """
+    Alpha Zero needs to play moves alternating between X and O. This method combines the moves into a list of tuples of (mark, index).
+    It doesn't matter which mark is first, but it's important to alternate between them as we apply them to the game state.
+    """
+    x_indexes = [i for i, cell in enumerate(game_state.grid.cells) if cell == "X"]
+    o_indexes = [i for i, cell in enumerate(game_state.grid.cells) if cell == "O"]
+
+    return [(mark, index) for x_idx, o_idx in zip_longest(x_indexes, o_indexes)
+            for mark, index in [('X', x_idx), ('O', o_idx)] if index is not None]
+
+
+class SpielNetworkEvaluator(mcts.Evaluator):
+    """
+    open_spiel MCTS evaluator backed by a NetworkEvaluator, so both searches share one cache.
+
+    Used instead of open_spiel's AlphaZeroEvaluator, which imports TensorFlow.
+    """
+
+    def __init__(self, network: NetworkEvaluator):
+        self.network = network
+
+    def _inference(self, state):
+        # observation planes are empty, nought (player 1) and cross (player 0, the first mover)
+        tensor = state.observation_tensor()
+        first = sum(1 << cell for cell in range(CELL_COUNT) if tensor[2 * CELL_COUNT + cell])
+        second = sum(1 << cell for cell in range(CELL_COUNT) if tensor[CELL_COUNT + cell])
+        return self.network.evaluate(first, second)
+
+    def evaluate(self, state):
+        value, _ = self._inference(state)
+        return np.array([value, -value])
+
+    def prior(self, state):
+        _, policy = self._inference(state)
+        return [(action, policy[action]) for action in state.legal_actions()]
+
+
+class AlphaZeroContext:
+    """
+    Shared game, evaluator and pool of preconfigured MCTS bots.
+
+    Use AlphaZeroContext.get() for the process-wide instance; it is created on first use.
+    """
+    _instance = None
+    _instance_lock = threading.Lock()
+
+    @Timer(text="AZ.context_init took {:0.4f} seconds")
+    def __init__(
+        self,
+        pool_size: int = BOT_POOL_SIZE,
+        batching: bool = True,
+        max_batch_size: int = MAX_BATCH_SIZE,
+        max_wait: float = MAX_WAIT_SECONDS,
+        max_trees: int = MAX_TREES,
+        tree_ttl_seconds: float = TREE_TTL_SECONDS,
+    ):
+        self.game = pyspiel.load_game("tic_tac_toe")
+        model = AlphaZeroModel()
+        self.batcher = None
+        if batching:
+            self.batcher = InferenceBatcher(model, max_batch_size, max_wait)
+            self.network = NetworkEvaluator(self.batcher.infer, EVALUATOR_CACHE_SIZE)
+        else:
+            self.network = NetworkEvaluator(single_inference(model, threading.Lock()), EVALUATOR_CACHE_SIZE)
+        self.evaluator = SpielNetworkEvaluator(self.network)
+        self.trees = SearchTreeStore(max_trees, tree_ttl_seconds)
+        self.pool_size = pool_size
+        self._bots: queue.Queue[ReusableMCTSBot] = queue.Queue()
+        self._bots_lock = threading.Lock()
+        self.bots_created = 0
+        self.checkouts = 0
+        self._state_for_actions = lru_cache(maxsize=8192)(self._build_state)
+
+    @classmethod
+    def get(cls) -> "AlphaZeroContext":
+        if cls._instance is None:
+            with cls._instance_lock:
+                if cls._instance is None:
+                    cls._instance = cls()
+        return cls._instance
+
+    def _create_bot(self) -> ReusableMCTSBot:
+        return ReusableMCTSBot(
+            self.game,
+            UCT_C,
+            MAX_SIMULATIONS,
+            self.evaluator,
+            random_state=np.random.RandomState(),
+            child_selection_fn=mcts.SearchNode.puct_value,
+            solve=True,
+            verbose=False)
+
+    @contextmanager
+    def checkout_bot(self) -> Iterator[ReusableMCTSBot]:
+        """Lend a bot for one search. Bots beyond the pool size are created on demand and dropped."""
+        try:
+            bot = self._bots.get_nowait()
+        except queue.Empty:
+            bot = self._create_bot()
+            with self._bots_lock:
+                self.bots_created += 1
+        with self._bots_lock:
+            self.checkouts += 1
+        if self.batcher is not None:
+            self.batcher.search_started()
+        try:
+            yield bot
+        finally:
+            if self.batcher is not None:
+                self.batcher.search_finished()
+            if self._bots.qsize() < self.pool_size:
+                self._bots.put(bot)
+
+    @contextmanager
+    def native_search(self) -> Iterator[NativeMCTS]:
+        """A native bitboard search for one move, sharing the context's network evaluator."""
+        if self.batcher is not None:
+            self.batcher.search_started()
+        try:
+            yield NativeMCTS(self.network, UCT_C, MAX_SIMULATIONS)
+        finally:
+            if self.batcher is not None:
+                self.batcher.search_finished()
+
+    def _build_state(self, actions: tuple[int, ...]):
+        if not actions:
+            return self.game.new_initial_state()
+        state = self._state_for_actions(actions[:-1]).clone()
+        state.apply_action(actions[-1])
+        return state
+
+    def state_for(self, game_state: GameState):
+        """
+        The pyspiel state of a position. Treat it as read-only: it is cached and shared,
+        MCTS clones it before searching.
+        """
+        return self._state_for_actions(tuple(index for _, index in combine_moves(game_state)))
+
+    def warm_up(self) -> None:
+        """Run one search from the empty board so the model and the first bot are ready."""
+        with self.checkout_bot() as bot:
+            bot.step(self.game.new_initial_state())
+
+    def stats(self) -> dict:
+        stats = {
+            "bots_created": self.bots_created,
+            "bots_idle": self._bots.qsize(),
+            "checkouts": self.checkouts,
+            "evaluator_cache": self.network.stats(),
+            "trees": self.trees.stats(),
+        }
+        if self.batcher is not None:
+            stats["batching"] = self.batcher.stats()
+        return stats
@@ -0,0 +1,302 @@
+"""
+MCTS/PUCT that runs directly on tic_tac_toe.logic bitboards, with the network as evaluator.
+
+The open_spiel path has to turn every GameState into a pyspiel state and every search node
+into a Python object. Here a position is a pair of bitboards and the tree lives in a
+NodeStore: parallel arrays of per-node statistics, with each node's children stored next to
+each other. Selection, expansion, evaluation and backup follow open_spiel's MCTSBot with
+PUCT child selection and solve=True, so both searches pick moves the same way.
+
+The network sees the game from the first mover's side: the first mover is the pyspiel
+cross (player 0), the value it returns is the first mover's, and the observation planes
+are empty, nought (second mover) and cross (first mover).
+"""
+import math
+import random
+import threading
+import time
+from array import array
+from collections import OrderedDict
+from typing import Callable
+
+import numpy as np
+
+from tic_tac_toe.logic.bitboard import CELL_COUNT, FULL_MASK, iter_bits
+from tic_tac_toe.logic.models import WIN_MASKS, GameState, Mark, Move
+
+# (observation tensor, legal-actions mask) of one position -> (first mover's value, policy)
+Inference = Callable[[np.ndarray, np.ndarray], tuple]
+
+UNKNOWN = 2  # outcome code of a node that is not solved yet
+NETWORK_CACHE_SIZE = 2**16
+
+
+def _has_win(mask: int) -> bool:
+    return any(mask & win_mask == win_mask for win_mask in WIN_MASKS)
+
+
+def observation(first: int, second: int) -> np.ndarray:
+    """The pyspiel observation tensor: planes for empty cells, the second mover and the first mover."""
+    tensor = np.zeros((3, CELL_COUNT), dtype=np.float32)
+    for plane, mask in enumerate((FULL_MASK & ~(first | second), second, first)):
+        for cell in iter_bits(mask):
+            tensor[plane, cell] = 1
+    return tensor.reshape(-1)
+
+
+class NetworkEvaluator:
+    """Thread-safe LRU cache in front of the network's value and policy for a position."""
+
+    def __init__(self, infer: Inference, cache_size: int = NETWORK_CACHE_SIZE):
+        self._infer = infer
+        self._cache: OrderedDict[tuple[int, int], tuple[float, np.ndarray]] = OrderedDict()
+        self._cache_size = cache_size
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def evaluate(self, first: int, second: int) -> tuple[float, np.ndarray]:
+        """Value for the first mover (-1 to 1) and the policy over all 9 cells."""
+        key = (first, second)
+        with self._lock:
+            if (cached := self._cache.get(key)) is not None:
+                self.hits += 1
+                self._cache.move_to_end(key)
+                return cached
+            self.misses += 1
+        legal = np.zeros(CELL_COUNT, dtype=bool)
+        legal[list(iter_bits(FULL_MASK & ~(first | second)))] = True
+        value, policy = self._infer(observation(first, second), legal)
+        result = (float(value), np.asarray(policy))
+        with self._lock:
+            self._cache[key] = result
+            if len(self._cache) > self._cache_size:
+                self._cache.popitem(last=False)
+        return result
+
+    def stats(self) -> dict[str, int]:
+        return {"hits": self.hits, "misses": self.misses, "size": len(self._cache)}
+
+
+def single_inference(model, lock: threading.Lock) -> Inference:
+    """Adapt a batched model.inference to one position at a time, one call at a time."""
+
+    def infer(observation_tensor: np.ndarray, legals_mask: np.ndarray) -> tuple:
+        with lock:
+            value, policy = model.inference([observation_tensor], [legals_mask])
+        return value[0, 0], policy[0]
+
+    return infer
+
+
+class NodeStore:
+    """
+    Search tree as parallel arrays indexed by node.
+
+    value_sum and outcome are from the point of view of the player who moved into the node;
+    outcome is -1/0/1 once the node is solved and UNKNOWN before.
+    """
+
+    def __init__(self) -> None:
+        self.clear()
+
+    def clear(self) -> None:
+        self.action = array("b")
+        self.first_child = array("i")
+        self.child_count = array("b")
+        self.visits = array("i")
+        self.value_sum = array("d")
+        self.prior = array("d")
+        self.outcome = array("b")
+
+    def __len__(self) -> int:
+        return len(self.action)
+
+    def add(self, action: int, prior: float) -> int:
+        self.action.append(action)
+        self.first_child.append(0)
+        self.child_count.append(0)
+        self.visits.append(0)
+        self.value_sum.append(0.0)
+        self.prior.append(prior)
+        self.outcome.append(UNKNOWN)
+        return len(self.action) - 1
+
+
+class NativeMCTS:
+    """PUCT search over bitboards; not thread-safe, use one instance per concurrent search."""
+
+    def __init__(
+        self,
+        evaluator: NetworkEvaluator,
+        uct_c: float = 2,
+        max_simulations: int = 50,
+        solve: bool = True,
+        rng: random.Random | None = None,
+    ) -> None:
+        self.evaluator = evaluator
+        self.uct_c = uct_c
+        self.max_simulations = max_simulations
+        self.solve = solve
+        self.rng = rng or random.Random()
+        self.nodes = NodeStore()
+        self.last_simulations = 0
+
+    def find_best_move(
+        self,
+        game_state: GameState,
+        time_budget: float | None = None,
+        max_simulations: int | None = None,
+    ) -> Move | None:
+        if game_state.game_over:
+            return None
+        grid = game_state.grid
+        if grid.size != 3:
+            raise ValueError("AlphaZero was trained on the 3x3 game only")
+        mover, other = (
+            (grid.x_mask, grid.o_mask)
+            if game_state.current_mark is Mark.CROSS
+            else (grid.o_mask, grid.x_mask)
+        )
+        mover_is_first = game_state.current_mark is game_state.starting_mark
+        cell = self.search(mover, other, mover_is_first, time_budget, max_simulations)
+        return game_state.make_move_to(cell)
+
+    def search(
+        self,
+        mover: int,
+        other: int,
+        mover_is_first: bool,
+        time_budget: float | None = None,
+        max_simulations: int | None = None,
+    ) -> int:
+        """Return the cell to play for the side to move."""
+        nodes = self.nodes
+        nodes.clear()
+        root = nodes.add(-1, 1.0)
+        max_simulations = self.max_simulations if max_simulations is None else max_simulations
+        deadline = None if time_budget is None else time.perf_counter() + time_budget
+        self.last_simulations = 0
+        while nodes.outcome[root] == UNKNOWN and nodes.visits[root] < max_simulations:
+            self._simulate(root, mover, other, mover_is_first)
+            self.last_simulations += 1
+            if deadline is not None and time.perf_counter() >= deadline:
+                break
+        if not nodes.child_count[root]:
+            self._expand(root, mover, other, mover_is_first)
+        return nodes.action[self._best_child(root)]
+
+    def root_policy(self) -> list[float]:
+        """
+        Move probabilities over the 9 cells after the last search: the root's visit counts,
+        or an even split over the best moves once the root is solved.
+        """
+        nodes = self.nodes
+        start = nodes.first_child[0]
+        children = range(start, start + nodes.child_count[0])
+        if nodes.outcome[0] != UNKNOWN:
+            # the root's outcome is from the opponent's side, its best children score the opposite
+            weights = {child: float(nodes.outcome[child] == -nodes.outcome[0]) for child in children}
+        else:
+            weights = {child: float(nodes.visits[child]) for child in children}
+        total = sum(weights.values()) or 1.0
+        policy = [0.0] * CELL_COUNT
+        for child, weight in weights.items():
+            policy[nodes.action[child]] = weight / total
+        return policy
+
+    def _simulate(self, root: int, mover: int, other: int, mover_is_first: bool) -> None:
+        nodes = self.nodes
+        path = [root]
+        node = root
+        # walk down while the node has been visited and is not solved
+        while nodes.visits[node] and nodes.outcome[node] == UNKNOWN:
+            if not nodes.child_count[node]:
+                self._expand(node, mover, other, mover_is_first)
+            node = self._select(node)
+            mover, other = other, mover | 1 << nodes.action[node]
+            mover_is_first = not mover_is_first
+            path.append(node)
+
+        solved = False
+        if nodes.outcome[node] != UNKNOWN:
+            value = nodes.outcome[node]
+            solved = self.solve
+        elif _has_win(other):
+            # the player who moved into the node has won
+            value = nodes.outcome[node] = 1
+            solved = self.solve
+        elif not FULL_MASK & ~(mover | other):
+            value = nodes.outcome[node] = 0
+            solved = self.solve
+        else:
+            first, second = (mover, other) if mover_is_first else (other, mover)
+            first_value, _ = self.evaluator.evaluate(first, second)
+            # value for the player who moved into the node, i.e. the one not to move
+            value = -first_value if mover_is_first else first_value
+
+        for node in reversed(path):
+            nodes.visits[node] += 1
+            nodes.value_sum[node] += value
+            if solved and nodes.child_count[node]:
+                solved = self._solve(node)
+            value = -value
+
+    def _solve(self, node: int) -> bool:
+        """Mark node solved if its children decide it; return whether it was."""
+        nodes = self.nodes
+        start = nodes.first_child[node]
+        best = None
+        all_solved = True
+        for child in range(start, start + nodes.child_count[node]):
+            outcome = nodes.outcome[child]
+            if outcome == UNKNOWN:
+                all_solved = False
+            elif best is None or outcome > best:
+                best = outcome
+        if best is not None and (all_solved or best == 1):
+            nodes.outcome[node] = -best
+            return True
+        return False
+
+    def _expand(self, node: int, mover: int, other: int, mover_is_first: bool) -> None:
+        nodes = self.nodes
+        first, second = (mover, other) if mover_is_first else (other, mover)
+        _, policy = self.evaluator.evaluate(first, second)
+        cells = list(iter_bits(FULL_MASK & ~(mover | other)))
+        # shuffled like MCTSBot, so ties between equally good moves are broken at random
+        self.rng.shuffle(cells)
+        nodes.first_child[node] = len(nodes)
+        nodes.child_count[node] = len(cells)
+        for cell in cells:
+            nodes.add(cell, float(policy[cell]))
+
+    def _select(self, node: int) -> int:
+        """The child with the highest PUCT value (solved children score their outcome)."""
+        nodes = self.nodes
+        visits, value_sum, prior, outcome = nodes.visits, nodes.value_sum, nodes.prior, nodes.outcome
+        exploration = self.uct_c * math.sqrt(visits[node])
+        start = nodes.first_child[node]
+        best_child, best_score = start, -math.inf
+        for child in range(start, start + nodes.child_count[node]):
+            if outcome[child] != UNKNOWN:
+                score = outcome[child]
+            else:
+                child_visits = visits[child]
+                score = (child_visits and value_sum[child] / child_visits) + (
+                    exploration * prior[child] / (child_visits + 1)
+                )
+            if score > best_score:
+                best_child, best_score = child, score
+        return best_child
+
+    def _best_child(self, node: int) -> int:
+        """Like SearchNode.best_child: solved outcome first, then visits, then total value."""
+        nodes = self.nodes
+        start = nodes.first_child[node]
+
+        def sort_key(child: int) -> tuple[float, int, float]:
+            outcome = nodes.outcome[child]
+            return (0 if outcome == UNKNOWN else outcome, nodes.visits[child], nodes.value_sum[child])
+
+        return max(range(start, start + nodes.child_count[node]), key=sort_key)
@@ -0,0 +1,179 @@
+"""
+NumPy forward pass of the trained AlphaZero network, so serving does not need TensorFlow.
+
+The weights are exported once from the TensorFlow checkpoint in az_model/ to a plain .npz
+file, and the export is checked against the TensorFlow model on every reachable position:
+
+    python -m tic_tac_toe_ai.models.numpy_model [--checkpoint PATH] [--output PATH]
+    python -m tic_tac_toe_ai.models.numpy_model --verify-only
+
+Only the export and the verification import TensorFlow. The network is open_spiel's
+"resnet" model: the observation reshaped to observation_shape (read as height, width,
+channels), a 3x3 convolution torso with nn_depth residual blocks, and policy and value
+heads. Every convolution uses "same" padding and is followed by batch normalization.
+"""
+import argparse
+import json
+import os
+
+import numpy as np
+
+from tic_tac_toe.logic.models import GameState, Grid, Mark
+
+from .native_mcts import observation
+
+MODELS_DIR = os.path.dirname(os.path.abspath(__file__))
+CHECKPOINT_PATH = os.path.join(MODELS_DIR, "az_model", "checkpoint--1")
+CONFIG_PATH = os.path.join(MODELS_DIR, "az_model", "config.json")
+WEIGHTS_PATH = os.path.join(MODELS_DIR, "az_model", "weights.npz")
+
+BATCH_NORM_EPSILON = 1e-3  # the Keras BatchNormalization default used by open_spiel
+ILLEGAL_LOGIT = -1e32
+# largest difference to the TensorFlow model accepted by the verification
+TOLERANCE = 1e-4
+
+
+def _conv2d(x: np.ndarray, kernel: np.ndarray, bias: np.ndarray) -> np.ndarray:
+    """Stride-1 "same" convolution of NHWC x with an HWIO kernel of odd size."""
+    kernel_h, kernel_w, channels, filters = kernel.shape
+    pad_h, pad_w = kernel_h // 2, kernel_w // 2
+    batch, height, width, _ = x.shape
+    padded = np.pad(x, ((0, 0), (pad_h, pad_h), (pad_w, pad_w), (0, 0)))
+    # patches ordered (kernel row, kernel column, channel) like the flattened kernel
+    patches = np.stack(
+        [padded[:, i:i + height, j:j + width, :] for i in range(kernel_h) for j in range(kernel_w)],
+        axis=3,
+    ).reshape(batch, height, width, kernel_h * kernel_w * channels)
+    return patches @ kernel.reshape(-1, filters) + bias
+
+
+def _relu(x: np.ndarray) -> np.ndarray:
+    return np.maximum(x, 0)
+
+
+class NumpyAlphaZeroModel:
+    """Drop-in replacement for the inference side of open_spiel's alpha_zero Model."""
+
+    def __init__(self, weights: dict[str, np.ndarray], config: dict):
+        self._weights = {name: np.asarray(value, dtype=np.float32) for name, value in weights.items()}
+        self._observation_shape = tuple(config["observation_shape"])
+        self._depth = config["nn_depth"]
+        # fold each batch normalization into a scale and shift
+        self._batch_norms = {}
+        for name in self._weights:
+            if name.endswith("/moving_variance"):
+                layer = name.rsplit("/", 1)[0]
+                scale = self._weights[f"{layer}/gamma"] / np.sqrt(
+                    self._weights[f"{layer}/moving_variance"] + BATCH_NORM_EPSILON)
+                shift = self._weights[f"{layer}/beta"] - self._weights[f"{layer}/moving_mean"] * scale
+                self._batch_norms[layer] = (scale, shift)
+
+    @classmethod
+    def load(cls, path: str = WEIGHTS_PATH, config_path: str = CONFIG_PATH) -> "NumpyAlphaZeroModel":
+        with np.load(path) as weights, open(config_path) as file:
+            return cls(dict(weights), json.load(file))
+
+    def _conv(self, x: np.ndarray, name: str) -> np.ndarray:
+        return _conv2d(x, self._weights[f"{name}/kernel"], self._weights[f"{name}/bias"])
+
+    def _batch_norm(self, x: np.ndarray, name: str) -> np.ndarray:
+        scale, shift = self._batch_norms[name]
+        return x * scale + shift
+
+    def _dense(self, x: np.ndarray, name: str) -> np.ndarray:
+        return x @ self._weights[f"{name}/kernel"] + self._weights[f"{name}/bias"]
+
+    def inference(self, observation, legals_mask) -> tuple[np.ndarray, np.ndarray]:
+        """Value (shape [batch, 1]) and policy (shape [batch, actions]) of a batch of positions."""
+        observation = np.asarray(observation, dtype=np.float32)
+        legals_mask = np.asarray(legals_mask, dtype=bool)
+        x = observation.reshape((-1,) + self._observation_shape)
+        x = _relu(self._batch_norm(self._conv(x, "torso_in_conv"), "torso_in_batch_norm"))
+        for i in range(self._depth):
+            residual = x
+            x = _relu(self._batch_norm(self._conv(x, f"torso_{i}_res_conv1"), f"torso_{i}_res_batch_norm1"))
+            x = self._batch_norm(self._conv(x, f"torso_{i}_res_conv2"), f"torso_{i}_res_batch_norm2")
+            x = _relu(x + residual)
+        batch = x.shape[0]
+
+        policy = _relu(self._batch_norm(self._conv(x, "policy_conv"), "policy_batch_norm"))
+        logits = self._dense(policy.reshape(batch, -1), "policy")
+        logits = np.where(legals_mask, logits, ILLEGAL_LOGIT)
+        logits -= logits.max(axis=1, keepdims=True)
+        policy = np.exp(logits)
+        policy /= policy.sum(axis=1, keepdims=True)
+
+        value = _relu(self._batch_norm(self._conv(x, "value_conv"), "value_batch_norm"))
+        value = _relu(self._dense(value.reshape(batch, -1), "value_dense"))
+        value = np.tanh(self._dense(value, "value"))
+        return value, policy
+
+
+def export_weights(checkpoint_path: str = CHECKPOINT_PATH, output_path: str = WEIGHTS_PATH) -> int:
+    """Write the network's variables (without optimizer state) to an .npz file; return their count."""
+    import tensorflow as tf
+
+    reader = tf.train.load_checkpoint(checkpoint_path)
+    weights = {
+        name: reader.get_tensor(name)
+        for name in reader.get_variable_to_shape_map()
+        if name.endswith(("/kernel", "/bias", "/gamma", "/beta", "/moving_mean", "/moving_variance"))
+    }
+    np.savez(output_path, **weights)
+    return len(weights)
+
+
+def reachable_inputs() -> tuple[np.ndarray, np.ndarray]:
+    """Observations and legal-action masks of every non-terminal position reachable from the empty board."""
+    observations, masks = [], []
+    seen = set()
+    pending = [GameState(Grid(), Mark.CROSS)]
+    while pending:
+        state = pending.pop()
+        if state.grid.cells in seen or state.game_over:
+            continue
+        seen.add(state.grid.cells)
+        # X moves first, so X is the first mover (pyspiel's cross)
+        observations.append(observation(state.grid.x_mask, state.grid.o_mask))
+        masks.append([cell == " " for cell in state.grid.cells])
+        pending.extend(move.after_state for move in state.iter_moves())
+    return np.array(observations), np.array(masks)
+
+
+def verify(
+    checkpoint_path: str = CHECKPOINT_PATH, weights_path: str = WEIGHTS_PATH, tolerance: float = TOLERANCE
+) -> tuple[float, float]:
+    """
+    Compare the exported model with the TensorFlow model on every reachable position.
+
+    Returns the largest value and policy differences; raises ValueError if either exceeds tolerance.
+    """
+    from open_spiel.python.algorithms.alpha_zero import model as az_model
+
+    observations, masks = reachable_inputs()
+    tf_value, tf_policy = az_model.Model.from_checkpoint(checkpoint_path).inference(observations, masks)
+    np_value, np_policy = NumpyAlphaZeroModel.load(weights_path).inference(observations, masks)
+    value_error = float(np.abs(tf_value - np_value).max())
+    policy_error = float(np.abs(tf_policy - np_policy).max())
+    if max(value_error, policy_error) > tolerance:
+        raise ValueError(
+            f"Exported model differs from the checkpoint: value by {value_error:.2e}, "
+            f"policy by {policy_error:.2e} (tolerance {tolerance:.0e})")
+    return value_error, policy_error
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Export the AlphaZero checkpoint for NumPy inference.")
+    parser.add_argument("--checkpoint", default=CHECKPOINT_PATH, help="TensorFlow checkpoint prefix")
+    parser.add_argument("--output", default=WEIGHTS_PATH, help="where to write the weights")
+    parser.add_argument("--verify-only", action="store_true", help="only compare an existing export")
+    args = parser.parse_args()
+    if not args.verify_only:
+        count = export_weights(args.checkpoint, args.output)
+        print(f"Wrote {count} arrays to {args.output}")
+    value_error, policy_error = verify(args.checkpoint, args.output)
+    print(f"Verified against TensorFlow: max value error {value_error:.2e}, max policy error {policy_error:.2e}")
+
+
+if __name__ == "__main__":
+    main()
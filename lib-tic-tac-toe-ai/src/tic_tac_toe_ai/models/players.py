@@ -1,14 +1,11 @@
-import numpy as np
-import pyspiel
-from codetiming import Timer
-from open_spiel.python.algorithms import mcts
-from itertools import zip_longest
+from concurrent.futures import ThreadPoolExecutor
 
-from open_spiel.python.algorithms.alpha_zero import evaluator as az_evaluator
+from codetiming import Timer
 
-from .alphazeromodel import AlphaZeroModel
+from .context import BOT_POOL_SIZE, MAX_BUDGETED_SIMULATIONS, AlphaZeroContext, combine_moves
+from .tree_reuse import position_key, store_replies
 from tic_tac_toe.game.players import ComputerPlayer
-from tic_tac_toe.logic.models import GameState, Move, Mark
+from tic_tac_toe.logic.models import GameState, Grid, Move, Mark
 
 import logging
 
@@ -16,70 +13,97 @@ logger = logging.getLogger('uvicorn.error')
 logger.setLevel(logging.DEBUG)
 
 
-def _create_mcts_bot(game, evaluator):
-    """Helper function to create MCTS bot with consistent parameters."""
-    return mcts.MCTSBot(
-        game,
-        2,
-        50,  # TODO what is optimal here? they had 10000 but it takes much longer to play
-        evaluator,
-        random_state=np.random.RandomState(),
-        child_selection_fn=mcts.SearchNode.puct_value,
-        solve=True,
-        verbose=False)
-
-
 # AlphaZeroComputerPlayer removed - use AlphaZeroStatelessComputerPlayer instead
 
 class AlphaZeroStatelessComputerPlayer(ComputerPlayer):
-    @Timer(text="AZS.init took {:0.4f} seconds")
-    def __init__(self, mark: Mark):
+    def __init__(self, mark: Mark, delay_seconds: float = 0.25, time_budget: float | None = None):
         """
         Creates an Alpha Zero computer player in the format required by our actual game.
-        Loading the model takes a little bit of time.
+        Loading the model takes a little bit of time, so the game, the model's evaluator and
+        the MCTS bots live in the process-wide AlphaZeroContext and are shared by every player.
 
-        Loads the trained model from a file distributed with this application.
-        Holds its own game state for syncing with our actual game.
+        Without a time_budget every move runs a fixed number of simulations. With one, each move
+        searches for up to time_budget seconds (or until the position is solved).
+        The number of simulations of the last move is kept in last_simulations.
         """
         logger.debug(f"AlphaZeroStatelessComputerPlayer.__init__ mark {mark}")
-        super().__init__(mark)
+        super().__init__(mark, delay_seconds)
+        self.time_budget = time_budget
+        self.last_simulations = 0
+
+    @classmethod
+    def warm_up(cls) -> None:
+        """Load the model and run one search, so the first move does not pay for either."""
+        AlphaZeroContext.get().warm_up()
 
     @staticmethod
     def combine_moves(game_state: GameState):
-        """
-        Alpha Zero needs to play moves alternating between X and O. This method combines the moves into a list of tuples of (mark, index).
-        It doesn't matter which mark is first, but it's important to alternate between them as we apply them to the game state.
-        """
-        x_indexes = [i for i, cell in enumerate(game_state.grid.cells) if cell == "X"]
-        o_indexes = [i for i, cell in enumerate(game_state.grid.cells) if cell == "O"]
-        
-        return [(mark, index) for x_idx, o_idx in zip_longest(x_indexes, o_indexes) 
-                for mark, index in [('X', x_idx), ('O', o_idx)] if index is not None]
+        return combine_moves(game_state)
 
     def get_computer_move(self, game_state: GameState) -> Move | None:
         """
         Alpha Zero computes its next Tic-Tac-Toe move
 
-        First we create a history of moves from the game state.
-        Next we sync Alpha Zero with this history of moves (it's important to play moves alternating between X and O).
-        Then we compute our move.
+        First we look up the Alpha Zero state for the history of moves in the game state
+        (it's important to play moves alternating between X and O), shared across moves and players.
+        Then we compute our move with a bot checked out of the shared pool, continuing the search tree
+        kept from our previous move when the opponent answered with a reply we had already explored.
         Finally we convert our move to the actual game representation and return it.
         """
-        game = pyspiel.load_game("tic_tac_toe")
-        evaluator = az_evaluator.AlphaZeroEvaluator(game, AlphaZeroModel())
-        
-        with Timer(text="AZS syncing state took {:0.4f} seconds"):
-            az_state = game.new_initial_state()
-            bot = _create_mcts_bot(game, evaluator)
+        if game_state.grid.size != 3:
+            raise ValueError("AlphaZero was trained on the 3x3 game only")
+        context = AlphaZeroContext.get()
 
-            for mark, index in AlphaZeroStatelessComputerPlayer.combine_moves(game_state):
-                logger.debug(f"Position {index} for '{mark}'")
-                logger.debug(f"Applying move {index} to alpha zero state for '{mark}'")
-                az_state.apply_action(index)
+        with Timer(text="AZS syncing state took {:0.4f} seconds"):
+            az_state = context.state_for(game_state)
 
-        # compute alpha zero's next move
+        # compute alpha zero's next move with a bot lent by the shared pool
         with Timer(text="AZS.bot.step took {:0.4f} seconds"):
-            action = bot.step(az_state)
+            root = context.trees.take(position_key(az_state))
+            with context.checkout_bot() as bot:
+                if self.time_budget is None:
+                    action, chosen = bot.step_with_tree(az_state, root)
+                else:
+                    action, chosen = bot.step_with_tree(
+                        az_state, root, self.time_budget, MAX_BUDGETED_SIMULATIONS)
+                self.last_simulations = bot.last_simulations
+            logger.debug(f"AZS ran {self.last_simulations} simulations, reused tree: {root is not None}")
+            store_replies(context.trees, az_state, chosen)
 
         # return the move as represented by our actual game
-        return game_state.make_move_to(action)
\ No newline at end of file
+        return game_state.make_move_to(action)
+
+    def get_computer_moves(self, game_states: list[GameState]) -> list[Move | None]:
+        """
+        Search the positions concurrently, one bot each, so the context's inference batcher
+        evaluates their leaves together instead of one network call per leaf.
+        """
+        if len(game_states) < 2:
+            return super().get_computer_moves(game_states)
+        with ThreadPoolExecutor(max_workers=min(len(game_states), BOT_POOL_SIZE)) as executor:
+            return list(executor.map(self.get_computer_move, game_states))
+
+
+class AlphaZeroNativeComputerPlayer(AlphaZeroStatelessComputerPlayer):
+    """
+    Alpha Zero player whose MCTS runs natively on our own bitboards (see native_mcts.py)
+    rather than on pyspiel states, with the same network as evaluator. It builds a fresh tree every move.
+    """
+
+    @classmethod
+    def warm_up(cls) -> None:
+        with AlphaZeroContext.get().native_search() as search:
+            search.find_best_move(GameState(Grid(), Mark.CROSS))
+
+    def get_computer_move(self, game_state: GameState) -> Move | None:
+        context = AlphaZeroContext.get()
+        with Timer(text="AZN.search took {:0.4f} seconds"):
+            with context.native_search() as search:
+                if self.time_budget is None:
+                    move = search.find_best_move(game_state)
+                else:
+                    move = search.find_best_move(game_state, self.time_budget, MAX_BUDGETED_SIMULATIONS)
+                self.last_simulations = search.last_simulations
+        logger.debug(f"AZN ran {self.last_simulations} simulations")
+        return move
+
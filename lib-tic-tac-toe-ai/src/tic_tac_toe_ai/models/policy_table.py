@@ -0,0 +1,183 @@
+"""
+AlphaZero's move distribution for every reachable position, distilled into a table.
+
+A build step runs the native MCTS with the network at a high simulation count from every
+non-terminal position reachable with either mark starting, and ships the results:
+
+    python -m tic_tac_toe_ai.models.policy_table [--simulations N] [--output PATH]
+
+File layout (little-endian): a header of magic b"TTTP", format version, cell count and
+row count; one uint16 slot per (board, side to move), indexed like the solved-game table
+(see tic_tac_toe.logic.solved_table.table_index) and holding 0 for positions without a
+row or the 1-based row number; then one row of 9 uint8 move weights per position, the
+move probabilities scaled to 255. Serving (AlphaZeroTablePlayer) memory-maps the file and
+needs neither the model nor TensorFlow nor pyspiel.
+"""
+import argparse
+import mmap
+import os
+import random
+import struct
+import sys
+import threading
+import time
+from array import array
+from typing import Sequence
+
+from tic_tac_toe.game.players import ComputerPlayer
+from tic_tac_toe.logic.bitboard import CELL_COUNT
+from tic_tac_toe.logic.models import GameState, Grid, Mark, Move
+from tic_tac_toe.logic.solved_table import ENTRY_COUNT, table_index
+
+MODELS_DIR = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_PATH = os.path.join(MODELS_DIR, "az_model", "policy_table.bin")
+
+MAGIC = b"TTTP"
+FORMAT_VERSION = 1
+HEADER = struct.Struct("<4sHHI")
+BUILD_SIMULATIONS = 10000
+WEIGHT_SCALE = 255
+
+
+def reachable_states() -> list[GameState]:
+    """Every non-terminal position reachable from the empty board, with either mark starting."""
+    states, seen = [], set()
+    for starting_mark in Mark:
+        pending = [GameState(Grid(), starting_mark)]
+        while pending:
+            state = pending.pop()
+            key = (state.grid.cells, state.current_mark)
+            if key in seen or state.game_over:
+                continue
+            seen.add(key)
+            states.append(state)
+            pending.extend(move.after_state for move in state.iter_moves())
+    return states
+
+
+def quantize(policy: Sequence[float]) -> bytes:
+    """Scale probabilities to 0..255, keeping every move that has any probability playable."""
+    return bytes(max(round(p * WEIGHT_SCALE), 1) if p > 0 else 0 for p in policy)
+
+
+def build(simulations: int = BUILD_SIMULATIONS) -> tuple[array, bytes]:
+    """Search every reachable position; return the slot array and the packed rows."""
+    from .alphazeromodel import AlphaZeroModel
+    from .native_mcts import NativeMCTS, NetworkEvaluator, single_inference
+
+    network = NetworkEvaluator(single_inference(AlphaZeroModel(), threading.Lock()))
+    search = NativeMCTS(network, max_simulations=simulations)
+    slots = array("H", bytes(2 * ENTRY_COUNT))
+    rows = bytearray()
+    for row, state in enumerate(reachable_states(), start=1):
+        search.find_best_move(state)
+        slots[table_index(state.grid.x_mask, state.grid.o_mask, state.current_mark)] = row
+        rows += quantize(search.root_policy())
+    return slots, bytes(rows)
+
+
+def write_table(slots: array, rows: bytes, path: str = DEFAULT_PATH) -> None:
+    little_endian = array("H", slots)
+    if sys.byteorder != "little":
+        little_endian.byteswap()
+    with open(path, "wb") as file:
+        file.write(HEADER.pack(MAGIC, FORMAT_VERSION, CELL_COUNT, len(rows) // CELL_COUNT))
+        little_endian.tofile(file)
+        file.write(rows)
+
+
+class PolicyTable:
+    """O(1) lookup of AlphaZero's move weights in any reachable, non-terminal position."""
+
+    def __init__(self, slots: Sequence[int], rows: Sequence[int]) -> None:
+        if len(slots) != ENTRY_COUNT:
+            raise ValueError(f"Policy table must hold {ENTRY_COUNT} slots, got {len(slots)}")
+        self._slots = slots
+        self._rows = rows
+
+    @classmethod
+    def load(cls, path: str = DEFAULT_PATH) -> "PolicyTable":
+        """Memory-map a table written by write_table."""
+        with open(path, "rb") as file:
+            mapped = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, cell_count, row_count = HEADER.unpack_from(mapped)
+        if magic != MAGIC or version != FORMAT_VERSION or cell_count != CELL_COUNT:
+            raise ValueError(f"{path} is not a version {FORMAT_VERSION} AlphaZero policy table")
+        rows_offset = HEADER.size + 2 * ENTRY_COUNT
+        if len(mapped) != rows_offset + CELL_COUNT * row_count:
+            raise ValueError(f"{path} is truncated")
+        if sys.byteorder == "little":
+            slots = memoryview(mapped)[HEADER.size:rows_offset].cast("H")
+        else:
+            slots = array("H", mapped[HEADER.size:rows_offset])
+            slots.byteswap()
+        return cls(slots, memoryview(mapped)[rows_offset:])
+
+    def weights(self, game_state: GameState) -> Sequence[int]:
+        """The 9 move weights (0 for cells AlphaZero never plays) of a position."""
+        grid = game_state.grid
+        if len(grid.cells) != CELL_COUNT:
+            raise ValueError("The AlphaZero policy table only covers the 3x3 game")
+        row = self._slots[table_index(grid.x_mask, grid.o_mask, game_state.current_mark)]
+        if not row:
+            raise ValueError("Position is not in the AlphaZero policy table")
+        start = (row - 1) * CELL_COUNT
+        return self._rows[start:start + CELL_COUNT]
+
+    def sample(self, game_state: GameState) -> int:
+        """Draw a cell from AlphaZero's move distribution in the position."""
+        return random.choices(range(CELL_COUNT), weights=self.weights(game_state))[0]
+
+
+_table: PolicyTable | None = None
+_table_lock = threading.Lock()
+
+
+def get_policy_table() -> PolicyTable:
+    """Return the process-wide table, memory-mapping the shipped file on first use."""
+    global _table
+    if _table is None:
+        with _table_lock:
+            if _table is None:
+                try:
+                    _table = PolicyTable.load()
+                except FileNotFoundError:
+                    raise ValueError(
+                        "The AlphaZero policy table has not been built, "
+                        "run: python -m tic_tac_toe_ai.models.policy_table")
+    return _table
+
+
+class AlphaZeroTablePlayer(ComputerPlayer):
+    """
+    Plays a move sampled from AlphaZero's distilled move distribution, so no model is loaded
+    and no search runs while serving.
+    """
+
+    @classmethod
+    def warm_up(cls) -> None:
+        get_policy_table()
+
+    def get_computer_move(self, game_state: GameState) -> Move | None:
+        if game_state.grid.size != 3:
+            raise ValueError("AlphaZero was trained on the 3x3 game only")
+        if game_state.game_over:
+            return None
+        return game_state.make_move_to(get_policy_table().sample(game_state))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Distill AlphaZero's moves in every reachable position.")
+    parser.add_argument("--simulations", type=int, default=BUILD_SIMULATIONS, help="MCTS simulations per position")
+    parser.add_argument("--output", default=DEFAULT_PATH, help="where to write the table")
+    args = parser.parse_args()
+    started = time.perf_counter()
+    slots, rows = build(args.simulations)
+    write_table(slots, rows, args.output)
+    size = HEADER.size + 2 * len(slots) + len(rows)
+    print(f"Wrote {len(rows) // CELL_COUNT} positions ({size} bytes) to {args.output} "
+          f"in {time.perf_counter() - started:.0f} seconds")
+
+
+if __name__ == "__main__":
+    main()
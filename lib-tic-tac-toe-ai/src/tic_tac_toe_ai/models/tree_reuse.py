@@ -0,0 +1,180 @@
+"""
+MCTS search trees kept across consecutive moves.
+
+After the AI picks a move, the subtrees below each possible reply of the opponent already
+hold visit counts and values. They are stored by position, so when the opponent answers,
+the next search starts from the matching subtree instead of an empty tree and only tops
+it up to the simulation target.
+
+Positions are keyed by the pyspiel board, so a stored tree serves any game that reaches
+that position. Trees are taken out of the store when reused, so no two searches ever share
+a node. Finished positions are never stored, and trees are evicted after ttl_seconds
+without use or beyond max_trees (least recently stored first).
+"""
+import threading
+import time
+from collections import OrderedDict
+
+from open_spiel.python.algorithms import mcts
+
+TREE_TTL_SECONDS = 300.0
+MAX_TREES = 10_000
+
+
+def position_key(state) -> str:
+    """The board of a pyspiel tic-tac-toe state, which also determines the player to move."""
+    return str(state)
+
+
+class SearchTreeStore:
+    """Thread-safe LRU of MCTS subtrees by position, with idle expiry."""
+
+    def __init__(self, max_trees: int = MAX_TREES, ttl_seconds: float = TREE_TTL_SECONDS):
+        if max_trees < 1:
+            raise ValueError("max_trees must be at least 1")
+        self.max_trees = max_trees
+        self.ttl_seconds = ttl_seconds
+        self._trees: OrderedDict[str, tuple[mcts.SearchNode, float]] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._trees)
+
+    def take(self, key: str) -> mcts.SearchNode | None:
+        """Remove and return the tree stored for a position, if it has not expired."""
+        with self._lock:
+            entry = self._trees.pop(key, None)
+            if entry is None or time.monotonic() - entry[1] > self.ttl_seconds:
+                self.misses += 1
+                self.evictions += entry is not None
+                return None
+            self.hits += 1
+            return entry[0]
+
+    def put(self, key: str, node: mcts.SearchNode) -> None:
+        now = time.monotonic()
+        with self._lock:
+            self._trees[key] = (node, now)
+            self._trees.move_to_end(key)
+            self._evict(now)
+
+    def _evict(self, now: float) -> None:
+        # entries are ordered by the time they were stored, so expired ones are at the front
+        while self._trees:
+            _, stored = next(iter(self._trees.values()))
+            if len(self._trees) <= self.max_trees and now - stored <= self.ttl_seconds:
+                break
+            self._trees.popitem(last=False)
+            self.evictions += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._trees.clear()
+            self.hits = self.misses = self.evictions = 0
+
+    def stats(self) -> dict[str, int | float]:
+        lookups = self.hits + self.misses
+        return {
+            "size": len(self._trees),
+            "max_trees": self.max_trees,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+        }
+
+
+class ReusableMCTSBot(mcts.MCTSBot):
+    """
+    MCTSBot that can continue searching an existing tree, optionally within a time budget.
+
+    max_simulations is the number of visits the root should have after the search, so a
+    reused tree that is already well explored needs only a few more simulations. With a
+    time_budget (seconds) the search also stops once the budget is spent. It always stops
+    as soon as the root is solved. last_simulations holds the number of simulations the
+    last search ran.
+    """
+    last_simulations = 0
+
+    def mcts_search(
+        self,
+        state,
+        root: mcts.SearchNode | None = None,
+        time_budget: float | None = None,
+        max_simulations: int | None = None,
+    ) -> mcts.SearchNode:
+        if root is None:
+            root = mcts.SearchNode(None, state.current_player(), 1)
+        max_simulations = self.max_simulations if max_simulations is None else max_simulations
+        deadline = None if time_budget is None else time.perf_counter() + time_budget
+        self.last_simulations = 0
+        while root.outcome is None and root.explore_count < max_simulations:
+            self._simulate(root, state)
+            self.last_simulations += 1
+            if deadline is not None and time.perf_counter() >= deadline:
+                break
+        if not root.children:
+            # a root is expanded on its second visit, so this only happens with max_simulations <= 1
+            self._simulate(root, state)
+            self.last_simulations += 1
+        return root
+
+    def _simulate(self, root: mcts.SearchNode, state) -> None:
+        """One simulation: select and expand a leaf, evaluate it and back the result up."""
+        visit_path, working_state = self._apply_tree_policy(root, state)
+        if working_state.is_terminal():
+            returns = working_state.returns()
+            visit_path[-1].outcome = returns
+            solved = self.solve
+        else:
+            returns = self.evaluator.evaluate(working_state)
+            solved = False
+
+        while visit_path:
+            # tic-tac-toe has no chance nodes, so the decision-maker is the node's own player
+            node = visit_path.pop()
+            node.total_reward += returns[node.player]
+            node.explore_count += 1
+
+            if solved and node.children:
+                player = node.children[0].player
+                best = None
+                all_solved = True
+                for child in node.children:
+                    if child.outcome is None:
+                        all_solved = False
+                    elif best is None or child.outcome[player] > best.outcome[player]:
+                        best = child
+                if best is not None and (all_solved or best.outcome[player] == self.max_utility):
+                    node.outcome = best.outcome
+                else:
+                    solved = False
+
+    def step_with_tree(
+        self,
+        state,
+        root: mcts.SearchNode | None = None,
+        time_budget: float | None = None,
+        max_simulations: int | None = None,
+    ) -> tuple[int, mcts.SearchNode]:
+        """Search from state (continuing root if given) and return the chosen action and its node."""
+        best = self.mcts_search(state, root, time_budget, max_simulations).best_child()
+        return best.action, best
+
+
+def store_replies(store: SearchTreeStore, state, chosen: mcts.SearchNode) -> None:
+    """Store the subtree below every explored opponent reply to the chosen action."""
+    after_move = state.clone()
+    after_move.apply_action(chosen.action)
+    if after_move.is_terminal():
+        return
+    for reply in chosen.children:
+        if reply.explore_count == 0 or reply.outcome is not None:
+            continue
+        after_reply = after_move.clone()
+        after_reply.apply_action(reply.action)
+        if not after_reply.is_terminal():
+            store.put(position_key(after_reply), reply)
@@ -0,0 +1,22 @@
+import numpy as np
+import pytest
+
+
+class UniformModel:
+    """A network with no opinion: every position is even and every legal move as likely."""
+
+    def inference(self, observations, masks):
+        masks = np.asarray(masks, dtype=np.float32)
+        return np.zeros((len(masks), 1), dtype=np.float32), masks / masks.sum(axis=1, keepdims=True)
+
+
+@pytest.fixture
+def context(monkeypatch):
+    """A fresh process-wide AlphaZeroContext whose network is a UniformModel; needs open_spiel."""
+    pytest.importorskip("pyspiel")
+    from tic_tac_toe_ai.models.alphazeromodel import AlphaZeroModel
+    from tic_tac_toe_ai.models.context import AlphaZeroContext
+
+    monkeypatch.setattr(AlphaZeroModel, "_instance", UniformModel())
+    monkeypatch.setattr(AlphaZeroContext, "_instance", None)
+    return AlphaZeroContext.get()
@@ -0,0 +1,93 @@
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pytest
+
+from tic_tac_toe.logic.models import GameState, Grid, Mark
+from tic_tac_toe_ai.models.batching import Histogram, InferenceBatcher
+
+
+class SummingModel:
+    """Values each position by the sum of its observation; records the size of every call."""
+
+    def __init__(self, fail: bool = False) -> None:
+        self.fail = fail
+        self.batch_sizes = []
+
+    def inference(self, observations, masks):
+        self.batch_sizes.append(len(observations))
+        if self.fail:
+            raise RuntimeError("model failed")
+        values = observations.sum(axis=1, keepdims=True)
+        return values, masks / masks.sum(axis=1, keepdims=True)
+
+
+def infer_concurrently(batcher: InferenceBatcher, count: int) -> list:
+    """Run count searches at once, each inferring the position filled with its number."""
+    for _ in range(count):
+        batcher.search_started()
+    try:
+        with ThreadPoolExecutor(max_workers=count) as executor:
+            return list(executor.map(
+                lambda i: batcher.infer(np.full(4, i, dtype=np.float32), np.array([1, 1, 0, 1], dtype=bool)),
+                range(count),
+            ))
+    finally:
+        for _ in range(count):
+            batcher.search_finished()
+
+
+def test_concurrent_searches_share_model_calls():
+    model = SummingModel()
+    batcher = InferenceBatcher(model, max_batch_size=8, max_wait=0.05)
+    results = infer_concurrently(batcher, 8)
+    # each search gets the answer for its own position
+    for i, (value, policy) in enumerate(results):
+        assert value == 4 * i
+        np.testing.assert_allclose(policy, [1 / 3, 1 / 3, 0, 1 / 3])
+    assert sum(model.batch_sizes) == 8
+    assert max(model.batch_sizes) > 1
+    stats = batcher.stats()
+    assert stats["batch_size"]["count"] == len(model.batch_sizes)
+    assert stats["active_searches"] == 0
+
+
+def test_concurrent_moves_share_the_context_batcher(context):
+    from tic_tac_toe_ai.models.players import AlphaZeroStatelessComputerPlayer
+
+    player = AlphaZeroStatelessComputerPlayer(Mark.CROSS, delay_seconds=0)
+    states = [GameState(Grid()), GameState(Grid("XO       ")), GameState(Grid("X   O    "))]
+    moves = player.get_computer_moves(states)
+    assert all(move is not None for move in moves)
+    assert context.stats()["batching"]["batch_size"]["count"] > 0
+
+
+def test_a_lone_search_is_not_delayed():
+    model = SummingModel()
+    batcher = InferenceBatcher(model, max_wait=10)
+    batcher.search_started()
+    value, _ = batcher.infer(np.ones(4, dtype=np.float32), np.ones(4, dtype=bool))
+    batcher.search_finished()
+    assert value == 4
+    assert model.batch_sizes == [1]
+
+
+def test_model_errors_reach_every_search_in_the_batch():
+    batcher = InferenceBatcher(SummingModel(fail=True), max_wait=0.05)
+    with pytest.raises(RuntimeError, match="model failed"):
+        batcher.infer(np.ones(4, dtype=np.float32), np.ones(4, dtype=bool))
+
+
+def test_histogram_buckets():
+    histogram = Histogram((1, 2, 4))
+    for value in (0.5, 1, 3, 9):
+        histogram.observe(value)
+    snapshot = histogram.snapshot()
+    assert snapshot["count"] == 4
+    assert snapshot["mean"] == pytest.approx(3.375)
+    assert snapshot["buckets"] == {"<=1": 2, "<=2": 0, "<=4": 1, ">4": 1}
+
+
+def test_batch_size_must_be_positive():
+    with pytest.raises(ValueError):
+        InferenceBatcher(SummingModel(), max_batch_size=0)
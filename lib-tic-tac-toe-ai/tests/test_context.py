@@ -0,0 +1,32 @@
+"""The shared AlphaZero context, with a stand-in network (see conftest.py); needs open_spiel."""
+import pytest
+
+pytest.importorskip("pyspiel")
+
+from tic_tac_toe.logic.models import GameState, Grid, Mark  # noqa: E402
+from tic_tac_toe_ai.models.context import AlphaZeroContext, combine_moves  # noqa: E402
+from tic_tac_toe_ai.models.players import AlphaZeroStatelessComputerPlayer  # noqa: E402
+
+
+def test_combine_moves_alternates_marks():
+    state = GameState(Grid("XOX O   X"))
+    assert combine_moves(state) == [("X", 0), ("O", 1), ("X", 2), ("O", 4), ("X", 8)]
+
+
+def test_one_context_per_process(context):
+    assert AlphaZeroContext.get() is context
+    player = AlphaZeroStatelessComputerPlayer(Mark.CROSS, delay_seconds=0)
+    state = GameState(Grid())
+    for _ in range(3):
+        assert player.get_computer_move(state) is not None
+    stats = context.stats()
+    assert stats["checkouts"] == 3
+    # the bot is returned to the pool and lent again
+    assert stats["bots_created"] == 1
+
+
+def test_pyspiel_states_are_built_from_their_parents(context):
+    state = GameState(Grid("XO  X    "))
+    spiel_state = context.state_for(state)
+    assert spiel_state is context.state_for(state)
+    assert spiel_state.legal_actions() == list(state.possible_move_indices)
@@ -0,0 +1,99 @@
+import random
+import threading
+import time
+
+import numpy as np
+import pytest
+
+from tic_tac_toe.logic.models import GameState, Grid, Mark
+from tic_tac_toe.logic.solved_table import get_solved_table
+from tic_tac_toe_ai.models.native_mcts import NativeMCTS, NetworkEvaluator, observation, single_inference
+
+
+def uniform_inference(observation_tensor, legals_mask):
+    """A network with no opinion: every position is even and every legal move as likely."""
+    return 0.0, legals_mask / legals_mask.sum()
+
+
+def search(max_simulations: int = 200, seed: int = 0) -> NativeMCTS:
+    return NativeMCTS(NetworkEvaluator(uniform_inference), max_simulations=max_simulations, rng=random.Random(seed))
+
+
+def test_observation_planes():
+    tensor = observation(0b000000001, 0b000010000).reshape(3, 9)
+    assert tensor[0].tolist() == [0, 1, 1, 1, 0, 1, 1, 1, 1]
+    assert tensor[1].tolist() == [0, 0, 0, 0, 1, 0, 0, 0, 0]
+    assert tensor[2].tolist() == [1, 0, 0, 0, 0, 0, 0, 0, 0]
+
+
+@pytest.mark.parametrize("cells, starting_mark, best", [
+    ("XX OO    ", Mark.CROSS, 2),  # X wins
+    ("OO XX    ", Mark.NAUGHT, 2),  # O wins
+    ("XX  O    ", Mark.CROSS, 2),  # O blocks
+    ("X   O   X", Mark.CROSS, None),  # O must not play a corner
+])
+def test_search_plays_a_solved_best_move(cells, starting_mark, best):
+    state = GameState(Grid(cells), starting_mark)
+    move = search().find_best_move(state)
+    assert move.cell_index in get_solved_table().best_moves(state)
+    if best is not None:
+        assert move.cell_index == best
+
+
+def test_finished_games_have_no_move():
+    assert search().find_best_move(GameState(Grid("XXXOO    "))) is None
+
+
+def test_only_the_3x3_game_is_searched():
+    with pytest.raises(ValueError):
+        search().find_best_move(GameState(Grid.empty(4)))
+
+
+def test_time_budget_stops_the_search():
+    mcts = search(max_simulations=10**9)
+    started = time.perf_counter()
+    mcts.find_best_move(GameState(Grid()), time_budget=0.05)
+    assert time.perf_counter() - started < 1.0
+    assert 0 < mcts.last_simulations < 10**9
+
+
+def test_a_solved_root_stops_the_search_early():
+    mcts = search(max_simulations=10**6)
+    mcts.find_best_move(GameState(Grid("XX OO    ")))
+    assert mcts.last_simulations < 100
+    assert mcts.root_policy()[2] == 1.0
+
+
+def test_root_policy_is_a_distribution_over_legal_moves():
+    mcts = search(max_simulations=50)
+    mcts.find_best_move(GameState(Grid("X   O    ")))
+    policy = mcts.root_policy()
+    assert sum(policy) == pytest.approx(1.0)
+    assert policy[0] == policy[4] == 0
+
+
+def test_network_evaluations_are_cached():
+    calls = []
+
+    def infer(observation_tensor, legals_mask):
+        calls.append(1)
+        return uniform_inference(observation_tensor, legals_mask)
+
+    evaluator = NetworkEvaluator(infer, cache_size=2)
+    evaluator.evaluate(1, 0)
+    evaluator.evaluate(1, 0)
+    evaluator.evaluate(2, 0)
+    evaluator.evaluate(4, 0)
+    evaluator.evaluate(1, 0)
+    assert len(calls) == 4
+    assert evaluator.stats() == {"hits": 1, "misses": 4, "size": 2}
+
+
+def test_single_inference_unbatches_a_model():
+    class Model:
+        def inference(self, observations, masks):
+            return np.array([[0.5]]), np.array(masks, dtype=float)
+
+    value, policy = single_inference(Model(), threading.Lock())(np.zeros(27), np.ones(9, dtype=bool))
+    assert value == 0.5
+    assert policy.tolist() == [1.0] * 9
@@ -0,0 +1,118 @@
+"""The NumPy forward pass, and its match with open_spiel's TensorFlow AlphaZero model."""
+import json
+
+import numpy as np
+import pytest
+
+from tic_tac_toe_ai.models.numpy_model import (
+    CONFIG_PATH,
+    TOLERANCE,
+    NumpyAlphaZeroModel,
+    _conv2d,
+    export_weights,
+    reachable_inputs,
+)
+
+TRAIN_STEPS = 5
+BATCH_SIZE = 128
+
+
+def random_weights(config: dict, rng: np.random.Generator) -> dict[str, np.ndarray]:
+    """Weights of the open_spiel resnet layout for config, with random values."""
+    width, channels = config["nn_width"], config["observation_shape"][-1]
+    shapes = {"torso_in_conv": (3, 3, channels, width)}
+    for i in range(config["nn_depth"]):
+        shapes[f"torso_{i}_res_conv1"] = shapes[f"torso_{i}_res_conv2"] = (3, 3, width, width)
+    shapes["policy_conv"] = (1, 1, width, 2)
+    shapes["value_conv"] = (1, 1, width, 1)
+    weights = {}
+    for name, shape in shapes.items():
+        weights[f"{name}/kernel"] = rng.normal(0, 0.1, shape)
+        weights[f"{name}/bias"] = rng.normal(0, 0.1, shape[-1])
+        batch_norm = name.replace("conv", "batch_norm")
+        weights[f"{batch_norm}/gamma"] = rng.uniform(0.5, 1.5, shape[-1])
+        weights[f"{batch_norm}/beta"] = rng.normal(0, 0.1, shape[-1])
+        weights[f"{batch_norm}/moving_mean"] = rng.normal(0, 0.1, shape[-1])
+        weights[f"{batch_norm}/moving_variance"] = rng.uniform(0.5, 1.5, shape[-1])
+    cells = int(np.prod(config["observation_shape"][:-1]))
+    for name, shape in (
+        ("policy", (cells * 2, config["output_size"])),
+        ("value_dense", (cells, width)),
+        ("value", (width, 1)),
+    ):
+        weights[f"{name}/kernel"] = rng.normal(0, 0.1, shape)
+        weights[f"{name}/bias"] = rng.normal(0, 0.1, shape[-1])
+    return weights
+
+
+def test_conv2d_matches_a_direct_convolution():
+    rng = np.random.default_rng(0)
+    x, kernel, bias = rng.normal(size=(2, 3, 3, 4)), rng.normal(size=(3, 3, 4, 5)), rng.normal(size=5)
+    padded = np.pad(x, ((0, 0), (1, 1), (1, 1), (0, 0)))
+    expected = np.empty((2, 3, 3, 5))
+    for row in range(3):
+        for col in range(3):
+            window = padded[:, row:row + 3, col:col + 3, :]
+            expected[:, row, col, :] = np.tensordot(window, kernel, axes=([1, 2, 3], [0, 1, 2])) + bias
+    np.testing.assert_allclose(_conv2d(x, kernel, bias), expected, atol=1e-9)
+
+
+def test_inference_of_a_random_model():
+    with open(CONFIG_PATH) as file:
+        config = json.load(file)
+    model = NumpyAlphaZeroModel(random_weights(config, np.random.default_rng(0)), config)
+    observations, masks = reachable_inputs()
+    value, policy = model.inference(observations, masks)
+    assert value.shape == (len(observations), 1) and policy.shape == masks.shape
+    assert np.all(np.abs(value) <= 1)
+    np.testing.assert_allclose(policy.sum(axis=1), 1, atol=1e-5)
+    assert np.all(policy[~masks.astype(bool)] == 0)
+    # a position scores the same alone as in a batch
+    single_value, single_policy = model.inference(observations[7:8], masks[7:8])
+    np.testing.assert_allclose(single_value, value[7:8], atol=1e-5)
+    np.testing.assert_allclose(single_policy, policy[7:8], atol=1e-5)
+
+
+@pytest.fixture(scope="module")
+def tf_model(tmp_path_factory):
+    """A TensorFlow model with the shipped config, trained a few steps on random targets."""
+    model_lib = pytest.importorskip("open_spiel.python.algorithms.alpha_zero.model")
+    pytest.importorskip("tensorflow")
+    with open(CONFIG_PATH) as file:
+        config = json.load(file)
+    model = model_lib.Model.build_model(
+        config["nn_model"],
+        config["observation_shape"],
+        config["output_size"],
+        config["nn_width"],
+        config["nn_depth"],
+        config["weight_decay"],
+        config["learning_rate"],
+        str(tmp_path_factory.mktemp("az_model")),
+    )
+    # training moves the batch norm statistics off their identity initial values
+    observations, masks = reachable_inputs()
+    rng = np.random.default_rng(0)
+    for _ in range(TRAIN_STEPS):
+        batch = rng.choice(len(observations), BATCH_SIZE)
+        policies = rng.random(masks[batch].shape) * masks[batch]
+        policies /= policies.sum(axis=1, keepdims=True)
+        values = rng.uniform(-1, 1, BATCH_SIZE)
+        model.update([
+            model_lib.TrainInput(observation, mask, policy, value)
+            for observation, mask, policy, value in zip(observations[batch], masks[batch], policies, values)
+        ])
+    return model
+
+
+def test_exported_weights_match_tensorflow(tf_model, tmp_path):
+    checkpoint = tf_model.save_checkpoint(0)
+    weights_path = str(tmp_path / "weights.npz")
+    export_weights(checkpoint, weights_path)
+
+    observations, masks = reachable_inputs()
+    tf_value, tf_policy = tf_model.inference(observations, masks)
+    np_value, np_policy = NumpyAlphaZeroModel.load(weights_path).inference(observations, masks)
+
+    np.testing.assert_allclose(np_value, tf_value, atol=TOLERANCE)
+    np.testing.assert_allclose(np_policy, tf_policy, atol=TOLERANCE)
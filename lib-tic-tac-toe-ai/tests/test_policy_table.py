@@ -0,0 +1,79 @@
+import os
+from array import array
+
+import pytest
+
+from tic_tac_toe.game.player_factory import PlayerFactory
+from tic_tac_toe.logic.models import GameState, Grid, Mark
+from tic_tac_toe.logic.solved_table import ENTRY_COUNT, get_solved_table, table_index
+from tic_tac_toe_ai.models import policy_table
+from tic_tac_toe_ai.models.policy_table import (
+    DEFAULT_PATH,
+    AlphaZeroTablePlayer,
+    PolicyTable,
+    quantize,
+    reachable_states,
+    write_table,
+)
+
+
+@pytest.fixture(scope="module")
+def table_path(tmp_path_factory) -> str:
+    """A table that spreads each position's weight evenly over its solved best moves."""
+    slots = array("H", bytes(2 * ENTRY_COUNT))
+    rows = bytearray()
+    for row, state in enumerate(reachable_states(), start=1):
+        best_moves = get_solved_table().best_moves(state)
+        slots[table_index(state.grid.x_mask, state.grid.o_mask, state.current_mark)] = row
+        rows += quantize([1 / len(best_moves) if cell in best_moves else 0 for cell in range(9)])
+    path = str(tmp_path_factory.mktemp("policy_table") / "policy_table.bin")
+    write_table(slots, bytes(rows), path)
+    return path
+
+
+def test_reachable_states_cover_both_starting_marks():
+    states = reachable_states()
+    assert not any(state.game_over for state in states)
+    assert {state.starting_mark for state in states if state.game_not_started} == set(Mark)
+    assert len({(state.grid.cells, state.current_mark) for state in states}) == len(states)
+
+
+def test_quantize_keeps_every_played_move():
+    assert list(quantize([0.999, 0.001, 0] + [0] * 6)) == [255, 1, 0] + [0] * 6
+
+
+def test_table_round_trip(table_path):
+    table = PolicyTable.load(table_path)
+    state = GameState(Grid("XX OO    "))
+    assert list(table.weights(state)) == [0, 0, 255, 0, 0, 0, 0, 0, 0]
+    assert list(table.weights(GameState(Grid()))) == [28] * 9
+    for _ in range(20):
+        assert table.sample(GameState(Grid("X   O   X"))) in (1, 3, 5, 7)
+    with pytest.raises(ValueError):
+        table.weights(GameState(Grid("XXXOO    ")))
+    with pytest.raises(ValueError):
+        table.weights(GameState(Grid.empty(4)))
+
+
+def test_truncated_tables_are_rejected(table_path, tmp_path):
+    truncated = tmp_path / "truncated.bin"
+    with open(table_path, "rb") as file:
+        truncated.write_bytes(file.read()[:-1])
+    with pytest.raises(ValueError, match="truncated"):
+        PolicyTable.load(str(truncated))
+
+
+def test_table_player(table_path, monkeypatch):
+    monkeypatch.setattr(policy_table, "_table", PolicyTable.load(table_path))
+    player = AlphaZeroTablePlayer(Mark.NAUGHT, delay_seconds=0)
+    assert player.get_move(GameState(Grid("XX  O    "))).cell_index == 2
+    assert player.get_move(GameState(Grid("XXXOO    "))) is None
+
+
+@pytest.mark.skipif(os.path.exists(DEFAULT_PATH), reason="the policy table has been built")
+def test_table_player_is_only_offered_once_built(monkeypatch):
+    assert "alphazero-table" not in PlayerFactory.get_available_types()
+    with pytest.raises(ValueError, match="has not been built"):
+        PlayerFactory.create_player("alphazero-table", Mark.CROSS)
+    monkeypatch.setitem(PlayerFactory._required_files, "alphazero-table", "tic_tac_toe_ai.models:az_model/config.json")
+    assert "alphazero-table" in PlayerFactory.get_available_types()
@@ -0,0 +1,17 @@
+"""Time-budgeted AlphaZero moves, with a stand-in network (see conftest.py); needs open_spiel."""
+import time
+
+import pytest
+
+pytest.importorskip("pyspiel")
+
+from tic_tac_toe.logic.models import GameState, Grid, Mark  # noqa: E402
+from tic_tac_toe_ai.models.players import AlphaZeroStatelessComputerPlayer  # noqa: E402
+
+
+def test_time_budget_bounds_a_move(context):
+    player = AlphaZeroStatelessComputerPlayer(Mark.CROSS, delay_seconds=0, time_budget=0.05)
+    started = time.perf_counter()
+    assert player.get_computer_move(GameState(Grid())) is not None
+    assert time.perf_counter() - started < 2.0
+    assert player.last_simulations >= 1
@@ -0,0 +1,44 @@
+"""Search trees kept between moves; needs open_spiel."""
+import time
+
+import pytest
+
+pytest.importorskip("open_spiel.python.algorithms.mcts")
+
+from tic_tac_toe.logic.models import GameState, Grid, Mark  # noqa: E402
+from tic_tac_toe_ai.models.tree_reuse import SearchTreeStore, position_key  # noqa: E402
+
+
+def test_search_tree_store():
+    store = SearchTreeStore(max_trees=2, ttl_seconds=60)
+    store.put("a", "tree a")
+    store.put("b", "tree b")
+    store.put("c", "tree c")
+    assert store.take("a") is None
+    assert store.take("b") == "tree b"
+    # a tree is handed out once
+    assert store.take("b") is None
+    stats = store.stats()
+    assert (stats["size"], stats["hits"], stats["misses"], stats["evictions"]) == (1, 1, 2, 1)
+
+
+def test_search_trees_expire():
+    store = SearchTreeStore(ttl_seconds=0.05)
+    store.put("a", "tree a")
+    time.sleep(0.1)
+    assert store.take("a") is None
+
+
+def test_search_trees_are_reused_after_the_opponent_replies(context):
+    from tic_tac_toe_ai.models.players import AlphaZeroStatelessComputerPlayer
+
+    player = AlphaZeroStatelessComputerPlayer(Mark.CROSS, delay_seconds=0)
+    after_move = player.get_computer_move(GameState(Grid())).after_state
+    assert context.trees.stats()["size"] > 0
+    stored = [
+        move.after_state for move in after_move.iter_moves()
+        if position_key(context.state_for(move.after_state)) in context.trees._trees
+    ]
+    assert stored
+    player.get_computer_move(stored[0])
+    assert context.trees.stats()["hits"] == 1
@@ -0,0 +1,60 @@
+"""
+Compare playing many games one after another with TicTacToe against playing them
+concurrently on one event loop with AsyncTicTacToe.
+
+Both use the same synchronous RandomComputerPlayer with a small thinking delay, which
+stands in for time a player spends waiting (a remote engine, a human client). The sync
+engine sleeps through every delay; the async driver awaits them, so the games overlap
+and a single process keeps thousands of them going. Moves run in the loop's default
+executor through SyncPlayerAdapter.
+
+Run from the top-level project folder:
+`python lib-tic-tac-toe/benchmarks/bench_async_games.py`
+"""
+import asyncio
+import time
+
+from tic_tac_toe.game.engine import AsyncTicTacToe, TicTacToe
+from tic_tac_toe.game.players import RandomComputerPlayer
+from tic_tac_toe.game.renderers import Renderer
+from tic_tac_toe.logic.models import GameState, Mark
+
+DELAY_SECONDS = 0.01
+SYNC_GAMES = 20
+ASYNC_GAMES = (100, 1000, 5000)
+
+
+class NullRenderer(Renderer):
+    def render(self, game_state: GameState) -> None:
+        pass
+
+
+def players() -> tuple[RandomComputerPlayer, RandomComputerPlayer]:
+    return RandomComputerPlayer(Mark("X"), DELAY_SECONDS), RandomComputerPlayer(Mark("O"), DELAY_SECONDS)
+
+
+def bench_sync(games: int) -> float:
+    started = time.perf_counter()
+    for _ in range(games):
+        TicTacToe(*players(), NullRenderer()).play()
+    return time.perf_counter() - started
+
+
+async def bench_async(games: int) -> float:
+    started = time.perf_counter()
+    await asyncio.gather(*(AsyncTicTacToe(*players(), NullRenderer()).play() for _ in range(games)))
+    return time.perf_counter() - started
+
+
+def main() -> None:
+    print(f"random vs random, {DELAY_SECONDS * 1e3:.0f} ms thinking delay per move\n")
+    print(f"{'driver':<16}{'games':>8}{'seconds':>10}{'games/s':>10}")
+    seconds = bench_sync(SYNC_GAMES)
+    print(f"{'TicTacToe':<16}{SYNC_GAMES:>8}{seconds:>10.2f}{SYNC_GAMES / seconds:>10.0f}")
+    for games in ASYNC_GAMES:
+        seconds = asyncio.run(bench_async(games))
+        print(f"{'AsyncTicTacToe':<16}{games:>8}{seconds:>10.2f}{games / seconds:>10.0f}")
+
+
+if __name__ == "__main__":
+    main()
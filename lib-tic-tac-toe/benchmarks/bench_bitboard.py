@@ -0,0 +1,124 @@
+"""
+Benchmark the bitboard-backed Grid/GameState against the original string/regex implementation.
+
+Run from the top-level project folder:
+`python lib-tic-tac-toe/benchmarks/bench_bitboard.py`
+"""
+import re
+import timeit
+
+from tic_tac_toe.logic.bitboard import iter_bits, mark_mask
+from tic_tac_toe.logic.models import WINNING_PATTERNS, GameState, Grid, Mark
+
+
+# --- reference: the string/regex scans GameState and Grid used before bitboards ---
+
+def regex_winner(cells: str) -> Mark | None:
+    for pattern in WINNING_PATTERNS:
+        for mark in Mark:
+            if re.match(pattern.replace("?", mark), cells):
+                return mark
+    return None
+
+
+def regex_winning_cells(cells: str) -> list[int]:
+    for pattern in WINNING_PATTERNS:
+        for mark in Mark:
+            if re.match(pattern.replace("?", mark), cells):
+                return [match.start() for match in re.finditer(r"\?", pattern)]
+    return []
+
+
+def regex_empty_cells(cells: str) -> list[int]:
+    return [match.start() for match in re.finditer(r"\s", cells)]
+
+
+def string_counts(cells: str) -> tuple[int, int, int]:
+    return cells.count("X"), cells.count("O"), cells.count(" ")
+
+
+# --- bitboard: call the property implementations directly so nothing is served from cache ---
+
+_winning_line = GameState.winning_line.func
+
+
+def bitboard_winner(state: GameState) -> Mark | None:
+    return _winning_line(state)[0]
+
+
+def bitboard_winning_cells(state: GameState) -> list[int]:
+    return list(iter_bits(_winning_line(state)[1]))
+
+
+def bitboard_masks(cells: str) -> tuple[int, int]:
+    return mark_mask(cells, "X"), mark_mask(cells, "O")
+
+
+def bitboard_empty_cells(masks: tuple[int, int]) -> list[int]:
+    return list(iter_bits(0x1FF & ~(masks[0] | masks[1])))
+
+
+def bitboard_counts(masks: tuple[int, int]) -> tuple[int, int, int]:
+    x_mask, o_mask = masks
+    return x_mask.bit_count(), o_mask.bit_count(), 9 - (x_mask | o_mask).bit_count()
+
+
+def reachable_states() -> list[GameState]:
+    """Every reachable position with X starting, including finished games."""
+    seen = {}
+    pending = [GameState(Grid())]
+    while pending:
+        state = pending.pop()
+        if state.grid.cells not in seen:
+            seen[state.grid.cells] = state
+            pending.extend(move.after_state for move in state.possible_moves)
+    return list(seen.values())
+
+
+def _time(label: str, func, number: int = 10) -> float:
+    seconds = min(timeit.repeat(func, number=number, repeat=5)) / number
+    print(f"  {label:<14} {seconds * 1e3:8.3f} ms")
+    return seconds
+
+
+def main() -> None:
+    states = reachable_states()
+    all_cells = [state.grid.cells for state in states]
+    # Grid computes its two masks once and caches them, like the property implementations below
+    all_masks = [bitboard_masks(cells) for cells in all_cells]
+    print(f"{len(states)} reachable positions per pass\n")
+
+    # both implementations must agree before their timings mean anything
+    for state in states:
+        assert bitboard_winner(state) == regex_winner(state.grid.cells)
+        assert bitboard_winning_cells(state) == regex_winning_cells(state.grid.cells)
+        masks = bitboard_masks(state.grid.cells)
+        assert bitboard_empty_cells(masks) == regex_empty_cells(state.grid.cells)
+        assert bitboard_counts(masks) == string_counts(state.grid.cells)
+
+    comparisons = [
+        ("winner",
+         lambda: [regex_winner(cells) for cells in all_cells],
+         lambda: [bitboard_winner(state) for state in states]),
+        ("winning_cells",
+         lambda: [regex_winning_cells(cells) for cells in all_cells],
+         lambda: [bitboard_winning_cells(state) for state in states]),
+        ("empty cells",
+         lambda: [regex_empty_cells(cells) for cells in all_cells],
+         lambda: [bitboard_empty_cells(masks) for masks in all_masks]),
+        ("x/o/empty counts",
+         lambda: [string_counts(cells) for cells in all_cells],
+         lambda: [bitboard_counts(masks) for masks in all_masks]),
+    ]
+    for name, string_version, bitboard_version in comparisons:
+        print(name)
+        before = _time("string/regex", string_version)
+        after = _time("bitboard", bitboard_version)
+        print(f"  speedup        {before / after:8.1f}x\n")
+
+    print("one-time mask build per Grid (amortized across the properties above)")
+    _time("bitboard", lambda: [bitboard_masks(cells) for cells in all_cells])
+
+
+if __name__ == "__main__":
+    main()
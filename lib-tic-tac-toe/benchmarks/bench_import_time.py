@@ -0,0 +1,83 @@
+"""
+Measure the cold start of each frontend: the time a fresh interpreter takes to import it.
+
+Every target is imported in a new process (run REPEAT times, median reported), with the
+interpreter's own start-up subtracted. Python's -X importtime output shows which
+top-level imports dominate. Computer players are imported lazily by the player factory,
+so a frontend should not pay for numpy, pyspiel, open_spiel or TensorFlow until an
+AlphaZero player is created.
+
+Run from the top-level project folder:
+`python lib-tic-tac-toe/benchmarks/bench_import_time.py`
+"""
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+REPEAT = 5
+
+# name, statement, working directory
+TARGETS = [
+    ("player factory", "import tic_tac_toe.game.player_factory", ROOT),
+    ("console", "import frontends.console.cli", ROOT),
+    ("console args (-X human -O random)", "import frontends.console.args", ROOT),
+    ("gui", "import frontends.gui.board", ROOT),
+    ("backend", "import server", os.path.join(ROOT, "backend")),
+    ("alphazero player", "import tic_tac_toe_ai.models.players", ROOT),
+]
+
+HEAVY_MODULES = ("numpy", "pyspiel", "open_spiel", "tensorflow")
+
+
+def run(statement: str, cwd: str) -> tuple[float, str]:
+    started = time.perf_counter()
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement], cwd=cwd, capture_output=True, text=True
+    )
+    elapsed = time.perf_counter() - started
+    if result.returncode:
+        raise RuntimeError(result.stderr.strip().splitlines()[-1])
+    return elapsed, result.stderr
+
+
+def parse_imports(importtime_output: str) -> list[tuple[int, int, str]]:
+    """(cumulative microseconds, nesting depth, module) of every import, slowest first."""
+    imports = []
+    for line in importtime_output.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        # top-level imports are preceded by one space, nested ones by two more per level
+        depth = (len(name) - len(name.lstrip()) - 1) // 2
+        imports.append((int(cumulative), depth, name.strip()))
+    return sorted(imports, reverse=True)
+
+
+def main() -> None:
+    baseline_runs = [run("pass", ROOT) for _ in range(REPEAT)]
+    baseline = statistics.median(seconds for seconds, _ in baseline_runs)
+    startup_modules = {module for _, _, module in parse_imports(baseline_runs[-1][1])}
+    print(f"interpreter start-up: {baseline * 1e3:.0f} ms (subtracted below)\n")
+    print(f"{'target':<36}{'import ms':>10}  {'heavy modules loaded':<24}slowest imports (ms)")
+    for name, statement, cwd in TARGETS:
+        try:
+            runs = [run(statement, cwd) for _ in range(REPEAT)]
+        except RuntimeError as error:
+            print(f"{name:<36}{'n/a':>10}  ({error})")
+            continue
+        elapsed = statistics.median(seconds for seconds, _ in runs) - baseline
+        target = statement.split()[-1]
+        imports = [entry for entry in parse_imports(runs[-1][1]) if entry[2] not in startup_modules]
+        loaded = {module.split(".")[0] for _, _, module in imports}
+        heavy = ", ".join(module for module in HEAVY_MODULES if module in loaded) or "none"
+        # what the frontend itself imports directly
+        slowest = [(us, module) for us, depth, module in imports if depth == 1 or depth == 0 and module != target]
+        listed = ", ".join(f"{module} {us / 1e3:.0f}" for us, module in slowest[:3])
+        print(f"{name:<36}{elapsed * 1e3:>10.0f}  {heavy:<24}{listed}")
+
+
+if __name__ == "__main__":
+    main()
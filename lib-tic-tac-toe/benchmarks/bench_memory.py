@@ -0,0 +1,69 @@
+"""
+Measure the memory one find_best_move call allocates (peak) and leaves behind (retained).
+
+GameState and Grid are slotted and no longer cache their Move lists, and a Move only holds
+its before_state weakly, so after a search the explored tree is kept alive by nothing but
+the bounded STATE_CACHE. The "eager tree" row rebuilds the old behaviour, where every
+searched state kept the list of its moves and therefore every descendant, for comparison.
+
+Run from the top-level project folder:
+`python lib-tic-tac-toe/benchmarks/bench_memory.py`
+"""
+import gc
+import sys
+import tracemalloc
+
+from tic_tac_toe.logic.engines import AlphaBetaEngine, MinimaxEngine
+from tic_tac_toe.logic.models import STATE_CACHE, GameState, Grid, Mark
+
+POSITION = GameState(Grid("X        "), Mark.CROSS)
+
+
+def eager_search(state: GameState, expanded: dict) -> None:
+    """Full-tree walk that keeps every state's moves, like the old cached possible_moves."""
+    moves = expanded.setdefault(state, state.possible_moves)
+    for move in moves:
+        if move.after_state not in expanded:
+            eager_search(move.after_state, expanded)
+
+
+def measure(search) -> tuple[float, float]:
+    """Return (peak, retained) KiB allocated by search(), starting from an empty cache."""
+    STATE_CACHE.clear()
+    root = GameState(Grid(POSITION.grid.cells), POSITION.starting_mark)
+    gc.collect()
+    tracemalloc.start()
+    kept = search(root)
+    gc.collect()
+    retained, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del kept
+    return peak / 1024, retained / 1024
+
+
+def main() -> None:
+    state = GameState(Grid())
+    move = state.make_move_to(4)
+    print("instance sizes (bytes, without cached values)")
+    print(f"  GameState {sys.getsizeof(state):>5}  Grid {sys.getsizeof(state.grid):>5}"
+          f"  Move {sys.getsizeof(move):>5}")
+    print()
+    print(f"{'search':<34}{'peak KiB':>12}{'retained KiB':>14}")
+    default_size = STATE_CACHE.max_size
+    try:
+        for max_size in (None, 100_000, 1_000):
+            STATE_CACHE.resize(max_size)
+            label = "unbounded" if max_size is None else f"max_size={max_size:,}"
+            for engine in (MinimaxEngine(table=None), AlphaBetaEngine(table=None)):
+                peak, retained = measure(engine.find_best_move)
+                print(f"{engine.name + ', cache ' + label:<34}{peak:>12.0f}{retained:>14.0f}")
+        STATE_CACHE.resize(None)
+        peak, retained = measure(lambda root: eager_search(root, expanded := {}) or expanded)
+        print(f"{'eager tree, cache unbounded':<34}{peak:>12.0f}{retained:>14.0f}")
+    finally:
+        STATE_CACHE.resize(default_size)
+        STATE_CACHE.clear()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,40 @@
+"""
+Compare node counts and latency of the search engines on the same positions.
+
+Run from the top-level project folder:
+`python lib-tic-tac-toe/benchmarks/bench_search_engines.py`
+"""
+import time
+
+from tic_tac_toe.logic.engines import ENGINES, create_engine
+from tic_tac_toe.logic.models import STATE_CACHE, GameState, Grid, Mark
+
+POSITIONS = [
+    GameState(Grid("         "), Mark.CROSS),
+    GameState(Grid("X        "), Mark.CROSS),
+    GameState(Grid("    X    "), Mark.CROSS),
+    GameState(Grid("X   O    "), Mark.CROSS),
+    GameState(Grid("X O X    "), Mark.CROSS),
+    GameState(Grid("XO  X   O"), Mark.CROSS),
+]
+
+
+def main() -> None:
+    print(f"{'position':<12}{'engine':<12}{'move':>6}{'nodes':>10}{'ms':>10}")
+    for state in POSITIONS:
+        for name in ENGINES:
+            # no transposition table so that node counts reflect the search itself
+            engine = create_engine(name)
+            # a fresh copy of the position and an empty interning cache so that
+            # no cached child states are shared between engines
+            STATE_CACHE.clear()
+            fresh = GameState(Grid(state.grid.cells), state.starting_mark)
+            started = time.perf_counter()
+            move = engine.find_best_move(fresh)
+            elapsed = time.perf_counter() - started
+            print(f"{state.grid.cells.replace(' ', '.'):<12}{name:<12}{move.cell_index:>6}"
+                  f"{engine.nodes:>10}{elapsed * 1e3:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+"""
+Compare the compact encoded_state format (tic_tac_toe.api.state_codec) with the legacy
+base64 JSON format: encoded size and encode/decode latency.
+
+Decoding the legacy format parses JSON and validates the state; a compact 3x3 state is a
+lookup in the table of reachable positions. The states are a sample of unfinished 3x3
+positions and a few larger boards. Timings are per call, best of REPEAT runs.
+
+Run from the top-level project folder:
+`python lib-tic-tac-toe/benchmarks/bench_serializer.py`
+"""
+import random
+import timeit
+
+from tic_tac_toe.api.serializers import GameStateSerializer
+from tic_tac_toe.logic.models import GameState, Grid, Mark
+
+REPEAT = 5
+CALLS = 2000
+SAMPLE_SIZE = 200
+
+
+def sample_states(size: int, count: int) -> list[GameState]:
+    rng = random.Random(size)
+    states = []
+    while len(states) < count:
+        state = GameState.intern(Grid.empty(size), rng.choice(list(Mark)))
+        for _ in range(rng.randrange(size * size)):
+            state = state.make_move_to(rng.choice(state.possible_move_indices)).after_state
+            if state.game_over:
+                break
+        # the legacy format loses the starting mark of some finished games, so it can't decode them all
+        if not state.game_over:
+            states.append(state)
+    return states
+
+
+def per_call_us(function, arguments: list) -> float:
+    calls = max(CALLS // len(arguments), 1) * len(arguments)
+    timer = timeit.Timer(lambda: [function(argument) for argument in arguments])
+    return min(timer.repeat(REPEAT, calls // len(arguments))) / calls * 1e6
+
+
+def main() -> None:
+    GameStateSerializer.warm_up()
+    print(f"{'board':<8}{'format':<8}{'mean chars':>12}{'encode us':>12}{'decode us':>12}")
+    for size in (3, 7, 15):
+        states = sample_states(size, SAMPLE_SIZE if size == 3 else SAMPLE_SIZE // 10)
+        formats = [
+            ("legacy", GameStateSerializer.encode_legacy, GameStateSerializer.decode),
+            ("compact", GameStateSerializer.encode, GameStateSerializer.decode),
+        ]
+        for name, encode, decode in formats:
+            encoded = [encode(state) for state in states]
+            assert [decode(token) for token in encoded] == states
+            mean_chars = sum(map(len, encoded)) / len(encoded)
+            encode_us = per_call_us(encode, states)
+            decode_us = per_call_us(decode, encoded)
+            board = f"{size}x{size}"
+            print(f"{board:<8}{name:<8}{mean_chars:>12.0f}{encode_us:>12.1f}{decode_us:>12.1f}")
+
+
+if __name__ == "__main__":
+    main()
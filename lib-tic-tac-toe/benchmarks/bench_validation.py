@@ -0,0 +1,49 @@
+"""
+Measure what validating engine-derived states costs a full-tree minimax search.
+
+GameState.make_move_to builds child states through a trusted constructor that skips the
+grid regex and the mark/winner validators; this compares it with validating every child.
+
+Run from the top-level project folder:
+`python lib-tic-tac-toe/benchmarks/bench_validation.py`
+"""
+import time
+
+from tic_tac_toe.logic import models
+from tic_tac_toe.logic.engines import MinimaxEngine
+from tic_tac_toe.logic.models import STATE_CACHE, GameState, Grid, Mark
+
+POSITIONS = [
+    GameState(Grid("         "), Mark.CROSS),
+    GameState(Grid("X        "), Mark.CROSS),
+    GameState(Grid("X   O    "), Mark.CROSS),
+]
+
+
+def search(state: GameState, validate: bool) -> tuple[int, int, float]:
+    models.VALIDATE_DERIVED_STATES = validate
+    try:
+        # no transposition table: every node of the full tree is built and scored
+        engine = MinimaxEngine(table=None)
+        # empty the interning cache so that every child state is built again
+        STATE_CACHE.clear()
+        fresh = GameState(Grid(state.grid.cells), state.starting_mark)
+        started = time.perf_counter()
+        move = engine.find_best_move(fresh)
+        return move.cell_index, engine.nodes, time.perf_counter() - started
+    finally:
+        models.VALIDATE_DERIVED_STATES = False
+
+
+def main() -> None:
+    print(f"{'position':<12}{'nodes':>10}{'validated ms':>15}{'trusted ms':>13}{'speedup':>10}")
+    for state in POSITIONS:
+        validated_move, nodes, validated = search(state, validate=True)
+        trusted_move, trusted_nodes, trusted = search(state, validate=False)
+        assert (validated_move, nodes) == (trusted_move, trusted_nodes)
+        print(f"{state.grid.cells.replace(' ', '.'):<12}{nodes:>10}"
+              f"{validated * 1e3:>15.1f}{trusted * 1e3:>13.1f}{validated / trusted:>9.1f}x")
+
+
+if __name__ == "__main__":
+    main()
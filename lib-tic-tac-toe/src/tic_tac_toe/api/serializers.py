@@ -4,9 +4,13 @@ Serialization utilities for converting between library data structures and API f
 import json
 import base64
 from typing import Dict, Any
-from dataclasses import asdict
 
+from ..logic.interning import InternCache
 from ..logic.models import GameState, Grid, Mark
+from . import state_codec
+
+# JSON bodies of API responses by position; large enough for every reachable 3x3 position
+RESPONSE_CACHE: InternCache[bytes] = InternCache(max_size=50_000)
 
 
 class GameStateSerializer:
@@ -34,6 +38,8 @@ class GameStateSerializer:
         
         result = {
             "board": board,
+            "size": game_state.grid.size,
+            "win_length": game_state.grid.win_length,
             "current_player": current_player,
             "status": status,
             "message": message,
@@ -50,7 +56,7 @@ class GameStateSerializer:
         """Convert dictionary format back to GameState."""
         # Convert board list to grid string
         grid_cells = "".join(" " if cell == "" else cell for cell in state_dict["board"])
-        grid = Grid(grid_cells)
+        grid = Grid(grid_cells, state_dict.get("win_length"))
         
         # Determine starting mark based on the board state
         if grid.x_count > grid.o_count:
@@ -60,21 +66,59 @@ class GameStateSerializer:
         else:
             starting_mark = Mark(state_dict.get("current_player", "X"))
         
-        return GameState(grid, starting_mark)
+        return GameState.intern(grid, starting_mark)
     
     @staticmethod
     def encode(game_state: GameState) -> str:
-        """Encode game state to a base64 string."""
-        state_dict = GameStateSerializer.to_dict(game_state)
-        state_json = json.dumps(state_dict)
-        return base64.b64encode(state_json.encode()).decode()
+        """Encode game state to a compact URL-safe string (see state_codec)."""
+        return state_codec.encode(game_state)
     
     @staticmethod
     def decode(encoded_state: str) -> GameState:
-        """Decode base64 string back to game state."""
+        """Decode a compact string, or a base64 JSON string from before the compact format."""
         try:
-            state_json = base64.b64decode(encoded_state.encode()).decode()
-            state_dict = json.loads(state_json)
-            return GameStateSerializer.from_dict(state_dict)
+            if state_codec.is_legacy(encoded_state):
+                return GameStateSerializer.decode_legacy(encoded_state)
+            return state_codec.decode(encoded_state)
         except Exception as e:
             raise ValueError(f"Invalid game state encoding: {str(e)}")
+
+    @staticmethod
+    def to_response_json(game_state: GameState) -> bytes:
+        """
+        The JSON body {"game_state": ..., "encoded_state": ...} of an API response, serialized
+        once per position and then served from RESPONSE_CACHE.
+        """
+        grid = game_state.grid
+        return RESPONSE_CACHE.get_or_create(
+            (grid.cells, grid.win_length, game_state.starting_mark),
+            lambda: json.dumps(
+                {
+                    "game_state": GameStateSerializer.to_dict(game_state),
+                    "encoded_state": GameStateSerializer.encode(game_state),
+                },
+                # what FastAPI's JSONResponse would send
+                ensure_ascii=False,
+                separators=(",", ":"),
+            ).encode(),
+        )
+
+    @staticmethod
+    def warm_up() -> None:
+        """Build the table compact 3x3 states are decoded with, and their responses."""
+        for game_state in state_codec.get_decode_table().values():
+            GameStateSerializer.to_response_json(game_state)
+
+    @staticmethod
+    def encode_legacy(game_state: GameState) -> str:
+        """Encode game state to the base64 JSON string used before the compact format."""
+        state_dict = GameStateSerializer.to_dict(game_state)
+        state_json = json.dumps(state_dict)
+        return base64.b64encode(state_json.encode()).decode()
+    
+    @staticmethod
+    def decode_legacy(encoded_state: str) -> GameState:
+        """Decode a base64 JSON string back to game state."""
+        state_json = base64.b64decode(encoded_state.encode()).decode()
+        state_dict = json.loads(state_json)
+        return GameStateSerializer.from_dict(state_dict)
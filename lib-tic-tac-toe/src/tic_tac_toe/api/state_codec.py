@@ -0,0 +1,111 @@
+"""
+Compact, versioned binary encoding of a GameState for the encoded_state API field.
+
+Layout (big-endian), URL-safe base64 without padding:
+
+    byte 0      format version in the high nibble, board size - 3 in the low nibble
+    byte 1      win length (only for boards larger than 3x3)
+    the rest    base-3 board (cell i weighs 3**i; empty 0, X 1, O 2), times 2, plus 1 if O
+                started; in the fewest bytes that hold any board of that size
+
+A 3x3 state is 3 bytes, 4 characters. The JSON format used before always starts with "eyJ"
+(base64 of '{"'), which this layout never does, so both are told apart by their prefix.
+
+Decoding a 3x3 state is a lookup in a table of every reachable position, built once, and
+returns the shared state without validating it again; other states (larger boards, and any
+3x3 position the table does not hold) are validated like any new state.
+"""
+import base64
+import binascii
+import threading
+
+from ..logic.models import GameState, Grid, Mark, default_win_length
+
+FORMAT_VERSION = 1
+LEGACY_PREFIX = "eyJ"
+
+_DIGITS = {" ": 0, "X": 1, "O": 2}
+_CELLS = " XO"
+
+
+def _payload_size(size: int) -> int:
+    return ((3 ** (size * size) * 2 - 1).bit_length() + 7) // 8
+
+
+def _state_code(game_state: GameState) -> int:
+    board = 0
+    for cell in reversed(game_state.grid.cells):
+        board = board * 3 + _DIGITS[cell]
+    return board * 2 + (game_state.starting_mark is Mark.NAUGHT)
+
+
+def _reachable_states() -> dict[int, GameState]:
+    """Every 3x3 position reachable from the empty board with either mark starting, by code."""
+    states = {}
+    for starting_mark in Mark:
+        pending = [GameState.intern(Grid(), starting_mark)]
+        while pending:
+            state = pending.pop()
+            code = _state_code(state)
+            if code in states:
+                continue
+            states[code] = state
+            if not state.game_over:
+                pending.extend(move.after_state for move in state.iter_moves())
+    return states
+
+
+_decode_table: dict[int, GameState] | None = None
+_decode_table_lock = threading.Lock()
+
+
+def get_decode_table() -> dict[int, GameState]:
+    """Return the process-wide table of 3x3 states by code, building it on first use."""
+    global _decode_table
+    if _decode_table is None:
+        with _decode_table_lock:
+            if _decode_table is None:
+                _decode_table = _reachable_states()
+    return _decode_table
+
+
+def is_legacy(encoded_state: str) -> bool:
+    """Whether an encoded state is in the base64 JSON format used before FORMAT_VERSION 1."""
+    return encoded_state.startswith(LEGACY_PREFIX)
+
+
+def encode(game_state: GameState) -> str:
+    grid = game_state.grid
+    header = bytes([FORMAT_VERSION << 4 | grid.size - 3])
+    if grid.size > 3:
+        header += bytes([grid.win_length])
+    data = header + _state_code(game_state).to_bytes(_payload_size(grid.size), "big")
+    return base64.urlsafe_b64encode(data).rstrip(b"=").decode()
+
+
+def decode(encoded_state: str) -> GameState:
+    """Decode a state written by encode; raises ValueError if it is malformed or invalid."""
+    try:
+        data = base64.urlsafe_b64decode(encoded_state + "=" * (-len(encoded_state) % 4))
+    except (binascii.Error, ValueError):
+        raise ValueError("Not URL-safe base64")
+    if not data or data[0] >> 4 != FORMAT_VERSION:
+        raise ValueError(f"Not a version {FORMAT_VERSION} encoded state")
+    size = (data[0] & 0x0F) + 3
+    offset = 2 if size > 3 else 1
+    if len(data) != offset + _payload_size(size):
+        raise ValueError("Encoded state has the wrong length")
+    win_length = data[1] if size > 3 else default_win_length(size)
+    code = int.from_bytes(data[offset:], "big")
+    if size == 3 and (game_state := get_decode_table().get(code)) is not None:
+        return game_state
+
+    board, starting = divmod(code, 2)
+    if board >= 3 ** (size * size):
+        raise ValueError("Encoded board is out of range")
+    cells = []
+    for _ in range(size * size):
+        board, digit = divmod(board, 3)
+        cells.append(_CELLS[digit])
+    starting_mark = Mark.NAUGHT if starting else Mark.CROSS
+    return GameState.intern(Grid("".join(cells), win_length), starting_mark)
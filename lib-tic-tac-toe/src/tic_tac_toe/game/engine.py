@@ -1,7 +1,9 @@
-from dataclasses import dataclass
+import asyncio
+from concurrent.futures import Executor
+from dataclasses import dataclass, field
 from typing import Callable, TypeAlias
 
-from tic_tac_toe.game.players import Player
+from tic_tac_toe.game.players import AsyncPlayer, Player, as_async
 from tic_tac_toe.game.renderers import Renderer
 from tic_tac_toe.logic.exceptions import InvalidMove
 from tic_tac_toe.logic.models import GameState, Grid, Mark
@@ -31,8 +33,8 @@ class TicTacToe:
             if self.error_handler:
                 self.error_handler(ex)
 
-    def play(self, starting_mark: Mark = Mark("X")) -> None:
-        game_state = GameState(Grid(), starting_mark)
+    def play(self, starting_mark: Mark = Mark("X"), grid: Grid | None = None) -> None:
+        game_state = GameState.intern(grid or Grid(), starting_mark)
         while True:
             self.renderer.render(game_state)
             if game_state.game_over:
@@ -44,3 +46,53 @@ class TicTacToe:
             return self.player1
         else:
             return self.player2
+
+
+@dataclass(frozen=True)
+class AsyncTicTacToe:
+    """
+    Drives a game on the running event loop, so many games can be played concurrently.
+
+    Players may be AsyncPlayers or synchronous Players, which run in the executor (the loop's
+    default one if not given). With a move_timeout, a player that has not moved within that
+    many seconds is cancelled and play() raises TimeoutError.
+    """
+    player1: Player | AsyncPlayer
+    player2: Player | AsyncPlayer
+    renderer: Renderer
+    error_handler: ErrorHandler | None = None
+    move_timeout: float | None = None
+    executor: Executor | None = None
+    _async_players: tuple[AsyncPlayer, AsyncPlayer] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        validate_players(self.player1, self.player2)
+        # wrap synchronous players once, rather than on every move
+        players = (as_async(self.player1, self.executor), as_async(self.player2, self.executor))
+        object.__setattr__(self, "_async_players", players)
+
+    async def next_move(self, game_state: GameState) -> GameState:
+        """Return the state after the current player's move, or the same state if the move was invalid."""
+        if game_state.game_over:
+            return game_state
+        player = self.get_current_player(game_state)
+        try:
+            async with asyncio.timeout(self.move_timeout):
+                return await player.make_move(game_state)
+        except InvalidMove as ex:
+            if self.error_handler:
+                self.error_handler(ex)
+            return game_state
+
+    async def play(self, starting_mark: Mark = Mark("X"), grid: Grid | None = None) -> GameState:
+        """Play the game to the end and return the final state."""
+        game_state = GameState.intern(grid or Grid(), starting_mark)
+        while True:
+            self.renderer.render(game_state)
+            if game_state.game_over:
+                return game_state
+            game_state = await self.next_move(game_state)
+
+    def get_current_player(self, game_state: GameState) -> AsyncPlayer:
+        player1, player2 = self._async_players
+        return player1 if game_state.current_mark is player1.mark else player2
@@ -2,28 +2,62 @@
 Game service that handles game logic and player management.
 Separates game logic from API concerns.
 """
-from typing import Dict, Any, Optional
+import time
+import uuid
+from typing import Dict, Any, Iterable, List, Optional, Tuple, Union
 from ..logic.models import GameState, Grid, Mark
 from ..logic.exceptions import InvalidMove
 from .player_factory import PlayerFactory
-from ..api.serializers import GameStateSerializer
+from .session_store import MemorySessionStore
+from ..api.serializers import RESPONSE_CACHE, GameStateSerializer
 
 
 class GameService:
     """Service class that handles game logic and player management."""
     
-    def __init__(self):
+    def __init__(self, session_store: Optional[MemorySessionStore] = None):
         self.player_factory = PlayerFactory()
+        self.session_store = session_store if session_store is not None else MemorySessionStore()
+        self.search_stats: Dict[str, Dict[str, int]] = {}
     
-    def create_initial_game_state(self) -> GameState:
-        """Create a new initial game state."""
-        return GameState(Grid(), Mark("X"))
+    def __getstate__(self) -> Dict[str, Any]:
+        # pickled to compute moves in worker processes, which never see the stored games
+        return {"player_factory": self.player_factory}
+    
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        self.session_store = MemorySessionStore()
+        self.search_stats = {}
+    
+    def create_game(self, game_state: GameState) -> str:
+        """Store a game server-side and return its new game_id."""
+        game_id = uuid.uuid4().hex
+        self.session_store.put(game_id, game_state)
+        return game_id
+    
+    def load_game(self, game_id: str) -> GameState:
+        """Get the current state of a stored game."""
+        game_state = self.session_store.get(game_id)
+        if game_state is None:
+            raise ValueError(f"Unknown or expired game_id: {game_id}")
+        return game_state
+    
+    def save_game(self, game_id: str, game_state: GameState, expected: Optional[GameState] = None) -> None:
+        """
+        Store a game's new state. With expected, raise SessionConflict unless the game is still
+        in that state, so that only one of two concurrent moves in a game is kept.
+        """
+        self.session_store.put(game_id, game_state, expected)
+    
+    def create_initial_game_state(self, size: int = 3, win_length: Optional[int] = None) -> GameState:
+        """Create a new initial game state on a size x size board (win_length in a row wins)."""
+        return GameState.intern(Grid.empty(size, win_length), Mark("X"))
     
     def make_move(self, game_state: GameState, move_index: int) -> GameState:
         """Make a move on the game state."""
         if game_state.game_over:
             raise ValueError("Game is already over.")
-        if not 0 <= move_index < 9:
+        if not 0 <= move_index < len(game_state.grid.cells):
             raise ValueError("Invalid move index.")
         
         try:
@@ -32,35 +66,143 @@ class GameService:
         except InvalidMove as e:
             raise ValueError(str(e))
     
-    def make_computer_move(self, game_state: GameState, player_type: str) -> GameState:
-        """Make a computer move based on the player type."""
+    def make_computer_move(
+        self, game_state: GameState, player_type: str, difficulty: Optional[str] = None
+    ) -> GameState:
+        """Make a computer move based on the player type and an optional difficulty preset."""
+        return self.search_computer_move(game_state, player_type, difficulty)[0]
+    
+    def search_computer_move(
+        self, game_state: GameState, player_type: str, difficulty: Optional[str] = None
+    ) -> Tuple[GameState, Optional[int]]:
+        """
+        Make a computer move like make_computer_move, and also return how many simulations the
+        player's search ran (AlphaZero players), or None for players that do not report it.
+        Moves may be made in worker processes, so the caller passes the count to record_search.
+        """
         if game_state.game_over:
             raise ValueError("Cannot make move: game is already over")
         
         if not self.player_factory.is_computer_player(player_type):
             raise ValueError(f"Player type '{player_type}' is not a computer player")
         
-        # Create a temporary player instance to make the move
-        player = self.player_factory.create_player(player_type, game_state.current_mark)
+        # Create a temporary player instance to make the move, without the artificial
+        # thinking delay: clients animate it themselves and a sleep would hold a worker
+        player = self.player_factory.create_player(
+            player_type, game_state.current_mark, difficulty=difficulty, delay_seconds=0)
         move = player.get_move(game_state)
         
         if move is None:
             raise ValueError("Computer player failed to make a move")
         
-        return move.after_state
+        return move.after_state, getattr(player, "last_simulations", None)
+    
+    def record_search(self, player_type: str, simulations: Optional[int]) -> None:
+        """Count the simulations of a computer move in the search stats of its player type."""
+        if simulations is None:
+            return
+        stats = self.search_stats.setdefault(player_type, {"moves": 0, "simulations": 0, "last_simulations": 0})
+        stats["moves"] += 1
+        stats["simulations"] += simulations
+        stats["last_simulations"] = simulations
+    
+    def make_computer_moves(
+        self, game_states: List[GameState], player_type: str, difficulty: Optional[str] = None
+    ) -> List[Union[GameState, ValueError]]:
+        """
+        Make a computer move in each game state, with one player per mark for all of them so the
+        player type can share work between positions (see ComputerPlayer.get_computer_moves).
+        Returns, in order, each new state or the ValueError make_computer_move would raise.
+        """
+        if not self.player_factory.is_computer_player(player_type):
+            raise ValueError(f"Player type '{player_type}' is not a computer player")
+        
+        results: List[Union[GameState, ValueError]] = [None] * len(game_states)
+        indices_by_mark: Dict[Mark, List[int]] = {}
+        for index, game_state in enumerate(game_states):
+            if game_state.game_over:
+                results[index] = ValueError("Cannot make move: game is already over")
+            else:
+                indices_by_mark.setdefault(game_state.current_mark, []).append(index)
+        
+        for mark, indices in indices_by_mark.items():
+            player = self.player_factory.create_player(player_type, mark, difficulty=difficulty)
+            states = [game_states[index] for index in indices]
+            try:
+                moves = player.get_computer_moves(states)
+            except ValueError:
+                # one position failed; move them one by one to tell which
+                moves = []
+                for game_state in states:
+                    try:
+                        moves.append(player.get_computer_move(game_state))
+                    except ValueError as e:
+                        moves.append(e)
+            for index, move in zip(indices, moves):
+                if isinstance(move, ValueError):
+                    results[index] = move
+                elif move is None:
+                    results[index] = ValueError("Computer player failed to make a move")
+                else:
+                    results[index] = move.after_state
+        return results
     
     def get_game_state_dict(self, game_state: GameState) -> Dict[str, Any]:
         """Get game state as dictionary for API response."""
         return GameStateSerializer.to_dict(game_state)
     
+    def get_response_json(self, game_state: GameState) -> bytes:
+        """Get the cached JSON body (game_state and encoded_state) of an API response."""
+        return GameStateSerializer.to_response_json(game_state)
+    
+    def get_response_cache_stats(self) -> Dict[str, Any]:
+        """Get size, hit rate and memory of the cached API responses."""
+        return RESPONSE_CACHE.stats()
+    
+    def get_search_stats(self) -> Dict[str, Dict[str, Any]]:
+        """Get the recorded moves and simulations (total, mean, last) per player type."""
+        return {
+            player_type: {**stats, "mean_simulations": stats["simulations"] / stats["moves"]}
+            for player_type, stats in self.search_stats.items()
+        }
+    
+    def get_session_stats(self) -> Dict[str, Any]:
+        """Get size, hit rate and write latency of the session store."""
+        return self.session_store.stats()
+    
     def encode_game_state(self, game_state: GameState) -> str:
-        """Encode game state to base64 string."""
+        """Encode game state to a compact URL-safe string."""
         return GameStateSerializer.encode(game_state)
     
     def decode_game_state(self, encoded_state: str) -> GameState:
-        """Decode base64 string to game state."""
+        """Decode a compact (or legacy base64 JSON) string to game state."""
         return GameStateSerializer.decode(encoded_state)
     
     def get_available_player_types(self) -> list[str]:
         """Get list of available player types."""
         return self.player_factory.get_available_types()
+
+    def get_difficulties(self) -> list[str]:
+        """Get list of difficulty presets for computer players."""
+        return self.player_factory.get_difficulties()
+
+    def warm_up(self, player_types: Optional[Iterable[str]] = None) -> Dict[str, Dict[str, Any]]:
+        """
+        Load the engines of the given player types (all available ones by default) ahead of
+        their first move, and the 3x3 responses ("api_responses"). Returns the status and load
+        time of each; a type that fails to load is reported as "failed" with the error
+        instead of raising.
+        """
+        if player_types is None:
+            player_types = self.get_available_player_types()
+        started = time.perf_counter()
+        GameStateSerializer.warm_up()
+        engines = {"api_responses": {"status": "ready", "seconds": round(time.perf_counter() - started, 4)}}
+        for player_type in player_types:
+            try:
+                seconds = self.player_factory.warm_up(player_type)
+            except Exception as e:
+                engines[player_type] = {"status": "failed", "error": str(e)}
+            else:
+                engines[player_type] = {"status": "ready", "seconds": round(seconds, 4)}
+        return engines
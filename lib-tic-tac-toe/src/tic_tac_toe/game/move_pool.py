@@ -0,0 +1,163 @@
+"""
+Worker pool that runs computer moves off the asyncio event loop.
+
+Searches (minimax, MCTS) are CPU-bound and synchronous, so running them inside an async
+request handler stalls every other request of the worker. ComputerMovePool runs them in a
+thread pool, or in a process pool to also use several cores, while the handler awaits.
+
+Each player type may have at most its limit of moves running at once; further moves wait
+in that type's queue, and once max_queue moves are waiting new ones are rejected with
+MovePoolBusy, so a burst of expensive AlphaZero moves cannot hold up cheap minimax ones
+or grow without bound.
+
+Process workers are spawned rather than forked: a fork copies whatever locks other threads
+of the server hold at that moment (e.g. the startup warm-up's), and a child that inherits
+a held lock hangs forever.
+"""
+import asyncio
+import multiprocessing
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass
+from functools import partial
+from typing import Any, Callable, Dict, Optional
+
+DEFAULT_WORKERS = 4
+DEFAULT_MAX_QUEUE = 32
+EXECUTOR_KINDS = ("thread", "process")
+
+
+class MovePoolBusy(Exception):
+    """Raised when a player type already has max_queue moves waiting."""
+
+
+@dataclass
+class _TypeStats:
+    running: int = 0
+    queued: int = 0
+    peak_queued: int = 0
+    completed: int = 0
+    failed: int = 0
+    rejected: int = 0
+    wait_seconds: float = 0.0
+    run_seconds: float = 0.0
+
+
+class ComputerMovePool:
+    """
+    Runs move functions in a thread or process pool with per-player-type concurrency limits.
+
+    Player types without an entry in limits may use every worker. Use it from a single
+    event loop; the queue bookkeeping is not thread-safe.
+    """
+
+    def __init__(
+        self,
+        workers: int = DEFAULT_WORKERS,
+        kind: str = "thread",
+        limits: Optional[Dict[str, int]] = None,
+        max_queue: int = DEFAULT_MAX_QUEUE,
+        initializer: Optional[Callable[[], Any]] = None,
+    ) -> None:
+        if kind not in EXECUTOR_KINDS:
+            raise ValueError(f"Unknown executor kind: {kind}. Available kinds: {', '.join(EXECUTOR_KINDS)}")
+        if workers < 1:
+            raise ValueError("workers must be at least 1")
+        if any(limit < 1 for limit in (limits or {}).values()):
+            raise ValueError("Concurrency limits must be at least 1")
+        self.workers = workers
+        self.kind = kind
+        self.limits = dict(limits or {})
+        self.max_queue = max_queue
+        self._initializer = initializer
+        self._executor: Executor | None = None
+        self._semaphores: Dict[str, asyncio.Semaphore] = {}
+        self._stats: Dict[str, _TypeStats] = {}
+
+    @property
+    def executor(self) -> Executor:
+        """The pool, started on first use."""
+        if self._executor is None:
+            if self.kind == "thread":
+                self._executor = ThreadPoolExecutor(max_workers=self.workers, initializer=self._initializer)
+            else:
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.workers,
+                    mp_context=multiprocessing.get_context("spawn"),
+                    initializer=self._initializer,
+                )
+        return self._executor
+
+    def limit(self, player_type: str) -> int:
+        """How many moves of a player type may run at once."""
+        return min(self.limits.get(player_type, self.workers), self.workers)
+
+    async def run(self, player_type: str, function: Callable[..., Any], *args: Any) -> Any:
+        """
+        Run function(*args) in the pool once player_type is below its limit, and return its result.
+
+        With a process pool, function and args must be picklable. Exceptions raised by
+        function are re-raised here; MovePoolBusy is raised if the type's queue is full.
+        """
+        stats = self._stats.setdefault(player_type, _TypeStats())
+        if stats.queued >= self.max_queue:
+            stats.rejected += 1
+            raise MovePoolBusy(f"Too many '{player_type}' moves waiting, try again later")
+        semaphore = self._semaphores.get(player_type)
+        if semaphore is None:
+            semaphore = self._semaphores[player_type] = asyncio.Semaphore(self.limit(player_type))
+
+        queued_at = time.perf_counter()
+        stats.queued += 1
+        stats.peak_queued = max(stats.peak_queued, stats.queued)
+        try:
+            await semaphore.acquire()
+        finally:
+            stats.queued -= 1
+        started = time.perf_counter()
+        stats.running += 1
+        try:
+            loop = asyncio.get_running_loop()
+            result = await loop.run_in_executor(self.executor, partial(function, *args))
+        except Exception:
+            stats.failed += 1
+            raise
+        else:
+            # timings cover completed moves only, so failing moves do not skew them
+            stats.completed += 1
+            stats.wait_seconds += started - queued_at
+            stats.run_seconds += time.perf_counter() - started
+            return result
+        finally:
+            stats.running -= 1
+            semaphore.release()
+
+    def stats(self) -> Dict[str, Any]:
+        """Queue depth, running moves and timings, in total and per player type."""
+        types = {}
+        for player_type, stats in self._stats.items():
+            types[player_type] = {
+                "limit": self.limit(player_type),
+                "running": stats.running,
+                "queued": stats.queued,
+                "peak_queued": stats.peak_queued,
+                "completed": stats.completed,
+                "failed": stats.failed,
+                "rejected": stats.rejected,
+                "mean_wait_ms": 1e3 * stats.wait_seconds / stats.completed if stats.completed else 0.0,
+                "mean_run_ms": 1e3 * stats.run_seconds / stats.completed if stats.completed else 0.0,
+            }
+        return {
+            "kind": self.kind,
+            "workers": self.workers,
+            "max_queue": self.max_queue,
+            "running": sum(stats.running for stats in self._stats.values()),
+            "queued": sum(stats.queued for stats in self._stats.values()),
+            "player_types": types,
+        }
+
+    def shutdown(self) -> None:
+        """Stop the pool, dropping moves that have not started."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
@@ -2,57 +2,133 @@
 Factory for creating player instances based on type strings.
 Unifies player creation across different frontends.
 """
-from typing import Dict, Type, Optional
+import importlib
+import importlib.resources
+import importlib.util
+import time
+from typing import Dict, Type, Optional, Union
 from ..logic.models import Mark
-from .players import Player, RandomComputerPlayer, MinimaxComputerPlayer
+from .players import Player, RandomComputerPlayer, MinimaxComputerPlayer, SolvedTablePlayer
 
-# Import AI players with error handling
-try:
-    from tic_tac_toe_ai.models.players import AlphaZeroStatelessComputerPlayer
-    AI_AVAILABLE = True
-except ImportError as e:
-    print(f"Error importing AlphaZeroStatelessComputerPlayer: {e}")
-    AI_AVAILABLE = False
-    AlphaZeroStatelessComputerPlayer = None
+# A player class, or where to import it from as "package.module:ClassName". Classes given
+# as strings are only imported on first use, so heavy dependencies (numpy, pyspiel,
+# open_spiel, TensorFlow) are not loaded by processes that never create those players.
+PlayerSpec = Union[Type[Player], str]
+
+# Per-move search time budgets (seconds) of the difficulty presets
+DIFFICULTY_PRESETS: Dict[str, float] = {
+    "easy": 0.02,
+    "medium": 0.1,
+    "hard": 1.0,
+}
 
 
 class PlayerFactory:
     """Factory for creating player instances based on type strings."""
     
     # Registry of available player types
-    _player_types: Dict[str, Type[Player]] = {
+    _player_types: Dict[str, PlayerSpec] = {
         "random": RandomComputerPlayer,
         "minimax": MinimaxComputerPlayer,
+        "solved": SolvedTablePlayer,
+        "alphazero": "tic_tac_toe_ai.models.players:AlphaZeroStatelessComputerPlayer",
+        "alphazero-native": "tic_tac_toe_ai.models.players:AlphaZeroNativeComputerPlayer",
+        "alphazero-table": "tic_tac_toe_ai.models.policy_table:AlphaZeroTablePlayer",
+    }
+
+    # Data files, as "package:relative/path", that player types need besides their package;
+    # such a type is only available once its file has been built
+    _required_files: Dict[str, str] = {
+        "alphazero-table": "tic_tac_toe_ai.models:az_model/policy_table.bin",
     }
+
+    # Player types whose strength depends on a search time budget
+    _time_budgeted_types = {"minimax", "alphazero", "alphazero-native"}
     
     @classmethod
-    def register_player_type(cls, player_type: str, player_class: Type[Player]) -> None:
-        """Register a new player type."""
+    def register_player_type(cls, player_type: str, player_class: PlayerSpec) -> None:
+        """Register a new player type, as a class or lazily as "package.module:ClassName"."""
         cls._player_types[player_type] = player_class
+
+    @staticmethod
+    def _is_installed(spec: PlayerSpec) -> bool:
+        """Whether a player's top-level package can be imported, without importing it."""
+        if not isinstance(spec, str):
+            return True
+        return importlib.util.find_spec(spec.partition(":")[0].split(".")[0]) is not None
+
+    @classmethod
+    def _has_required_file(cls, player_type: str) -> bool:
+        """Whether the data file a player type needs, if any, exists (imports only its package)."""
+        if player_type not in cls._required_files:
+            return True
+        package, _, path = cls._required_files[player_type].partition(":")
+        return importlib.resources.files(package).joinpath(path).is_file()
+
+    @classmethod
+    def _resolve(cls, player_type: str) -> Type[Player]:
+        """Return the player class of a type, importing it on first use."""
+        spec = cls._player_types[player_type]
+        if isinstance(spec, str):
+            module_name, _, class_name = spec.partition(":")
+            try:
+                spec = getattr(importlib.import_module(module_name), class_name)
+            except ImportError as e:
+                raise ValueError(f"Player type '{player_type}' is not available: {e}")
+            cls._player_types[player_type] = spec
+        if not cls._has_required_file(player_type):
+            raise ValueError(
+                f"Player type '{player_type}' is not available: {cls._required_files[player_type]} has not been built")
+        return spec
     
     @classmethod
     def get_available_types(cls) -> list[str]:
         """Get list of available player types."""
-        types = list(cls._player_types.keys())
-        if AI_AVAILABLE:
-            types.append("alphazero")
-        return types
+        return [
+            player_type for player_type, spec in cls._player_types.items()
+            if cls._is_installed(spec) and cls._has_required_file(player_type)
+        ]
     
     @classmethod
-    def create_player(cls, player_type: str, mark: Mark) -> Player:
-        """Create a player instance of the specified type."""
-        if player_type == "alphazero":
-            if not AI_AVAILABLE:
-                raise ValueError("AlphaZero player not available - tic_tac_toe_ai module not found")
-            return AlphaZeroStatelessComputerPlayer(mark)
+    def get_difficulties(cls) -> list[str]:
+        """Get list of difficulty presets."""
+        return list(DIFFICULTY_PRESETS)
+
+    @classmethod
+    def create_player(
+        cls, player_type: str, mark: Mark, difficulty: Optional[str] = None, **options
+    ) -> Player:
+        """
+        Create a player instance of the specified type.
+
+        A difficulty preset sets the time_budget of players that search (minimax on large
+        boards, alphazero); other player types play the same at every difficulty.
+        Extra keyword options (e.g. time_budget) are passed to the player's constructor.
+        """
+        if difficulty is not None:
+            if difficulty not in DIFFICULTY_PRESETS:
+                available = ", ".join(DIFFICULTY_PRESETS)
+                raise ValueError(f"Unknown difficulty: {difficulty}. Available difficulties: {available}")
+            if player_type in cls._time_budgeted_types:
+                options.setdefault("time_budget", DIFFICULTY_PRESETS[difficulty])
         
         if player_type not in cls._player_types:
             available = ", ".join(cls.get_available_types())
             raise ValueError(f"Unknown player type: {player_type}. Available types: {available}")
         
-        player_class = cls._player_types[player_type]
-        return player_class(mark)
+        player_class = cls._resolve(player_type)
+        return player_class(mark, **options)
     
+    @classmethod
+    def warm_up(cls, player_type: str) -> float:
+        """Import a player type and load what it needs; return the seconds this took."""
+        if player_type not in cls._player_types:
+            available = ", ".join(cls.get_available_types())
+            raise ValueError(f"Unknown player type: {player_type}. Available types: {available}")
+        started = time.perf_counter()
+        cls._resolve(player_type).warm_up()
+        return time.perf_counter() - started
+
     @classmethod
     def is_computer_player(cls, player_type: str) -> bool:
         """Check if a player type is a computer player."""
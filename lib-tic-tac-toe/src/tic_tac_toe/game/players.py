@@ -1,9 +1,14 @@
 import abc
+import asyncio
+import random
 import time
+from concurrent.futures import Executor
 
+from tic_tac_toe.logic.engines import IterativeDeepeningEngine
 from tic_tac_toe.logic.exceptions import InvalidMove
 from tic_tac_toe.logic.minimax import find_best_move
-from tic_tac_toe.logic.models import GameState, Mark, Move
+from tic_tac_toe.logic.models import GameState, Grid, Mark, Move
+from tic_tac_toe.logic.solved_table import get_solved_table
 
 
 class Player(metaclass=abc.ABCMeta):
@@ -22,6 +27,10 @@ class Player(metaclass=abc.ABCMeta):
     def get_move(self, game_state: GameState) -> Move | None:
         """Return the current player's move in the given game state."""
 
+    @classmethod
+    def warm_up(cls) -> None:
+        """Load whatever the player type needs (tables, models, caches) before its first move."""
+
 
 class ComputerPlayer(Player, metaclass=abc.ABCMeta):
     def __init__(self, mark: Mark, delay_seconds: float = 0.25) -> None:
@@ -36,6 +45,14 @@ class ComputerPlayer(Player, metaclass=abc.ABCMeta):
     def get_computer_move(self, game_state: GameState) -> Move | None:
         """Return the computer's move in the given game state."""
 
+    def get_computer_moves(self, game_states: list[GameState]) -> list[Move | None]:
+        """
+        Return the computer's moves in several game states, without the delay.
+
+        Players override this when positions searched together can share work.
+        """
+        return [self.get_computer_move(game_state) for game_state in game_states]
+
 
 class RandomComputerPlayer(ComputerPlayer):
     def get_computer_move(self, game_state: GameState) -> Move | None:
@@ -43,8 +60,115 @@ class RandomComputerPlayer(ComputerPlayer):
 
 
 class MinimaxComputerPlayer(ComputerPlayer):
+    """
+    Plays the minimax-optimal move on the 3x3 grid.
+
+    Larger boards cannot be searched exhaustively, so there it plays the best move an
+    iterative-deepening search finds within time_budget seconds.
+    """
+
+    def __init__(
+        self,
+        mark: Mark,
+        delay_seconds: float = 0.25,
+        engine: str | None = None,
+        time_budget: float = 1.0,
+    ) -> None:
+        super().__init__(mark, delay_seconds)
+        self.engine = engine
+        self.time_budget = time_budget
+
+    @classmethod
+    def warm_up(cls) -> None:
+        """Search every reply to the opening moves, which fills the shared transposition table."""
+        for move in GameState(Grid(), Mark.CROSS).iter_moves():
+            find_best_move(move.after_state)
+
     def get_computer_move(self, game_state: GameState) -> Move | None:
+        if game_state.grid.size != 3:
+            engine = IterativeDeepeningEngine(time_budget=self.time_budget)
+            return find_best_move(game_state, engine=engine)
         if game_state.game_not_started:
             return game_state.make_random_move()
         else:
-            return find_best_move(game_state)
+            return find_best_move(game_state, engine=self.engine)
+
+
+class SolvedTablePlayer(ComputerPlayer):
+    """Plays a random optimal move looked up in the precomputed solved-game table."""
+
+    @classmethod
+    def warm_up(cls) -> None:
+        get_solved_table()
+
+    def get_computer_move(self, game_state: GameState) -> Move | None:
+        if game_state.game_over:
+            return None
+        best_moves = get_solved_table().best_moves(game_state)
+        return game_state.make_move_to(random.choice(best_moves))
+
+
+class AsyncPlayer(metaclass=abc.ABCMeta):
+    """
+    A player whose moves are awaited, so one event loop can run many games while players think.
+
+    Moves are cancelled like any other coroutine (task.cancel() or asyncio.timeout), which is
+    how AsyncTicTacToe enforces its move deadline.
+    """
+
+    def __init__(self, mark: Mark) -> None:
+        self.mark = mark
+
+    async def make_move(self, game_state: GameState) -> GameState:
+        if self.mark is game_state.current_mark:
+            if move := await self.get_move(game_state):
+                return move.after_state
+            raise InvalidMove("No more possible moves")
+        else:
+            raise InvalidMove("It's the other player's turn")
+
+    @abc.abstractmethod
+    async def get_move(self, game_state: GameState) -> Move | None:
+        """Return the current player's move in the given game state."""
+
+
+class AsyncComputerPlayer(AsyncPlayer, metaclass=abc.ABCMeta):
+    def __init__(self, mark: Mark, delay_seconds: float = 0.25) -> None:
+        super().__init__(mark)
+        self.delay_seconds = delay_seconds
+
+    async def get_move(self, game_state: GameState) -> Move | None:
+        await asyncio.sleep(self.delay_seconds)
+        return await self.get_computer_move(game_state)
+
+    @abc.abstractmethod
+    async def get_computer_move(self, game_state: GameState) -> Move | None:
+        """Return the computer's move in the given game state."""
+
+
+class SyncPlayerAdapter(AsyncPlayer):
+    """
+    Runs a synchronous player's get_move in an executor (the loop's default one if not given).
+
+    A ComputerPlayer's delay is awaited instead of slept in a worker. A cancelled move stops
+    being awaited at once, but a search already running in a worker thread finishes there.
+    """
+
+    def __init__(self, player: Player, executor: Executor | None = None) -> None:
+        super().__init__(player.mark)
+        self.player = player
+        self.executor = executor
+
+    async def get_move(self, game_state: GameState) -> Move | None:
+        loop = asyncio.get_running_loop()
+        if isinstance(self.player, ComputerPlayer):
+            await asyncio.sleep(self.player.delay_seconds)
+            return await loop.run_in_executor(self.executor, self.player.get_computer_move, game_state)
+        return await loop.run_in_executor(self.executor, self.player.get_move, game_state)
+
+
+def as_async(player: Player | AsyncPlayer, executor: Executor | None = None) -> AsyncPlayer:
+    """Return an async player as is, and wrap a synchronous one in a SyncPlayerAdapter."""
+    if isinstance(player, AsyncPlayer):
+        return player
+    return SyncPlayerAdapter(player, executor)
@@ -0,0 +1,274 @@
+"""
+Server-side store of games by game_id, so clients can send a game_id instead of the state.
+
+MemorySessionStore keeps the games of one process: an LRU of at most max_sessions games,
+where a game not used for ttl_seconds expires. SQLiteSessionStore puts that LRU in front of
+a SQLite file in WAL mode, so games survive restarts: writes are queued and a background
+thread commits them in batches (one transaction per flush_interval, and only the latest
+state of a game that moved several times meanwhile), and games missing from memory are
+loaded from the file. Games are persisted in the compact encoded_state format.
+"""
+import logging
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional
+
+from ..api.serializers import GameStateSerializer
+from ..logic.models import GameState
+
+logger = logging.getLogger(__name__)
+
+MAX_SESSIONS = 10_000
+SESSION_TTL_SECONDS = 24 * 60 * 60.0
+FLUSH_INTERVAL_SECONDS = 0.05
+# how often the SQLite writer deletes expired games
+PURGE_INTERVAL_SECONDS = 60.0
+
+
+class SessionConflict(ValueError):
+    """Raised when a game changed between reading it and saving the move made in it."""
+
+
+class MemorySessionStore:
+    """Thread-safe LRU of games by game_id, with idle expiry."""
+
+    def __init__(self, max_sessions: int = MAX_SESSIONS, ttl_seconds: float = SESSION_TTL_SECONDS):
+        if max_sessions < 1:
+            raise ValueError("max_sessions must be at least 1")
+        self.max_sessions = max_sessions
+        self.ttl_seconds = ttl_seconds
+        self._sessions: OrderedDict[str, tuple[GameState, float]] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.loads = 0
+        self.misses = 0
+        self.evictions = 0
+        self.conflicts = 0
+
+    def __len__(self) -> int:
+        return len(self._sessions)
+
+    def get(self, game_id: str) -> GameState | None:
+        """Return the game's current state, or None if it is unknown or expired."""
+        now = time.monotonic()
+        with self._lock:
+            entry = self._sessions.get(game_id)
+            if entry is not None and now - entry[1] <= self.ttl_seconds:
+                self.hits += 1
+                self._sessions[game_id] = (entry[0], now)
+                self._sessions.move_to_end(game_id)
+                return entry[0]
+            if entry is not None:
+                del self._sessions[game_id]
+                self.evictions += 1
+        game_state = self._load(game_id)
+        with self._lock:
+            if game_state is None:
+                self.misses += 1
+                return None
+            self.loads += 1
+            # a put that raced with the load wins
+            game_state = self._sessions.setdefault(game_id, (game_state, now))[0]
+            self._evict(now)
+            return game_state
+
+    def put(self, game_id: str, game_state: GameState, expected: GameState | None = None) -> None:
+        """
+        Store the game's new state. With expected, store it only if the game is still in that
+        state, and raise SessionConflict otherwise (e.g. two moves sent for the same turn).
+        """
+        now = time.monotonic()
+        # a game only in persistent storage is read outside the lock, and without counting a lookup
+        stored = None
+        if expected is not None and game_id not in self._sessions:
+            stored = self._load(game_id)
+        with self._lock:
+            if expected is not None:
+                entry = self._sessions.get(game_id)
+                if entry is not None and now - entry[1] <= self.ttl_seconds:
+                    stored = entry[0]
+                elif entry is not None:
+                    stored = None
+                if stored != expected:
+                    self.conflicts += 1
+                    raise SessionConflict("The game was changed by another request, reload it")
+            self._sessions[game_id] = (game_state, now)
+            self._sessions.move_to_end(game_id)
+            self._evict(now)
+            # under the lock, so the writes of one game are persisted in order
+            self._persist(game_id, game_state)
+
+    def _evict(self, now: float) -> None:
+        # entries are ordered by last use, so expired ones are at the front
+        while self._sessions:
+            _, used = next(iter(self._sessions.values()))
+            if len(self._sessions) <= self.max_sessions and now - used <= self.ttl_seconds:
+                break
+            self._sessions.popitem(last=False)
+            self.evictions += 1
+
+    def _load(self, game_id: str) -> GameState | None:
+        """The game's state from persistent storage; memory-only stores have none."""
+        return None
+
+    def _persist(self, game_id: str, game_state: GameState) -> None:
+        """Save the game's state to persistent storage; memory-only stores have none."""
+
+    def close(self) -> None:
+        """Write out whatever has not been persisted yet."""
+
+    def stats(self) -> Dict[str, Any]:
+        lookups = self.hits + self.loads + self.misses
+        return {
+            "size": len(self._sessions),
+            "max_sessions": self.max_sessions,
+            "ttl_seconds": self.ttl_seconds,
+            "hits": self.hits,
+            "loads": self.loads,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "conflicts": self.conflicts,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+        }
+
+
+class SQLiteSessionStore(MemorySessionStore):
+    """MemorySessionStore backed by a SQLite file in WAL mode, with batched writes."""
+
+    def __init__(
+        self,
+        path: str,
+        max_sessions: int = MAX_SESSIONS,
+        ttl_seconds: float = SESSION_TTL_SECONDS,
+        flush_interval: float = FLUSH_INTERVAL_SECONDS,
+    ):
+        super().__init__(max_sessions, ttl_seconds)
+        self.path = path
+        self.flush_interval = flush_interval
+        # game_id -> (encoded state, wall-clock time of the move, perf_counter when queued)
+        self._pending: Dict[str, tuple[str, float, float]] = {}
+        self._writing: Dict[str, tuple[str, float, float]] = {}
+        self._queue = threading.Condition()
+        self._closing = False
+        self._readers = threading.local()
+        self.persisted = 0
+        self.batches = 0
+        self.write_errors = 0
+        self._commit_seconds = 0.0
+        self._latency_seconds = 0.0
+        self.max_latency_seconds = 0.0
+
+        connection = self._connect()
+        connection.execute("PRAGMA journal_mode=WAL")
+        connection.execute(
+            "CREATE TABLE IF NOT EXISTS sessions "
+            "(game_id TEXT PRIMARY KEY, encoded_state TEXT NOT NULL, updated_at REAL NOT NULL)"
+        )
+        connection.commit()
+        self._writer = threading.Thread(target=self._run, args=(connection,), name="session-writer", daemon=True)
+        self._writer.start()
+
+    def _connect(self) -> sqlite3.Connection:
+        connection = sqlite3.connect(self.path, check_same_thread=False)
+        # with WAL, NORMAL only risks the last commits on power loss, never corruption
+        connection.execute("PRAGMA synchronous=NORMAL")
+        return connection
+
+    def _load(self, game_id: str) -> GameState | None:
+        with self._queue:
+            queued = self._pending.get(game_id) or self._writing.get(game_id)
+        if queued is not None:
+            return GameStateSerializer.decode(queued[0])
+        reader = getattr(self._readers, "connection", None)
+        if reader is None:
+            reader = self._readers.connection = self._connect()
+        row = reader.execute(
+            "SELECT encoded_state FROM sessions WHERE game_id = ? AND updated_at >= ?",
+            (game_id, time.time() - self.ttl_seconds),
+        ).fetchone()
+        return None if row is None else GameStateSerializer.decode(row[0])
+
+    def _persist(self, game_id: str, game_state: GameState) -> None:
+        encoded_state = GameStateSerializer.encode(game_state)
+        with self._queue:
+            self._pending[game_id] = (encoded_state, time.time(), time.perf_counter())
+            self._queue.notify()
+
+    def _run(self, connection: sqlite3.Connection) -> None:
+        last_purge = time.monotonic()
+        while True:
+            with self._queue:
+                self._queue.wait_for(lambda: self._pending or self._closing)
+                if not self._pending:
+                    break
+            if not self._closing:
+                # let the writes of the next few moments join this batch
+                time.sleep(self.flush_interval)
+            with self._queue:
+                self._writing, self._pending = self._pending, {}
+            self._write(connection, self._writing)
+            with self._queue:
+                self._writing = {}
+            if time.monotonic() - last_purge > PURGE_INTERVAL_SECONDS:
+                last_purge = time.monotonic()
+                self._purge(connection)
+        connection.close()
+
+    def _write(self, connection: sqlite3.Connection, batch: Dict[str, tuple[str, float, float]]) -> None:
+        started = time.perf_counter()
+        try:
+            with connection:
+                connection.executemany(
+                    "INSERT OR REPLACE INTO sessions VALUES (?, ?, ?)",
+                    [(game_id, encoded_state, updated_at) for game_id, (encoded_state, updated_at, _) in batch.items()],
+                )
+        except sqlite3.Error:
+            self.write_errors += 1
+            logger.exception("Writing %d sessions to %s failed", len(batch), self.path)
+            return
+        committed = time.perf_counter()
+        self.batches += 1
+        self.persisted += len(batch)
+        self._commit_seconds += committed - started
+        for _, _, queued in batch.values():
+            self._latency_seconds += committed - queued
+            self.max_latency_seconds = max(self.max_latency_seconds, committed - queued)
+
+    def _purge(self, connection: sqlite3.Connection) -> None:
+        try:
+            with connection:
+                connection.execute("DELETE FROM sessions WHERE updated_at < ?", (time.time() - self.ttl_seconds,))
+        except sqlite3.Error:
+            logger.exception("Purging expired sessions from %s failed", self.path)
+
+    def close(self) -> None:
+        with self._queue:
+            self._closing = True
+            self._queue.notify()
+        self._writer.join()
+
+    def stats(self) -> Dict[str, Any]:
+        stats = super().stats()
+        stats.update({
+            "path": self.path,
+            "pending_writes": len(self._pending) + len(self._writing),
+            "persisted_writes": self.persisted,
+            "batches": self.batches,
+            "write_errors": self.write_errors,
+            "mean_batch_size": self.persisted / self.batches if self.batches else 0.0,
+            "mean_commit_ms": 1e3 * self._commit_seconds / self.batches if self.batches else 0.0,
+            "mean_write_latency_ms": 1e3 * self._latency_seconds / self.persisted if self.persisted else 0.0,
+            "max_write_latency_ms": 1e3 * self.max_latency_seconds,
+        })
+        return stats
+
+
+def create_session_store(
+    path: Optional[str] = None, max_sessions: int = MAX_SESSIONS, ttl_seconds: float = SESSION_TTL_SECONDS
+) -> MemorySessionStore:
+    """A SQLiteSessionStore on path, or a MemorySessionStore without one."""
+    if path:
+        return SQLiteSessionStore(path, max_sessions, ttl_seconds)
+    return MemorySessionStore(max_sessions, ttl_seconds)
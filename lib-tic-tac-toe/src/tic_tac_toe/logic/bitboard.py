@@ -0,0 +1,107 @@
+"""
+Integer bitboard helpers backing the Grid/GameState models.
+
+A position is held as two masks, one per mark, where bit ``i`` is set when
+``Grid.cells[i]`` holds that mark (9 bits for the classic 3x3 grid, ``size**2`` bits
+in general). Win checks become a handful of ``mask & win == win`` tests and counting
+marks is a single ``int.bit_count``.
+"""
+from functools import lru_cache
+from typing import Iterator
+
+CELL_COUNT = 9
+FULL_MASK = (1 << CELL_COUNT) - 1
+
+# row/column steps of the four line directions: horizontal, vertical, diagonal, anti-diagonal
+_DIRECTIONS = ((0, 1), (1, 0), (1, 1), (1, -1))
+
+# str.translate tables that turn a cells string into a binary string for one mark
+_BINARY_TABLES = {
+    mark: str.maketrans({"X": "1" if mark == "X" else "0",
+                         "O": "1" if mark == "O" else "0",
+                         " ": "0"})
+    for mark in ("X", "O")
+}
+
+
+def mark_mask(cells: str, mark: str) -> int:
+    """Return the mask of cells holding the given mark ("X" or "O")."""
+    # reverse the string so that cells[0] ends up as the least significant bit
+    return int(cells.translate(_BINARY_TABLES[mark])[::-1], 2)
+
+
+def pattern_to_mask(pattern: str) -> int:
+    """Convert a WINNING_PATTERNS entry (e.g. "?...?...?") to a bitmask."""
+    return sum(1 << i for i, char in enumerate(pattern) if char == "?")
+
+
+def iter_bits(mask: int) -> Iterator[int]:
+    """Yield the indices of the set bits in ascending order."""
+    while mask:
+        lowest = mask & -mask
+        yield lowest.bit_length() - 1
+        mask ^= lowest
+
+
+@lru_cache(maxsize=None)
+def win_masks(size: int, win_length: int) -> tuple[int, ...]:
+    """
+    Masks of every run of ``win_length`` cells in a line on a ``size`` x ``size`` board.
+
+    Lines are ordered by direction, then by starting cell, which for 3x3 reproduces
+    the order of WINNING_PATTERNS.
+    """
+    masks = []
+    for d_row, d_col in _DIRECTIONS:
+        for row in range(size):
+            for col in range(size):
+                end_row = row + d_row * (win_length - 1)
+                end_col = col + d_col * (win_length - 1)
+                if 0 <= end_row < size and 0 <= end_col < size:
+                    masks.append(sum(
+                        1 << (row + d_row * i) * size + col + d_col * i
+                        for i in range(win_length)
+                    ))
+    return tuple(masks)
+
+
+@lru_cache(maxsize=None)
+def lines_through(size: int, win_length: int) -> tuple[tuple[int, ...], ...]:
+    """For each cell, the win masks that contain it."""
+    return tuple(
+        tuple(mask for mask in win_masks(size, win_length) if mask >> cell & 1)
+        for cell in range(size * size)
+    )
+
+
+@lru_cache(maxsize=None)
+def neighbour_shifts(size: int) -> tuple[tuple[int, int], ...]:
+    """
+    (shift, keep mask) pairs that move a mask one step in each of the 8 directions.
+
+    Apply with ``(mask << shift if shift > 0 else mask >> -shift) & keep``; the keep
+    mask stops cells wrapping around from one edge of the board to the other.
+    """
+    full = (1 << size * size) - 1
+    first_col = sum(1 << row * size for row in range(size))
+    not_first_col = full & ~first_col
+    not_last_col = full & ~(first_col << size - 1)
+    shifts = []
+    for d_row in (-1, 0, 1):
+        for d_col in (-1, 0, 1):
+            if d_row or d_col:
+                keep = full
+                if d_col == 1:
+                    keep &= not_first_col
+                elif d_col == -1:
+                    keep &= not_last_col
+                shifts.append((d_row * size + d_col, keep))
+    return tuple(shifts)
+
+
+def neighbours(mask: int, size: int) -> int:
+    """Cells adjacent (including diagonally) to any cell of ``mask``."""
+    result = 0
+    for shift, keep in neighbour_shifts(size):
+        result |= (mask << shift if shift > 0 else mask >> -shift) & keep
+    return result
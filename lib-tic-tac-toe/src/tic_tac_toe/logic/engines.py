@@ -0,0 +1,307 @@
+"""
+Pluggable search engines behind minimax.find_best_move.
+
+Every engine counts the positions it visits in ``nodes`` so that engines can be compared
+on node counts and latency over the same positions (see benchmarks/bench_search_engines.py).
+"""
+import abc
+import time
+from collections import defaultdict
+from typing import Callable, Type
+
+from tic_tac_toe.logic.bitboard import iter_bits, lines_through, neighbours
+from tic_tac_toe.logic.models import GameState, Grid, Mark, Move
+from tic_tac_toe.logic.transposition import TranspositionTable, position_key
+
+# static move ordering: center first, then corners, then edges
+CELL_PRIORITY = (1, 2, 1, 2, 0, 2, 1, 2, 1)
+
+
+def cell_priority(cell: int, size: int) -> int:
+    """Static ordering rank of a cell (lower is tried first) on a board of any size."""
+    if size == 3:
+        return CELL_PRIORITY[cell]
+    center = (size - 1) / 2
+    row, col = divmod(cell, size)
+    return int(2 * max(abs(row - center), abs(col - center)))
+
+
+class SearchEngine(metaclass=abc.ABCMeta):
+    """Searches the game tree for the best move of the side to move."""
+
+    name: str
+    # whether create_engine hands the engine the shared transposition table
+    uses_table = True
+
+    def __init__(self, table: TranspositionTable | None = None) -> None:
+        self.table = table
+        self.nodes = 0
+
+    def reset_stats(self) -> None:
+        self.nodes = 0
+
+    @abc.abstractmethod
+    def find_best_move(self, game_state: GameState) -> Move | None:
+        """Return the best move for the current mark, or None if the game is over."""
+
+
+class MinimaxEngine(SearchEngine):
+    """Exhaustive minimax, optionally backed by a transposition table."""
+
+    name = "minimax"
+
+    def find_best_move(self, game_state: GameState) -> Move | None:
+        maximizer = game_state.current_mark
+        return max(
+            game_state.iter_moves(),
+            key=lambda move: self._score(move.after_state, maximizer),
+            default=None,
+        )
+
+    def _score(self, game_state: GameState, maximizer: Mark) -> int:
+        self.nodes += 1
+        if game_state.game_over:
+            return game_state.evaluate_score(maximizer)
+        if self.table is not None:
+            key = position_key(game_state, maximizer)
+            if (score := self.table.get(key)) is not None:
+                return score
+        choose = max if game_state.current_mark is maximizer else min
+        score = choose(self._score(move.after_state, maximizer) for move in game_state.iter_moves())
+        if self.table is not None:
+            self.table.put(key, score)
+        return score
+
+
+class AlphaBetaEngine(SearchEngine):
+    """
+    Negamax with alpha-beta pruning.
+
+    Moves are tried killer moves first, then by history score, then center/corners/edges.
+    Only exact scores are stored in the transposition table, so it can be shared with MinimaxEngine.
+    """
+
+    name = "alphabeta"
+
+    def __init__(self, table: TranspositionTable | None = None) -> None:
+        super().__init__(table)
+        self.cutoffs = 0
+        self._killers: dict[int, list[int]] = {}
+        self._history: defaultdict[int, int] = defaultdict(int)
+
+    def reset_stats(self) -> None:
+        super().reset_stats()
+        self.cutoffs = 0
+
+    def find_best_move(self, game_state: GameState) -> Move | None:
+        best_move, alpha = None, -2
+        for cell in self._ordered_cells(game_state, ply=0):
+            move = game_state.make_move_to(cell)
+            score = -self._negamax(move.after_state, -2, -alpha, ply=1)
+            if best_move is None or score > alpha:
+                best_move, alpha = move, score
+            if alpha == 1:
+                break
+        return best_move
+
+    def _negamax(self, game_state: GameState, alpha: int, beta: int, ply: int) -> int:
+        self.nodes += 1
+        current_mark = game_state.current_mark
+        if game_state.game_over:
+            return game_state.evaluate_score(current_mark)
+        key = None
+        if self.table is not None:
+            key = position_key(game_state, current_mark)
+            if (score := self.table.get(key)) is not None:
+                return score
+        original_alpha = alpha
+        best_score = -2
+        # children are only built when reached, so a cutoff skips building the rest
+        for cell in self._ordered_cells(game_state, ply):
+            child = game_state.make_move_to(cell).after_state
+            score = -self._negamax(child, -beta, -alpha, ply + 1)
+            if score > best_score:
+                best_score = score
+            if score > alpha:
+                alpha = score
+            if alpha >= beta:
+                self._record_cutoff(cell, ply)
+                break
+        if key is not None and original_alpha < best_score < beta:
+            self.table.put(key, best_score)
+        return best_score
+
+    def _ordered_cells(self, game_state: GameState, ply: int) -> list[int]:
+        killers = self._killers.get(ply, ())
+        size = game_state.grid.size
+        return sorted(
+            game_state.possible_move_indices,
+            key=lambda cell: (
+                cell not in killers,
+                -self._history[cell],
+                cell_priority(cell, size),
+            ),
+        )
+
+    def _record_cutoff(self, cell_index: int, ply: int) -> None:
+        self.cutoffs += 1
+        killers = self._killers.setdefault(ply, [])
+        if cell_index not in killers:
+            killers.insert(0, cell_index)
+            del killers[2:]
+        self._history[cell_index] += max(9 - ply, 1) ** 2
+
+
+class SearchTimeout(Exception):
+    """Raised inside a depth-limited search when the time budget runs out."""
+
+
+# score of a won position; wins found sooner score higher so the engine plays the fastest win
+WIN_SCORE = 1_000_000
+
+Evaluator = Callable[[int, int, Grid], int]
+
+
+def line_heuristic(mover: int, other: int, grid: Grid) -> int:
+    """
+    Heuristic score of a position for the side to move.
+
+    Every win line still open to only one player scores 10**(marks on it) for that player,
+    so longer unblocked runs dominate and lines blocked by both players count for nothing.
+    """
+    score = 0
+    for win_mask in grid.win_masks:
+        mine = mover & win_mask
+        theirs = other & win_mask
+        if mine and not theirs:
+            score += 10 ** mine.bit_count()
+        elif theirs and not mine:
+            score -= 10 ** theirs.bit_count()
+    return score
+
+
+class IterativeDeepeningEngine(SearchEngine):
+    """
+    Depth-limited alpha-beta repeated at increasing depths until the time budget runs out.
+
+    Meant for boards too large to search exhaustively (4x4 and up): positions beyond the
+    current depth are scored with a heuristic evaluation, and the best move of the last
+    fully searched depth is played. The search runs on raw bitboards rather than GameStates.
+    On boards with more than 25 cells only empty cells next to an existing mark are considered.
+
+    Its heuristic scores depend on the search depth, so it keeps no transposition table; the
+    history heuristic is rebuilt for every position it searches.
+    """
+
+    name = "deepening"
+    uses_table = False
+
+    def __init__(
+        self,
+        time_budget: float = 1.0,
+        max_depth: int | None = None,
+        evaluate: Evaluator = line_heuristic,
+    ) -> None:
+        super().__init__()
+        self.time_budget = time_budget
+        self.max_depth = max_depth
+        self.evaluate = evaluate
+        self.depth_reached = 0
+        self._deadline = 0.0
+        self._history: defaultdict[int, int] = defaultdict(int)
+
+    def reset_stats(self) -> None:
+        super().reset_stats()
+        self.depth_reached = 0
+
+    def find_best_move(self, game_state: GameState) -> Move | None:
+        if game_state.game_over:
+            return None
+        grid = game_state.grid
+        self._deadline = time.perf_counter() + self.time_budget
+        self.depth_reached = 0
+        self._history.clear()
+        mover, other = (
+            (grid.x_mask, grid.o_mask)
+            if game_state.current_mark is Mark.CROSS
+            else (grid.o_mask, grid.x_mask)
+        )
+        candidates = self._candidates(mover, other, grid)
+        best_cell = candidates[0]
+        max_depth = min(self.max_depth or grid.empty_count, grid.empty_count)
+        for depth in range(1, max_depth + 1):
+            try:
+                score, cell = self._search_root(mover, other, grid, candidates, depth)
+            except SearchTimeout:
+                break
+            best_cell, self.depth_reached = cell, depth
+            # try the best move first at the next depth
+            candidates.remove(cell)
+            candidates.insert(0, cell)
+            if abs(score) >= WIN_SCORE - grid.empty_count:
+                break  # forced win or loss found, deeper search won't change the outcome
+        return game_state.make_move_to(best_cell)
+
+    def _search_root(
+        self, mover: int, other: int, grid: Grid, candidates: list[int], depth: int
+    ) -> tuple[int, int]:
+        alpha, beta = -WIN_SCORE - 1, WIN_SCORE + 1
+        best_cell = candidates[0]
+        for cell in candidates:
+            score = -self._negamax(other, mover | 1 << cell, cell, grid, depth - 1, -beta, -alpha, 1)
+            if score > alpha:
+                alpha, best_cell = score, cell
+        return alpha, best_cell
+
+    def _negamax(
+        self, mover: int, other: int, last_cell: int, grid: Grid,
+        depth: int, alpha: int, beta: int, ply: int,
+    ) -> int:
+        self.nodes += 1
+        if self.nodes & 255 == 0 and time.perf_counter() > self._deadline:
+            raise SearchTimeout()
+        lines = lines_through(grid.size, grid.win_length)[last_cell]
+        if any(other & line == line for line in lines):
+            return -(WIN_SCORE - ply)
+        if (mover | other).bit_count() == len(grid.cells):
+            return 0
+        if depth == 0:
+            return self.evaluate(mover, other, grid)
+        best_score = -WIN_SCORE - 1
+        for cell in self._candidates(mover, other, grid):
+            score = -self._negamax(other, mover | 1 << cell, cell, grid, depth - 1, -beta, -alpha, ply + 1)
+            if score > best_score:
+                best_score = score
+            if score > alpha:
+                alpha = score
+            if alpha >= beta:
+                self._history[cell] += depth * depth
+                break
+        return best_score
+
+    def _candidates(self, mover: int, other: int, grid: Grid) -> list[int]:
+        occupied = mover | other
+        empty = (1 << len(grid.cells)) - 1 & ~occupied
+        if len(grid.cells) > 25 and occupied:
+            empty &= neighbours(occupied, grid.size)
+        return sorted(
+            iter_bits(empty),
+            key=lambda cell: (-self._history[cell], cell_priority(cell, grid.size)),
+        )
+
+
+ENGINES: dict[str, Type[SearchEngine]] = {
+    MinimaxEngine.name: MinimaxEngine,
+    AlphaBetaEngine.name: AlphaBetaEngine,
+    IterativeDeepeningEngine.name: IterativeDeepeningEngine,
+}
+
+
+def create_engine(name: str, table: TranspositionTable | None = None, **options) -> SearchEngine:
+    try:
+        engine_class = ENGINES[name]
+    except KeyError:
+        raise ValueError(f"Unknown search engine: {name}. Available engines: {', '.join(ENGINES)}")
+    if not engine_class.uses_table:
+        return engine_class(**options)
+    return engine_class(table, **options)
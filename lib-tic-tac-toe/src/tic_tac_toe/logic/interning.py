@@ -0,0 +1,94 @@
+"""
+Interning cache that keeps a single shared instance per key.
+
+Used by GameState so that each position exists once per process and its cached
+properties (winner, current_mark, possible_move_indices, ...) are only ever computed once.
+"""
+import sys
+import threading
+from collections import OrderedDict
+from typing import Callable, Generic, Hashable, TypeVar
+
+T = TypeVar("T")
+
+
+class InternCache(Generic[T]):
+    """
+    Maps keys to shared instances, either unbounded or as an LRU of at most max_size entries.
+
+    Keeps hit/miss/eviction counts and can estimate the memory held by its instances.
+    """
+
+    def __init__(
+        self, max_size: int | None = None, footprint: Callable[[T], int] = sys.getsizeof
+    ) -> None:
+        self._footprint = footprint
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[Hashable, T] = OrderedDict()
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.resize(max_size)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: Hashable) -> T | None:
+        with self._lock:
+            value = self._entries.get(key)
+            if value is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+                if self.max_size is not None:
+                    self._entries.move_to_end(key)
+            return value
+
+    def add(self, key: Hashable, value: T) -> T:
+        """Intern value under key and return the shared instance (an earlier one wins)."""
+        with self._lock:
+            existing = self._entries.setdefault(key, value)
+            if existing is value and self.max_size is not None and len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+            return existing
+
+    def get_or_create(self, key: Hashable, factory: Callable[[], T]) -> T:
+        value = self.get(key)
+        if value is None:
+            value = self.add(key, factory())
+        return value
+
+    def resize(self, max_size: int | None) -> None:
+        """Switch to an LRU of max_size entries, or to unbounded with None."""
+        if max_size is not None and max_size < 1:
+            raise ValueError("max_size must be at least 1 (or None for unbounded)")
+        with self._lock:
+            self.max_size = max_size
+            while max_size is not None and len(self._entries) > max_size:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.misses = self.evictions = 0
+
+    def memory_bytes(self) -> int:
+        """Estimated bytes held by the interned instances (walks every entry)."""
+        with self._lock:
+            values = list(self._entries.values())
+        return sum(self._footprint(value) for value in values)
+
+    def stats(self) -> dict[str, int | float | None]:
+        lookups = self.hits + self.misses
+        return {
+            "size": len(self._entries),
+            "max_size": self.max_size,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "memory_bytes": self.memory_bytes(),
+        }
@@ -1,22 +1,53 @@
 from functools import partial
 from codetiming import Timer
 
+from tic_tac_toe.logic.engines import SearchEngine, create_engine
 from tic_tac_toe.logic.models import GameState, Mark, Move
+from tic_tac_toe.logic.transposition import TranspositionTable, position_key
 
+# shared by every search in the process so repeated moves reuse earlier results
+TRANSPOSITION_TABLE = TranspositionTable()
 
-@Timer(text="minimax.find_best_move = {:0.4f} seconds")
-def find_best_move(game_state: GameState) -> Move | None:
-    maximizer: Mark = game_state.current_mark
-    bound_minimax = partial(minimax, maximizer=maximizer)
-    return max(game_state.possible_moves, key=bound_minimax)
+
+def find_best_move(
+    game_state: GameState,
+    table: TranspositionTable | None = TRANSPOSITION_TABLE,
+    engine: SearchEngine | str | None = None,
+) -> Move | None:
+    """
+    Return the best move for the current mark.
+
+    By default this runs minimax; pass an engine name from engines.ENGINES (e.g. "alphabeta")
+    or a SearchEngine instance to search with a different backend. The table is only
+    used when the engine is given by name.
+    """
+    # a Timer per call: a decorator would share one Timer between concurrent searches
+    with Timer(text="minimax.find_best_move = {:0.4f} seconds"):
+        if engine is not None:
+            if isinstance(engine, str):
+                engine = create_engine(engine, table)
+            return engine.find_best_move(game_state)
+        maximizer: Mark = game_state.current_mark
+        bound_minimax = partial(minimax, maximizer=maximizer, table=table)
+        return max(game_state.iter_moves(), key=bound_minimax)
 
 
 def minimax(
-    move: Move, maximizer: Mark, choose_highest_score: bool = False
+    move: Move,
+    maximizer: Mark,
+    choose_highest_score: bool = False,
+    table: TranspositionTable | None = TRANSPOSITION_TABLE,
 ) -> int:
     if move.after_state.game_over:
         return move.after_state.evaluate_score(maximizer)
-    return (max if choose_highest_score else min)(
-        minimax(next_move, maximizer, not choose_highest_score)
-        for next_move in move.after_state.possible_moves
+    if table is not None:
+        key = position_key(move.after_state, maximizer)
+        if (score := table.get(key)) is not None:
+            return score
+    score = (max if choose_highest_score else min)(
+        minimax(next_move, maximizer, not choose_highest_score, table)
+        for next_move in move.after_state.iter_moves()
     )
+    if table is not None:
+        table.put(key, score)
+    return score
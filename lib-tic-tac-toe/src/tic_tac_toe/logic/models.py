@@ -1,11 +1,15 @@
 import enum
+import math
 import random
-import re
-from dataclasses import dataclass
-from functools import cached_property
+import sys
+import weakref
+from dataclasses import FrozenInstanceError, dataclass, field, fields
+from typing import Any, Callable, Iterator
 
+from tic_tac_toe.logic.bitboard import iter_bits, mark_mask, pattern_to_mask, win_masks
 from tic_tac_toe.logic.exceptions import InvalidMove, UnknownGameScore
-from tic_tac_toe.logic.validators import validate_game_state, validate_grid
+from tic_tac_toe.logic.interning import InternCache
+from tic_tac_toe.logic.validators import validate_board_size, validate_game_state, validate_grid
 
 WINNING_PATTERNS = (
     "???......",
@@ -18,6 +22,61 @@ WINNING_PATTERNS = (
     "..?.?.?..",
 )
 
+WIN_MASKS = tuple(pattern_to_mask(pattern) for pattern in WINNING_PATTERNS)
+
+# longest run needed to win when a Grid doesn't specify one (3x3 -> 3, 4x4 -> 4, 15x15 -> 5)
+MAX_DEFAULT_WIN_LENGTH = 5
+
+
+def default_win_length(size: int) -> int:
+    return min(size, MAX_DEFAULT_WIN_LENGTH)
+
+
+# States derived by GameState.make_move_to from an already validated state can't be invalid,
+# so they skip validation. Set to True to validate them anyway (e.g. to benchmark the cost).
+VALIDATE_DERIVED_STATES = False
+
+
+class cached_slot:
+    """
+    Like functools.cached_property, but for classes with __slots__ instead of a __dict__.
+
+    The value is stored in the slot named after the property with a leading underscore,
+    which the class must declare (as a dataclass field with init=False).
+    """
+
+    def __init__(self, func: Callable[[Any], Any]) -> None:
+        self.func = func
+        self.__doc__ = func.__doc__
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        self.slot = f"_{name}"
+
+    def __get__(self, instance: Any, owner: type | None = None) -> Any:
+        if instance is None:
+            return self
+        try:
+            return getattr(instance, self.slot)
+        except AttributeError:
+            value = self.func(instance)
+            object.__setattr__(instance, self.slot, value)
+            return value
+
+
+def _cache() -> Any:
+    """Dataclass field holding the value of a cached_slot property."""
+    return field(init=False, repr=False, compare=False)
+
+
+def _getstate(self) -> list[Any]:
+    # pickle only the init fields; cached values are recomputed on demand
+    return [getattr(self, f.name) for f in fields(self) if f.init]
+
+
+def _setstate(self, state: list[Any]) -> None:
+    for f, value in zip((f for f in fields(self) if f.init), state):
+        object.__setattr__(self, f.name, value)
+
 
 class Mark(str, enum.Enum):
     CROSS = "X"
@@ -28,108 +87,245 @@ class Mark(str, enum.Enum):
         return Mark.CROSS if self is Mark.NAUGHT else Mark.NAUGHT
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Grid:
     cells: str = " " * 9
+    win_length: int | None = None
+
+    _size: int = _cache()
+    _win_masks: tuple[int, ...] = _cache()
+    _x_mask: int = _cache()
+    _o_mask: int = _cache()
+    _empty_mask: int = _cache()
+    _x_count: int = _cache()
+    _o_count: int = _cache()
+    _empty_count: int = _cache()
+
+    __getstate__ = _getstate
+    __setstate__ = _setstate
 
     def __post_init__(self) -> None:
         validate_grid(self)
+        if self.win_length is None:
+            object.__setattr__(self, "win_length", default_win_length(self.size))
+
+    @classmethod
+    def empty(cls, size: int = 3, win_length: int | None = None) -> "Grid":
+        validate_board_size(size, win_length)
+        return cls(" " * (size * size), win_length)
 
-    @cached_property
+    @classmethod
+    def _trusted(cls, cells: str, win_length: int, x_mask: int, o_mask: int) -> "Grid":
+        """Build a Grid without validation, seeding its masks; only for engine-derived cells."""
+        grid = object.__new__(cls)
+        set_slot = object.__setattr__
+        set_slot(grid, "cells", cells)
+        set_slot(grid, "win_length", win_length)
+        set_slot(grid, "_x_mask", x_mask)
+        set_slot(grid, "_o_mask", o_mask)
+        return grid
+
+    @cached_slot
+    def size(self) -> int:
+        return math.isqrt(len(self.cells))
+
+    @cached_slot
+    def win_masks(self) -> tuple[int, ...]:
+        return win_masks(self.size, self.win_length)
+
+    @cached_slot
+    def x_mask(self) -> int:
+        return mark_mask(self.cells, "X")
+
+    @cached_slot
+    def o_mask(self) -> int:
+        return mark_mask(self.cells, "O")
+
+    @cached_slot
+    def empty_mask(self) -> int:
+        return (1 << len(self.cells)) - 1 & ~(self.x_mask | self.o_mask)
+
+    @cached_slot
     def x_count(self) -> int:
-        return self.cells.count("X")
+        return self.x_mask.bit_count()
 
-    @cached_property
+    @cached_slot
     def o_count(self) -> int:
-        return self.cells.count("O")
+        return self.o_mask.bit_count()
 
-    @cached_property
+    @cached_slot
     def empty_count(self) -> int:
-        return self.cells.count(" ")
+        return self.empty_mask.bit_count()
 
 
-@dataclass(frozen=True)
 class Move:
-    mark: Mark
-    cell_index: int
-    before_state: "GameState"
-    after_state: "GameState"
+    """
+    A mark placed on a cell, with the states before and after it.
+
+    The before_state is only held weakly, so a Move kept by a caller (or cached anywhere)
+    never keeps the parent state, and whatever the parent references, alive.
+    """
 
+    __slots__ = ("mark", "cell_index", "_before_state", "after_state")
 
-@dataclass(frozen=True)
+    def __init__(
+        self, mark: Mark, cell_index: int, before_state: "GameState", after_state: "GameState"
+    ) -> None:
+        set_slot = object.__setattr__
+        set_slot(self, "mark", mark)
+        set_slot(self, "cell_index", cell_index)
+        set_slot(self, "_before_state", weakref.ref(before_state))
+        set_slot(self, "after_state", after_state)
+
+    @property
+    def before_state(self) -> "GameState | None":
+        """The state the move was made in, or None once nothing else references it."""
+        return self._before_state()
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise FrozenInstanceError(f"cannot assign to field '{name}'")
+
+    def __delattr__(self, name: str) -> None:
+        raise FrozenInstanceError(f"cannot delete field '{name}'")
+
+    def __eq__(self, other: object) -> bool:
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return (self.mark, self.cell_index, self.before_state, self.after_state) == (
+            other.mark, other.cell_index, other.before_state, other.after_state
+        )
+
+    def __hash__(self) -> int:
+        return hash((self.mark, self.cell_index, self.after_state))
+
+    def __repr__(self) -> str:
+        return (
+            f"Move(mark={self.mark!r}, cell_index={self.cell_index!r}, "
+            f"before_state={self.before_state!r}, after_state={self.after_state!r})"
+        )
+
+
+@dataclass(frozen=True, slots=True, weakref_slot=True)
 class GameState:
     grid: Grid
     starting_mark: Mark = Mark("X")
 
+    _current_mark: Mark = _cache()
+    _game_not_started: bool = _cache()
+    _game_over: bool = _cache()
+    _tie: bool = _cache()
+    _winning_line: tuple[Mark | None, int] = _cache()
+    _winner: Mark | None = _cache()
+    _winning_cells: list[int] = _cache()
+    _possible_move_indices: tuple[int, ...] = _cache()
+
+    __getstate__ = _getstate
+    __setstate__ = _setstate
+
     def __post_init__(self) -> None:
         validate_game_state(self)
 
-    @cached_property
+    @cached_slot
     def current_mark(self) -> Mark:
         if self.grid.x_count == self.grid.o_count:
             return self.starting_mark
         else:
             return self.starting_mark.other
 
-    @cached_property
+    @cached_slot
     def game_not_started(self) -> bool:
-        return self.grid.empty_count == 9
+        return self.grid.empty_count == len(self.grid.cells)
 
-    @cached_property
+    @cached_slot
     def game_over(self) -> bool:
         return self.winner is not None or self.tie
 
-    @cached_property
+    @cached_slot
     def tie(self) -> bool:
         return self.winner is None and self.grid.empty_count == 0
 
-    @cached_property
+    @cached_slot
+    def winning_line(self) -> tuple[Mark | None, int]:
+        """The winner and the mask of their winning line, or (None, 0)."""
+        x_mask, o_mask = self.grid.x_mask, self.grid.o_mask
+        for win_mask in self.grid.win_masks:
+            if x_mask & win_mask == win_mask:
+                return Mark.CROSS, win_mask
+            if o_mask & win_mask == win_mask:
+                return Mark.NAUGHT, win_mask
+        return None, 0
+
+    @cached_slot
     def winner(self) -> Mark | None:
-        for pattern in WINNING_PATTERNS:
-            for mark in Mark:
-                if re.match(pattern.replace("?", mark), self.grid.cells):
-                    return mark
-        return None
+        return self.winning_line[0]
 
-    @cached_property
+    @cached_slot
     def winning_cells(self) -> list[int]:
-        for pattern in WINNING_PATTERNS:
-            for mark in Mark:
-                if re.match(pattern.replace("?", mark), self.grid.cells):
-                    return [
-                        match.start() for match in re.finditer(r"\?", pattern)
-                    ]
-        return []
-
-    @cached_property
+        return list(iter_bits(self.winning_line[1]))
+
+    @cached_slot
+    def possible_move_indices(self) -> tuple[int, ...]:
+        if self.game_over:
+            return ()
+        return tuple(iter_bits(self.grid.empty_mask))
+
+    @property
     def possible_moves(self) -> list[Move]:
-        moves = []
-        if not self.game_over:
-            for match in re.finditer(r"\s", self.grid.cells):
-                moves.append(self.make_move_to(match.start()))
-        return moves
+        # deliberately not cached: a state that kept its moves would keep every explored
+        # descendant alive; child states are shared through STATE_CACHE instead
+        return list(self.iter_moves())
+
+    def iter_moves(self) -> Iterator[Move]:
+        """Yield the possible moves one at a time, building each after_state only when reached."""
+        for index in self.possible_move_indices:
+            yield self.make_move_to(index)
 
     def make_random_move(self) -> Move | None:
         try:
-            return random.choice(self.possible_moves)
+            return self.make_move_to(random.choice(self.possible_move_indices))
         except IndexError:
             return None
 
+    @classmethod
+    def _trusted(cls, grid: Grid, starting_mark: Mark) -> "GameState":
+        """Build a GameState without validation; only for states derived from a legal move."""
+        game_state = object.__new__(cls)
+        object.__setattr__(game_state, "grid", grid)
+        object.__setattr__(game_state, "starting_mark", starting_mark)
+        return game_state
+
+    @classmethod
+    def intern(cls, grid: Grid, starting_mark: Mark = Mark("X")) -> "GameState":
+        """Return the process-wide shared state for this position, validating it on first sight."""
+        return STATE_CACHE.get_or_create(
+            (grid.cells, grid.win_length, starting_mark), lambda: cls(grid, starting_mark)
+        )
+
     def make_move_to(self, index: int) -> Move:
         if self.grid.cells[index] != " ":
             raise InvalidMove("Cell is not empty")
+        if self.game_over:
+            raise InvalidMove("Game is already over")
+        cells = self.grid.cells[:index] + self.current_mark + self.grid.cells[index + 1 :]
+        key = (cells, self.grid.win_length, self.starting_mark)
+        if (after_state := STATE_CACHE.get(key)) is None:
+            if VALIDATE_DERIVED_STATES:
+                after_state = GameState(Grid(cells, self.grid.win_length), self.starting_mark)
+            else:
+                bit = 1 << index
+                x_mask, o_mask = self.grid.x_mask, self.grid.o_mask
+                if self.current_mark is Mark.CROSS:
+                    x_mask |= bit
+                else:
+                    o_mask |= bit
+                grid = Grid._trusted(cells, self.grid.win_length, x_mask, o_mask)
+                after_state = GameState._trusted(grid, self.starting_mark)
+            after_state = STATE_CACHE.add(key, after_state)
         return Move(
             mark=self.current_mark,
             cell_index=index,
             before_state=self,
-            after_state=GameState(
-                Grid(
-                    self.grid.cells[:index]
-                    + self.current_mark
-                    + self.grid.cells[index + 1 :]
-                ),
-                self.starting_mark,
-            ),
+            after_state=after_state,
         )
 
     def evaluate_score(self, mark: Mark) -> int:
@@ -141,3 +337,19 @@ class GameState:
             else:
                 return -1
         raise UnknownGameScore("Game is not over yet")
+
+
+def _state_footprint(game_state: GameState) -> int:
+    """Approximate bytes of a state, its grid and their cached values, excluding other states."""
+    total = 0
+    for obj in (game_state, game_state.grid):
+        total += sys.getsizeof(obj)
+        for slot in obj.__slots__:
+            value = getattr(obj, slot, None)
+            if not isinstance(value, (GameState, Grid, Mark, bool, type(None), weakref.ref)):
+                total += sys.getsizeof(value)
+    return total
+
+
+# one shared GameState per (cells, win length, starting mark); resize(None) makes it unbounded
+STATE_CACHE: InternCache[GameState] = InternCache(max_size=100_000, footprint=_state_footprint)
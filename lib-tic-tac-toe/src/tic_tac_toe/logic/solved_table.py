@@ -0,0 +1,172 @@
+"""
+Precomputed game-theoretic value and best moves for every reachable position.
+
+The table is solved once by a build step and shipped as a compact binary file:
+
+    python -m tic_tac_toe.logic.solved_table [--output PATH]
+
+File layout (little-endian): a header of magic b"TTTS", format version, cell count and
+entry count, followed by one uint16 entry per (board, side to move). The board index is
+the grid read as a base-3 number (cell i contributes 3**i times 0/1/2 for empty/X/O),
+doubled, plus 1 when O is to move. Each entry holds the best-move mask in bits 0-8 and
+the value code in bits 9-10 (0 = unreachable, 1/2/3 = loss/draw/win for the side to move).
+
+The file is memory-mapped on first use, so a lookup is a single array read.
+"""
+import argparse
+import mmap
+import os
+import struct
+import sys
+import threading
+from array import array
+from dataclasses import dataclass
+from typing import Sequence
+
+from tic_tac_toe.logic.bitboard import CELL_COUNT, FULL_MASK, iter_bits
+from tic_tac_toe.logic.models import WIN_MASKS, GameState, Mark
+
+DEFAULT_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data", "solved_table.bin")
+
+MAGIC = b"TTTS"
+FORMAT_VERSION = 1
+HEADER = struct.Struct("<4sHHI")
+ENTRY_COUNT = 3**CELL_COUNT * 2
+
+_MOVES_MASK = FULL_MASK
+_VALUE_SHIFT = CELL_COUNT
+# powers of three for each cell, used to turn a mask into its base-3 digits
+_POWERS = tuple(3**i for i in range(CELL_COUNT))
+
+
+@dataclass(frozen=True)
+class SolvedPosition:
+    """Value for the side to move (1 win, 0 draw, -1 loss) and every move that achieves it."""
+    value: int
+    best_moves: tuple[int, ...]
+
+
+def _ternary(mask: int) -> int:
+    return sum(_POWERS[i] for i in iter_bits(mask))
+
+
+def table_index(x_mask: int, o_mask: int, to_move: Mark) -> int:
+    """Index of a position in the table."""
+    board = _ternary(x_mask) + 2 * _ternary(o_mask)
+    return board * 2 + (to_move is Mark.NAUGHT)
+
+
+def _has_win(mask: int) -> bool:
+    return any(mask & win_mask == win_mask for win_mask in WIN_MASKS)
+
+
+def solve() -> array:
+    """Solve every position reachable from an empty grid with either mark starting."""
+    entries = array("H", bytes(2 * ENTRY_COUNT))
+
+    def negamax(mover: int, other: int, to_move: Mark) -> int:
+        x_mask, o_mask = (mover, other) if to_move is Mark.CROSS else (other, mover)
+        index = table_index(x_mask, o_mask, to_move)
+        if entries[index]:
+            return (entries[index] >> _VALUE_SHIFT) - 2
+        empty = FULL_MASK & ~(mover | other)
+        best_value, best_moves = -2, 0
+        if _has_win(other):
+            best_value = -1
+        elif not empty:
+            best_value = 0
+        else:
+            for cell in iter_bits(empty):
+                value = -negamax(other, mover | 1 << cell, to_move.other)
+                if value > best_value:
+                    best_value, best_moves = value, 1 << cell
+                elif value == best_value:
+                    best_moves |= 1 << cell
+        entries[index] = (best_value + 2) << _VALUE_SHIFT | best_moves
+        return best_value
+
+    for starting_mark in Mark:
+        negamax(0, 0, starting_mark)
+    return entries
+
+
+def write_table(entries: array, path: str = DEFAULT_PATH) -> None:
+    little_endian = array("H", entries)
+    if sys.byteorder != "little":
+        little_endian.byteswap()
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "wb") as file:
+        file.write(HEADER.pack(MAGIC, FORMAT_VERSION, CELL_COUNT, len(entries)))
+        little_endian.tofile(file)
+
+
+class SolvedTable:
+    """O(1) lookup of the solved value and best moves of any reachable position."""
+
+    def __init__(self, entries: Sequence[int]) -> None:
+        if len(entries) != ENTRY_COUNT:
+            raise ValueError(f"Solved table must hold {ENTRY_COUNT} entries, got {len(entries)}")
+        self._entries = entries
+
+    @classmethod
+    def load(cls, path: str = DEFAULT_PATH) -> "SolvedTable":
+        """Memory-map a table written by write_table."""
+        with open(path, "rb") as file:
+            mapped = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, cell_count, entry_count = HEADER.unpack_from(mapped)
+        if magic != MAGIC or version != FORMAT_VERSION or cell_count != CELL_COUNT:
+            raise ValueError(f"{path} is not a version {FORMAT_VERSION} solved table")
+        if len(mapped) != HEADER.size + 2 * entry_count:
+            raise ValueError(f"{path} is truncated")
+        if sys.byteorder == "little":
+            entries = memoryview(mapped)[HEADER.size:].cast("H")
+        else:
+            entries = array("H", mapped[HEADER.size:])
+            entries.byteswap()
+        return cls(entries)
+
+    def lookup(self, game_state: GameState) -> SolvedPosition:
+        grid = game_state.grid
+        if len(grid.cells) != CELL_COUNT:
+            raise ValueError("The solved table only covers the 3x3 game")
+        entry = self._entries[table_index(grid.x_mask, grid.o_mask, game_state.current_mark)]
+        if not entry:
+            raise ValueError("Position is not reachable in a legal game")
+        return SolvedPosition(
+            value=(entry >> _VALUE_SHIFT) - 2,
+            best_moves=tuple(iter_bits(entry & _MOVES_MASK)),
+        )
+
+    def best_moves(self, game_state: GameState) -> tuple[int, ...]:
+        return self.lookup(game_state).best_moves
+
+
+_table: SolvedTable | None = None
+_table_lock = threading.Lock()
+
+
+def get_solved_table() -> SolvedTable:
+    """Return the process-wide table, loading the shipped file (or solving in memory) on first use."""
+    global _table
+    if _table is None:
+        with _table_lock:
+            if _table is None:
+                try:
+                    _table = SolvedTable.load()
+                except FileNotFoundError:
+                    _table = SolvedTable(solve())
+    return _table
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Solve every reachable position and write the table.")
+    parser.add_argument("--output", default=DEFAULT_PATH, help="where to write the table")
+    args = parser.parse_args()
+    entries = solve()
+    write_table(entries, args.output)
+    reachable = sum(1 for entry in entries if entry)
+    print(f"Wrote {reachable} solved positions ({HEADER.size + 2 * len(entries)} bytes) to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,123 @@
+"""
+Transposition table for minimax, keyed on positions reduced under the board's symmetries.
+
+A tic-tac-toe position scores the same after any of the 8 rotations/reflections of the
+square (the D4 group), so every position is stored under its canonical form: the smallest
+packed bitboard among its 8 images, together with the side to move and the maximizer.
+"""
+import threading
+from collections import OrderedDict
+from typing import Hashable
+
+from tic_tac_toe.logic.bitboard import CELL_COUNT, FULL_MASK
+from tic_tac_toe.logic.models import GameState, Mark
+
+SIDE = 3
+
+
+def _symmetry(transform) -> tuple[int, ...]:
+    """Return the cell permutation where cell i of the image comes from cell perm[i]."""
+    perm = [0] * CELL_COUNT
+    for row in range(SIDE):
+        for col in range(SIDE):
+            new_row, new_col = transform(row, col)
+            perm[new_row * SIDE + new_col] = row * SIDE + col
+    return tuple(perm)
+
+
+# the 8 rotations and reflections of the square, identity first
+SYMMETRIES: tuple[tuple[int, ...], ...] = tuple(
+    _symmetry(transform)
+    for transform in (
+        lambda r, c: (r, c),
+        lambda r, c: (c, SIDE - 1 - r),
+        lambda r, c: (SIDE - 1 - r, SIDE - 1 - c),
+        lambda r, c: (SIDE - 1 - c, r),
+        lambda r, c: (r, SIDE - 1 - c),
+        lambda r, c: (SIDE - 1 - r, c),
+        lambda r, c: (c, r),
+        lambda r, c: (SIDE - 1 - c, SIDE - 1 - r),
+    )
+)
+
+
+def _permute_mask(mask: int, perm: tuple[int, ...]) -> int:
+    return sum(1 << i for i, source in enumerate(perm) if mask >> source & 1)
+
+
+# _MASK_IMAGES[s][mask] is the image of a 9-bit mask under SYMMETRIES[s]
+_MASK_IMAGES: tuple[tuple[int, ...], ...] = tuple(
+    tuple(_permute_mask(mask, perm) for mask in range(FULL_MASK + 1))
+    for perm in SYMMETRIES
+)
+
+
+def canonical_masks(x_mask: int, o_mask: int) -> int:
+    """Pack the smallest (x_mask, o_mask) image under the 8 symmetries into one int."""
+    return min(images[x_mask] << CELL_COUNT | images[o_mask] for images in _MASK_IMAGES)
+
+
+def position_key(game_state: GameState, maximizer: Mark) -> tuple[int, Mark, Mark]:
+    """Transposition key of a position scored from the maximizer's point of view."""
+    grid = game_state.grid
+    if len(grid.cells) == CELL_COUNT:
+        board = canonical_masks(grid.x_mask, grid.o_mask)
+    else:
+        # larger boards are keyed as-is, with the win length so different rule sets never collide
+        board = (grid.x_mask << len(grid.cells) | grid.o_mask) * 16 + grid.win_length
+    return board, game_state.current_mark, maximizer
+
+
+class TranspositionTable:
+    """
+    Bounded, thread-safe score cache with least-recently-used eviction.
+
+    Keeps hit/miss/eviction counts so the benefit of sharing a table across calls can be measured.
+    """
+
+    def __init__(self, max_size: int = 100_000) -> None:
+        if max_size < 1:
+            raise ValueError("max_size must be at least 1")
+        self.max_size = max_size
+        self._entries: OrderedDict[Hashable, int] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: Hashable) -> int | None:
+        with self._lock:
+            score = self._entries.get(key)
+            if score is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+                self._entries.move_to_end(key)
+            return score
+
+    def put(self, key: Hashable, score: int) -> None:
+        with self._lock:
+            self._entries[key] = score
+            self._entries.move_to_end(key)
+            if len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.misses = self.evictions = 0
+
+    def stats(self) -> dict[str, int | float]:
+        lookups = self.hits + self.misses
+        return {
+            "size": len(self._entries),
+            "max_size": self.max_size,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+        }
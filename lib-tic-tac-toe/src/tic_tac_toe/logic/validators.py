@@ -3,17 +3,42 @@ from __future__ import annotations
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
-    from tic_tac_toe.game.players import Player
+    from tic_tac_toe.game.players import AsyncPlayer, Player
     from tic_tac_toe.logic.models import GameState, Grid, Mark
 
+import math
 import re
 
 from tic_tac_toe.logic.exceptions import InvalidGameState
 
+MIN_GRID_SIZE = 3
+MAX_GRID_SIZE = 15
+
 
 def validate_grid(grid: Grid) -> None:
-    if not re.match(r"^[\sXO]{9}$", grid.cells):
-        raise ValueError("Must contain 9 cells of: X, O, or space")
+    size = math.isqrt(len(grid.cells))
+    if (
+        not re.match(r"^[ XO]+$", grid.cells)
+        or size * size != len(grid.cells)
+        or not MIN_GRID_SIZE <= size <= MAX_GRID_SIZE
+    ):
+        raise ValueError(
+            f"Must contain N*N cells (N from {MIN_GRID_SIZE} to {MAX_GRID_SIZE}) of: X, O, or space"
+        )
+    if grid.win_length is not None and not MIN_GRID_SIZE <= grid.win_length <= size:
+        raise ValueError(f"Win length must be from {MIN_GRID_SIZE} to {size}")
+
+
+def validate_board_size(size: int, win_length: int | None = None) -> None:
+    """Check a requested board size and win length, e.g. from an API request, before use."""
+    if not _is_int(size) or not MIN_GRID_SIZE <= size <= MAX_GRID_SIZE:
+        raise ValueError(f"Board size must be an integer from {MIN_GRID_SIZE} to {MAX_GRID_SIZE}")
+    if win_length is not None and (not _is_int(win_length) or not MIN_GRID_SIZE <= win_length <= size):
+        raise ValueError(f"Win length must be an integer from {MIN_GRID_SIZE} to {size}")
+
+
+def _is_int(value: object) -> bool:
+    return isinstance(value, int) and not isinstance(value, bool)
 
 
 def validate_game_state(game_state: GameState) -> None:
@@ -57,6 +82,6 @@ def validate_winner(
                 raise InvalidGameState("Wrong number of Os")
 
 
-def validate_players(player1: Player, player2: Player) -> None:
+def validate_players(player1: Player | AsyncPlayer, player2: Player | AsyncPlayer) -> None:
     if player1.mark is player2.mark:
         raise ValueError("Players must use different marks")
@@ -0,0 +1,20 @@
+import pytest
+
+from tic_tac_toe.logic.models import GameState, Grid, Mark
+
+
+@pytest.fixture(scope="session")
+def reachable_states() -> list[GameState]:
+    """Every 3x3 position reachable from the empty board, with either mark starting."""
+    states, seen = [], set()
+    for starting_mark in Mark:
+        pending = [GameState(Grid(), starting_mark)]
+        while pending:
+            state = pending.pop()
+            key = (state.grid.cells, state.starting_mark)
+            if key in seen:
+                continue
+            seen.add(key)
+            states.append(state)
+            pending.extend(move.after_state for move in state.iter_moves())
+    return states
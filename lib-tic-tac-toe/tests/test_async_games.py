@@ -0,0 +1,56 @@
+import asyncio
+
+import pytest
+
+from tic_tac_toe.game.engine import AsyncTicTacToe
+from tic_tac_toe.game.players import AsyncComputerPlayer, RandomComputerPlayer, SolvedTablePlayer, SyncPlayerAdapter
+from tic_tac_toe.game.renderers import Renderer
+from tic_tac_toe.logic.models import GameState, Grid, Mark, Move
+
+
+class NullRenderer(Renderer):
+    def render(self, game_state: GameState) -> None:
+        pass
+
+
+class SlowAsyncPlayer(AsyncComputerPlayer):
+    async def get_computer_move(self, game_state: GameState) -> Move | None:
+        await asyncio.sleep(10)
+        return game_state.make_random_move()
+
+
+def test_async_games_run_concurrently():
+    async def play_games():
+        games = [
+            AsyncTicTacToe(
+                RandomComputerPlayer(Mark.CROSS, delay_seconds=0.05),
+                SolvedTablePlayer(Mark.NAUGHT, delay_seconds=0.05),
+                NullRenderer(),
+            )
+            for _ in range(20)
+        ]
+        return await asyncio.gather(*(game.play() for game in games))
+
+    final_states = asyncio.run(play_games())
+    assert all(state.game_over for state in final_states)
+    assert all(state.winner is not Mark.CROSS for state in final_states)
+
+
+def test_sync_players_are_wrapped_once():
+    game = AsyncTicTacToe(
+        RandomComputerPlayer(Mark.CROSS), RandomComputerPlayer(Mark.NAUGHT), NullRenderer())
+    state = GameState(Grid())
+    player = game.get_current_player(state)
+    assert isinstance(player, SyncPlayerAdapter)
+    assert game.get_current_player(state) is player
+
+
+def test_a_slow_async_player_times_out():
+    game = AsyncTicTacToe(
+        SlowAsyncPlayer(Mark.CROSS, delay_seconds=0),
+        RandomComputerPlayer(Mark.NAUGHT),
+        NullRenderer(),
+        move_timeout=0.05,
+    )
+    with pytest.raises(TimeoutError):
+        asyncio.run(game.play())
@@ -0,0 +1,21 @@
+import pytest
+
+from tic_tac_toe.game.game_service import GameService
+from tic_tac_toe.logic.models import GameState, Grid
+
+
+def test_computer_moves_in_bulk_report_errors_per_position():
+    service = GameService()
+    states = [
+        GameState(Grid()),
+        GameState(Grid("XXXOO    ")),
+        GameState(Grid("XX OO    ")),
+        GameState(Grid("XO       ")),
+    ]
+    results = service.make_computer_moves(states, "solved")
+    assert results[0].grid.x_count == 1
+    assert isinstance(results[1], ValueError)
+    assert results[2].winner is not None
+    assert results[3].grid.x_count == 2
+    with pytest.raises(ValueError):
+        service.make_computer_moves(states, "human")
@@ -0,0 +1,27 @@
+from tic_tac_toe.logic.models import WINNING_PATTERNS, Grid, Mark
+
+
+def naive_winner(cells: str) -> Mark | None:
+    for pattern in WINNING_PATTERNS:
+        line = {cells[i] for i, char in enumerate(pattern) if char == "?"}
+        if len(line) == 1 and line != {" "}:
+            return Mark(line.pop())
+    return None
+
+
+def test_bitboard_winner_matches_the_winning_patterns(reachable_states):
+    for state in reachable_states:
+        winner = naive_winner(state.grid.cells)
+        assert state.winner is winner
+        if winner is not None:
+            assert all(state.grid.cells[i] == winner for i in state.winning_cells)
+            assert len(state.winning_cells) == 3
+        else:
+            assert state.winning_cells == []
+
+
+def test_grid_masks_and_counts():
+    grid = Grid("XO X  O X")
+    assert grid.x_mask == 0b100001001
+    assert grid.o_mask == 0b001000010
+    assert (grid.x_count, grid.o_count, grid.empty_count) == (3, 2, 4)
@@ -0,0 +1,27 @@
+import pytest
+
+from tic_tac_toe.logic.engines import create_engine
+from tic_tac_toe.logic.minimax import find_best_move
+from tic_tac_toe.logic.models import GameState, Grid
+from tic_tac_toe.logic.solved_table import get_solved_table
+from tic_tac_toe.logic.transposition import TranspositionTable
+
+
+@pytest.mark.parametrize("engine_name", ["minimax", "alphabeta"])
+def test_engines_play_a_solved_best_move_everywhere(engine_name, reachable_states):
+    table = get_solved_table()
+    engine = create_engine(engine_name, TranspositionTable())
+    for state in reachable_states:
+        if state.game_over:
+            assert engine.find_best_move(state) is None
+            continue
+        move = engine.find_best_move(state)
+        assert move.cell_index in table.best_moves(state), state.grid.cells
+
+
+def test_find_best_move_accepts_an_engine_name():
+    state = GameState(Grid("XX OO    "))
+    assert find_best_move(state, engine="alphabeta").cell_index == 2
+    assert find_best_move(state).cell_index == 2
+    with pytest.raises(ValueError):
+        find_best_move(state, engine="nope")
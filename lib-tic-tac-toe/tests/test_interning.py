@@ -0,0 +1,12 @@
+from tic_tac_toe.logic.models import GameState, Grid, Mark
+
+
+def test_positions_are_interned():
+    state = GameState.intern(Grid(), Mark.CROSS)
+    assert GameState.intern(Grid(), Mark.CROSS) is state
+    assert GameState.intern(Grid(), Mark.NAUGHT) is not state
+    assert state.make_move_to(4).after_state is state.make_move_to(4).after_state
+    # the same position reached in another order is the same object
+    via_0 = state.make_move_to(0).after_state.make_move_to(4).after_state.make_move_to(8).after_state
+    via_8 = state.make_move_to(8).after_state.make_move_to(4).after_state.make_move_to(0).after_state
+    assert via_0 is via_8
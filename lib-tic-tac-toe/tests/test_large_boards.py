@@ -0,0 +1,52 @@
+import time
+
+import pytest
+
+from tic_tac_toe.logic.engines import IterativeDeepeningEngine, create_engine
+from tic_tac_toe.logic.models import GameState, Grid, Mark
+from tic_tac_toe.logic.transposition import TranspositionTable
+from tic_tac_toe.logic.validators import validate_board_size
+
+
+def test_larger_board_with_shorter_win_length():
+    grid = Grid.empty(5, 4)
+    assert grid.size == 5 and grid.win_length == 4
+    state = GameState(Grid("XXXX OOO" + " " * 17, 4))
+    assert state.winner is Mark.CROSS
+    assert state.winning_cells == [0, 1, 2, 3]
+
+
+@pytest.mark.parametrize("size, win_length", [(2, None), (16, None), ("3", None), (True, None), (4, 5), (4, 2)])
+def test_invalid_board_sizes_are_rejected(size, win_length):
+    with pytest.raises(ValueError):
+        validate_board_size(size, win_length)
+    with pytest.raises(ValueError):
+        Grid.empty(size, win_length)
+
+
+def test_iterative_deepening_wins_and_blocks_on_4x4():
+    engine = IterativeDeepeningEngine(time_budget=0.5)
+    win = GameState(Grid("XXX OOO" + " " * 9, 4))
+    assert engine.find_best_move(win).cell_index == 3
+    assert engine.depth_reached >= 1
+    block = GameState(Grid("XXX OO" + " " * 10, 4))
+    assert block.current_mark is Mark.NAUGHT
+    assert engine.find_best_move(block).cell_index == 3
+
+
+def test_iterative_deepening_keeps_to_its_time_budget():
+    engine = IterativeDeepeningEngine(time_budget=0.1)
+    state = GameState(Grid.empty(7, 5))
+    started = time.perf_counter()
+    move = engine.find_best_move(state)
+    assert time.perf_counter() - started < 1.0
+    assert move is not None and engine.depth_reached >= 1
+
+
+def test_iterative_deepening_starts_every_search_afresh():
+    opening = GameState(Grid.empty(4))
+    fresh = IterativeDeepeningEngine(time_budget=10, max_depth=3).find_best_move(opening)
+    engine = IterativeDeepeningEngine(time_budget=10, max_depth=3)
+    engine.find_best_move(GameState(Grid("XX   O" + " " * 19, 4)))
+    assert engine.find_best_move(opening).cell_index == fresh.cell_index
+    assert create_engine("deepening", TranspositionTable(), time_budget=0.1).table is None
@@ -0,0 +1,20 @@
+import gc
+
+from tic_tac_toe.logic.models import GameState, Grid
+
+
+def test_moves_do_not_keep_their_parent_alive():
+    # built directly, so it is not held by the intern cache
+    state = GameState(Grid("X   O    "))
+    move = state.make_move_to(8)
+    assert move.before_state is state
+    del state
+    gc.collect()
+    assert move.before_state is None
+    assert move.after_state.grid.cells == "X   O   X"
+
+
+def test_states_have_no_instance_dict():
+    state = GameState(Grid())
+    assert not hasattr(state, "__dict__")
+    assert not hasattr(state.grid, "__dict__")
@@ -0,0 +1,14 @@
+import inspect
+
+from tic_tac_toe.logic.models import GameState, Grid, Mark
+
+
+def test_moves_are_generated_lazily():
+    state = GameState(Grid(), Mark.CROSS)
+    moves = state.iter_moves()
+    assert inspect.isgenerator(moves)
+    first = next(moves)
+    assert first.cell_index == 0
+    assert first.after_state.grid.cells == "X" + " " * 8
+    assert state.possible_move_indices == tuple(range(9))
+    assert [move.cell_index for move in state.possible_moves] == list(range(9))
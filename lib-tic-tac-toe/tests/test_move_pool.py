@@ -0,0 +1,121 @@
+import asyncio
+import threading
+import time
+
+import pytest
+
+from tic_tac_toe.game.game_service import GameService
+from tic_tac_toe.game.move_pool import ComputerMovePool, MovePoolBusy
+from tic_tac_toe.logic.models import GameState, Grid
+
+
+class ConcurrencyProbe:
+    """A blocking move function that records how many of its calls overlap."""
+
+    def __init__(self, seconds: float = 0.05) -> None:
+        self.seconds = seconds
+        self.running = 0
+        self.peak = 0
+        self._lock = threading.Lock()
+
+    def __call__(self, value):
+        with self._lock:
+            self.running += 1
+            self.peak = max(self.peak, self.running)
+        time.sleep(self.seconds)
+        with self._lock:
+            self.running -= 1
+        return value
+
+
+def fail(message: str):
+    raise ValueError(message)
+
+
+def run_pool(pool: ComputerMovePool, coroutine):
+    try:
+        return asyncio.run(coroutine)
+    finally:
+        pool.shutdown()
+
+
+def test_per_type_limits():
+    pool = ComputerMovePool(workers=4, limits={"alphazero": 1})
+    slow, fast = ConcurrencyProbe(), ConcurrencyProbe()
+
+    async def main():
+        return await asyncio.gather(
+            *(pool.run("alphazero", slow, i) for i in range(4)),
+            *(pool.run("minimax", fast, i) for i in range(4)),
+        )
+
+    assert run_pool(pool, main()) == [0, 1, 2, 3] * 2
+    assert slow.peak == 1
+    assert fast.peak > 1
+    stats = pool.stats()["player_types"]
+    assert stats["alphazero"]["limit"] == 1 and stats["alphazero"]["completed"] == 4
+    assert stats["alphazero"]["peak_queued"] == 3
+
+
+def test_a_full_queue_rejects_moves():
+    pool = ComputerMovePool(workers=1, max_queue=1)
+
+    async def main():
+        probe = ConcurrencyProbe(0.1)
+        return await asyncio.gather(*(pool.run("minimax", probe, i) for i in range(3)), return_exceptions=True)
+
+    results = run_pool(pool, main())
+    assert results[:2] == [0, 1]
+    assert isinstance(results[2], MovePoolBusy)
+    assert pool.stats()["player_types"]["minimax"]["rejected"] == 1
+
+
+def test_failed_moves_are_not_counted_as_completed():
+    pool = ComputerMovePool(workers=1)
+
+    async def main():
+        with pytest.raises(ValueError, match="no move"):
+            await pool.run("minimax", fail, "no move")
+        return await pool.run("minimax", ConcurrencyProbe(0), "moved")
+
+    assert run_pool(pool, main()) == "moved"
+    stats = pool.stats()["player_types"]["minimax"]
+    assert (stats["completed"], stats["failed"], stats["running"]) == (1, 1, 0)
+
+
+def test_process_pool_runs_moves_in_other_processes():
+    pool = ComputerMovePool(workers=2, kind="process")
+
+    async def main():
+        return await asyncio.gather(*(pool.run("minimax", pow, 2, n) for n in range(4)))
+
+    assert run_pool(pool, main()) == [1, 2, 4, 8]
+
+
+def test_invalid_pool_settings_are_rejected():
+    with pytest.raises(ValueError):
+        ComputerMovePool(kind="fiber")
+    with pytest.raises(ValueError):
+        ComputerMovePool(workers=0)
+    with pytest.raises(ValueError):
+        ComputerMovePool(limits={"minimax": 0})
+
+
+def test_computer_moves_in_a_process_pool():
+    service = GameService()
+    pool = ComputerMovePool(workers=2, kind="process")
+    state = GameState(Grid("XX OO    "))
+
+    async def main():
+        return await asyncio.gather(
+            pool.run("solved", service.make_computer_move, state, "solved", None),
+            pool.run("minimax", service.make_computer_move, state, "minimax", None),
+            pool.run("random", service.make_computer_move, GameState(Grid()), "random", None),
+        )
+
+    try:
+        solved, minimax, opening = asyncio.run(main())
+    finally:
+        pool.shutdown()
+    assert solved.winner is not None and minimax.winner is not None
+    assert opening.grid.x_count == 1
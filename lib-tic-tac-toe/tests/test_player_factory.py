@@ -0,0 +1,65 @@
+import os
+import subprocess
+import sys
+
+import pytest
+
+import tic_tac_toe
+from tic_tac_toe.game.game_service import GameService
+from tic_tac_toe.game.player_factory import DIFFICULTY_PRESETS, PlayerFactory
+from tic_tac_toe.game.players import MinimaxComputerPlayer, RandomComputerPlayer, SolvedTablePlayer
+from tic_tac_toe.logic.models import GameState, Grid, Mark
+
+
+def test_difficulty_sets_the_time_budget_of_searching_players():
+    for difficulty, time_budget in DIFFICULTY_PRESETS.items():
+        player = PlayerFactory.create_player("minimax", Mark.CROSS, difficulty=difficulty)
+        assert isinstance(player, MinimaxComputerPlayer)
+        assert player.time_budget == time_budget
+    assert isinstance(PlayerFactory.create_player("solved", Mark.CROSS, difficulty="easy"), SolvedTablePlayer)
+    with pytest.raises(ValueError, match="Unknown difficulty"):
+        PlayerFactory.create_player("minimax", Mark.CROSS, difficulty="impossible")
+
+
+class CountingPlayer(RandomComputerPlayer):
+    """Reports a search of 7 simulations for every move, like the AlphaZero players."""
+
+    def get_computer_move(self, game_state):
+        self.last_simulations = 7
+        return super().get_computer_move(game_state)
+
+
+def test_search_simulations_are_recorded_per_player_type(monkeypatch):
+    monkeypatch.setitem(PlayerFactory._player_types, "counting", CountingPlayer)
+    service = GameService()
+    state, simulations = service.search_computer_move(GameState(Grid()), "counting")
+    assert state.grid.x_count == 1 and simulations == 7
+    assert service.search_computer_move(state, "random")[1] is None
+    service.record_search("counting", simulations)
+    service.record_search("counting", 3)
+    service.record_search("random", None)
+    assert service.get_search_stats() == {
+        "counting": {"moves": 2, "simulations": 10, "last_simulations": 3, "mean_simulations": 5.0},
+    }
+
+
+def test_player_factory_imports_no_ai_dependencies():
+    code = (
+        "import sys, tic_tac_toe.game.player_factory as factory\n"
+        "factory.PlayerFactory.get_available_types()\n"
+        "print(','.join(m for m in ('numpy', 'tic_tac_toe_ai', 'pyspiel', 'tensorflow') if m in sys.modules))\n"
+    )
+    env = dict(os.environ, PYTHONPATH=os.path.dirname(tic_tac_toe.__path__[0]))
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True, env=env)
+    assert result.stdout.strip() == ""
+
+
+def test_lazy_player_types_are_imported_on_first_use(monkeypatch):
+    monkeypatch.setitem(PlayerFactory._player_types, "lazy", "tic_tac_toe.game.players:RandomComputerPlayer")
+    monkeypatch.setitem(PlayerFactory._player_types, "missing", "no_such_package.players:Player")
+    available = PlayerFactory.get_available_types()
+    assert "lazy" in available and "missing" not in available
+    assert isinstance(PlayerFactory.create_player("lazy", Mark.CROSS), RandomComputerPlayer)
+    assert PlayerFactory._player_types["lazy"] is RandomComputerPlayer
+    with pytest.raises(ValueError, match="not available"):
+        PlayerFactory.create_player("missing", Mark.CROSS)
@@ -0,0 +1,16 @@
+import json
+
+from tic_tac_toe.api.serializers import RESPONSE_CACHE, GameStateSerializer
+from tic_tac_toe.logic.models import GameState, Grid, Mark
+
+
+def test_response_json_is_built_once_per_position():
+    state = GameState.intern(Grid("XO X     "), Mark.CROSS)
+    body = GameStateSerializer.to_response_json(state)
+    assert json.loads(body) == {
+        "game_state": GameStateSerializer.to_dict(state),
+        "encoded_state": GameStateSerializer.encode(state),
+    }
+    hits = RESPONSE_CACHE.hits
+    assert GameStateSerializer.to_response_json(state) is body
+    assert RESPONSE_CACHE.hits == hits + 1
@@ -0,0 +1,87 @@
+import time
+
+import pytest
+
+from tic_tac_toe.game.game_service import GameService
+from tic_tac_toe.game.session_store import (
+    MemorySessionStore,
+    SessionConflict,
+    SQLiteSessionStore,
+    create_session_store,
+)
+from tic_tac_toe.logic.models import GameState, Grid
+
+EMPTY = GameState(Grid())
+FIRST_MOVE = EMPTY.make_move_to(4).after_state
+SECOND_MOVE = FIRST_MOVE.make_move_to(0).after_state
+
+
+def test_least_recently_used_games_are_evicted():
+    store = MemorySessionStore(max_sessions=2)
+    store.put("a", EMPTY)
+    store.put("b", EMPTY)
+    assert store.get("a") == EMPTY
+    store.put("c", EMPTY)
+    assert store.get("b") is None
+    assert store.get("a") == EMPTY and store.get("c") == EMPTY
+    stats = store.stats()
+    assert (stats["size"], stats["hits"], stats["misses"], stats["evictions"]) == (2, 3, 1, 1)
+
+
+def test_idle_games_expire():
+    store = MemorySessionStore(ttl_seconds=0.05)
+    store.put("a", EMPTY)
+    time.sleep(0.1)
+    assert store.get("a") is None
+    assert len(store) == 0
+
+
+def test_a_move_in_a_changed_game_conflicts():
+    store = MemorySessionStore()
+    store.put("a", EMPTY)
+    store.put("a", FIRST_MOVE, expected=EMPTY)
+    with pytest.raises(SessionConflict):
+        store.put("a", FIRST_MOVE, expected=EMPTY)
+    assert store.get("a") == FIRST_MOVE
+    stats = store.stats()
+    assert (stats["conflicts"], stats["hits"]) == (1, 1)
+
+
+def test_sqlite_games_survive_a_restart(tmp_path):
+    path = str(tmp_path / "sessions.db")
+    store = create_session_store(path)
+    assert isinstance(store, SQLiteSessionStore)
+    store.put("a", EMPTY)
+    store.put("a", FIRST_MOVE, expected=EMPTY)
+    store.put("b", SECOND_MOVE)
+    store.close()
+    assert store.stats()["pending_writes"] == 0
+
+    reopened = SQLiteSessionStore(path)
+    try:
+        # games only on disk are checked against their stored state, without counting a lookup
+        third_move = SECOND_MOVE.make_move_to(8).after_state
+        reopened.put("b", third_move, expected=SECOND_MOVE)
+        with pytest.raises(SessionConflict):
+            reopened.put("a", SECOND_MOVE, expected=EMPTY)
+        assert reopened.get("a") == FIRST_MOVE
+        assert reopened.get("b") == third_move
+        assert reopened.get("c") is None
+        stats = reopened.stats()
+        assert (stats["loads"], stats["hits"], stats["misses"], stats["conflicts"]) == (1, 1, 1, 1)
+    finally:
+        reopened.close()
+
+
+def test_memory_store_without_a_path():
+    assert type(create_session_store(None)) is MemorySessionStore
+
+
+def test_stored_games():
+    service = GameService()
+    game_id = service.create_game(service.create_initial_game_state(4))
+    state = service.make_move(service.load_game(game_id), 5)
+    service.save_game(game_id, state, expected=service.create_initial_game_state(4))
+    assert service.load_game(game_id) == state
+    with pytest.raises(ValueError, match="Unknown or expired"):
+        service.load_game("nope")
@@ -0,0 +1,32 @@
+import pytest
+
+from tic_tac_toe.game.players import SolvedTablePlayer
+from tic_tac_toe.logic.models import GameState, Grid, Mark
+from tic_tac_toe.logic.solved_table import ENTRY_COUNT, SolvedPosition, SolvedTable, get_solved_table, solve
+
+
+def test_shipped_solved_table_matches_a_fresh_solve():
+    assert list(get_solved_table()._entries) == list(solve())
+
+
+def test_solved_table_values():
+    table = SolvedTable(solve())
+    assert len(table._entries) == ENTRY_COUNT
+    empty = table.lookup(GameState(Grid()))
+    assert empty.value == 0
+    assert empty.best_moves == tuple(range(9))
+    # X to move completes the top row
+    assert table.lookup(GameState(Grid("XX OO    "))).best_moves == (2,)
+    # O to move has already lost
+    assert table.lookup(GameState(Grid("XXXOO    "))) == SolvedPosition(-1, ())
+    with pytest.raises(ValueError):
+        table.lookup(GameState(Grid.empty(4)))
+
+
+def test_solved_players_always_draw():
+    for _ in range(5):
+        state = GameState(Grid())
+        players = {mark: SolvedTablePlayer(mark, delay_seconds=0) for mark in Mark}
+        while not state.game_over:
+            state = players[state.current_mark].make_move(state)
+        assert state.tie
@@ -0,0 +1,42 @@
+import pytest
+
+from tic_tac_toe.api import state_codec
+from tic_tac_toe.api.serializers import GameStateSerializer
+from tic_tac_toe.logic.models import GameState, Grid, Mark
+
+
+def test_every_reachable_state_round_trips(reachable_states):
+    for state in reachable_states:
+        encoded = GameStateSerializer.encode(state)
+        assert len(encoded) == 4
+        assert not state_codec.is_legacy(encoded)
+        decoded = GameStateSerializer.decode(encoded)
+        assert decoded == state
+        # decoded 3x3 states are the shared interned ones
+        assert decoded is GameState.intern(state.grid, state.starting_mark)
+
+
+@pytest.mark.parametrize("size, win_length", [(4, 3), (5, 4), (15, 5)])
+def test_larger_boards_round_trip(size, win_length):
+    cells = [" "] * (size * size)
+    for index in (0, size + 2, size * size - 1):
+        cells[index] = "X"
+    for index in (1, size):
+        cells[index] = "O"
+    state = GameState(Grid("".join(cells), win_length))
+    decoded = GameStateSerializer.decode(GameStateSerializer.encode(state))
+    assert decoded == state
+    assert decoded.grid.win_length == win_length
+
+
+def test_legacy_encoding_is_still_decoded():
+    state = GameState(Grid("X   O    "), Mark.CROSS)
+    legacy = GameStateSerializer.encode_legacy(state)
+    assert state_codec.is_legacy(legacy)
+    assert GameStateSerializer.decode(legacy) == state
+
+
+@pytest.mark.parametrize("encoded", ["", "!!!!", "AAAA", "EAAAAA", "EP____"])
+def test_malformed_states_raise_value_error(encoded):
+    with pytest.raises(ValueError):
+        GameStateSerializer.decode(encoded)
@@ -0,0 +1,25 @@
+from tic_tac_toe.logic.models import GameState, Grid, Mark
+from tic_tac_toe.logic.transposition import SYMMETRIES, TranspositionTable, canonical_masks, position_key
+
+
+def test_symmetric_positions_share_a_transposition_key():
+    state = GameState(Grid("XO  X   O"))
+    keys = set()
+    for perm in SYMMETRIES:
+        image = GameState(Grid("".join(state.grid.cells[source] for source in perm)))
+        keys.add(position_key(image, Mark.CROSS))
+    assert len(keys) == 1
+    assert position_key(state, Mark.CROSS) != position_key(state, Mark.NAUGHT)
+    assert canonical_masks(0b1, 0) == canonical_masks(0b100, 0) == canonical_masks(0b100000000, 0)
+
+
+def test_transposition_table_evicts_least_recently_used():
+    table = TranspositionTable(max_size=2)
+    table.put("a", 1)
+    table.put("b", 0)
+    assert table.get("a") == 1
+    table.put("c", -1)
+    assert table.get("b") is None
+    assert (table.get("a"), table.get("c")) == (1, -1)
+    stats = table.stats()
+    assert (stats["size"], stats["hits"], stats["misses"], stats["evictions"]) == (2, 3, 1, 1)
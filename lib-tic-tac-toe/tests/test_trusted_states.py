@@ -0,0 +1,22 @@
+import pytest
+
+from tic_tac_toe.logic.exceptions import InvalidMove
+from tic_tac_toe.logic.models import GameState, Grid
+
+
+def test_derived_states_equal_validated_ones(reachable_states):
+    for state in reachable_states[:500]:
+        for move in state.iter_moves():
+            after = move.after_state
+            validated = GameState(Grid(after.grid.cells), state.starting_mark)
+            assert after == validated
+            assert (after.grid.x_mask, after.grid.o_mask) == (validated.grid.x_mask, validated.grid.o_mask)
+            assert after.current_mark is validated.current_mark
+
+
+def test_illegal_moves_are_still_rejected():
+    state = GameState(Grid("XXXOO    "))
+    with pytest.raises(InvalidMove):
+        state.make_move_to(0)
+    with pytest.raises(InvalidMove):
+        state.make_move_to(5)
@@ -0,0 +1,11 @@
+from tic_tac_toe.game.game_service import GameService
+from tic_tac_toe.game.player_factory import PlayerFactory
+
+
+def test_warm_up_reports_each_player_type(monkeypatch):
+    monkeypatch.setitem(PlayerFactory._player_types, "broken", "no_such_package.players:Player")
+    engines = GameService().warm_up(["random", "solved", "broken"])
+    assert engines["api_responses"]["status"] == "ready"
+    assert engines["random"]["status"] == engines["solved"]["status"] == "ready"
+    assert engines["broken"]["status"] == "failed"
+    assert "not available" in engines["broken"]["error"]